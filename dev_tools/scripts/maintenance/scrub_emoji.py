@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Replace emoji with ASCII markers in source files (Windows console compatibility)
+
+Replaces remove_all_emoji.py and fix_all_docling_emoji.py: one replacement
+table, one pipeline, target files given on the command line.
+
+Usage (from the repository root):
+    python dev_tools/scripts/maintenance/scrub_emoji.py                # default targets
+    python dev_tools/scripts/maintenance/scrub_emoji.py 'rag_indexer/**/*.py' other.py
+"""
+
+import argparse
+import glob
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPLACEMENTS = {
+    '→': '->',
+    '✅': '[+]',
+    '❌': '[-]',
+    '⚠️': '[!]',
+    '🚀': '[*]',
+    '📄': '[*]',
+    '🧩': '[*]',
+    '🔗': '[*]',
+    '🔧': '[*]',
+    '📊': '[*]',
+    '🎉': '[*]',
+    '✓': '[+]',
+    '📝': '[*]',
+    '⏱️': '[*]',
+    '🔍': '[*]',
+    '💡': '[*]',
+    '💾': '[*]',
+    '📂': '[*]',
+    '🚫': '[*]',
+    '📁': '[*]',
+    '📋': '[*]',
+    '❓': '[?]',
+    '🏷️': '[*]',
+    '🗑️': '[*]',
+    '🔄': '[*]',
+    '📈': '[*]',
+    '📉': '[*]',
+    '📌': '[*]',
+    '✗': '[-]',
+    '⚡': '[*]',
+    '🎯': '[*]',
+    '🔎': '[*]',
+    '⏰': '[*]',
+    '📑': '[*]',
+}
+
+# Files scrubbed when no paths are given: the targets of the two old scripts
+DEFAULT_TARGETS = [
+    'rag_indexer/chunking_vectors/analysis_helpers.py',
+    'rag_indexer/chunking_vectors/batch_processor.py',
+    'rag_indexer/chunking_vectors/chunk_helpers.py',
+    'rag_indexer/chunking_vectors/chunk_helpers_hybrid.py',
+    'rag_indexer/chunking_vectors/config.py',
+    'rag_indexer/chunking_vectors/file_utils_core.py',
+    'rag_indexer/chunking_vectors/hybrid_chunker.py',
+    'rag_indexer/chunking_vectors/incremental_indexer.py',
+    'rag_indexer/chunking_vectors/loading_helpers.py',
+    'rag_indexer/chunking_vectors/RegistryManager.py',
+    'rag_indexer/chunking_vectors/registry_manager.py',
+    'rag_indexer/chunking_vectors/__init__.py',
+    'rag_indexer/docling_processor/*.py',
+]
+
+
+class _CompiledTable:
+    """Replacement table split for a single str.translate pass"""
+
+    def __init__(self, table):
+        # Single-codepoint emoji go through one str.translate pass; the few
+        # multi-codepoint ones (emoji + variation selector) are replaced first
+        self.trans = str.maketrans({k: v for k, v in table.items() if len(k) == 1})
+        self.multi = {k: v for k, v in table.items() if len(k) > 1}
+        # UTF-8 lead bytes of every emoji; a file containing none of them
+        # cannot need any replacement
+        self.lead_bytes = sorted({k.encode('utf-8')[:1] for k in table})
+
+    def apply(self, content):
+        for emoji, replacement in self.multi.items():
+            content = content.replace(emoji, replacement)
+        return content.translate(self.trans)
+
+
+_DEFAULT_TABLE = _CompiledTable(REPLACEMENTS)
+
+
+def scrub_file(file_path, compiled=_DEFAULT_TABLE):
+    """
+    Replace emoji in one file.
+
+    Returns:
+        str: 'fixed', 'unchanged', 'missing' or 'error: <message>'
+    """
+    if not Path(file_path).exists():
+        return 'missing'
+
+    try:
+        with open(file_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return 'unchanged'
+
+            # Scan the mapping for emoji lead bytes before copying/decoding
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if all(mm.find(lead) == -1 for lead in compiled.lead_bytes):
+                    return 'unchanged'
+                content = mm[:].decode('utf-8')
+
+        new_content = compiled.apply(content)
+
+        if new_content == content:
+            return 'unchanged'
+
+        Path(file_path).write_bytes(new_content.encode('utf-8'))
+        return 'fixed'
+    except Exception as e:
+        return f"error: {e}"
+
+
+def expand_paths(patterns):
+    """Expand glob patterns (plain paths are kept even if missing)"""
+    paths = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            paths.append(pattern)
+    return paths
+
+
+def scrub(paths, table=None, verbose=True):
+    """
+    Replace emoji in the given files.
+
+    Args:
+        paths: File paths to process
+        table: Emoji -> replacement mapping (default: REPLACEMENTS)
+        verbose: Print one line per file
+
+    Returns:
+        int: Number of files changed
+    """
+    compiled = _DEFAULT_TABLE if table is None else _CompiledTable(table)
+    paths = list(paths)
+    if not paths:
+        return 0
+
+    # Files are independent and the work is mostly I/O: threads avoid
+    # spawning interpreters; results are reported in order afterwards
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        results = list(executor.map(lambda p: scrub_file(p, compiled), paths))
+
+    total_fixed = 0
+    for file_path, status in zip(paths, results):
+        if status == 'fixed':
+            total_fixed += 1
+        if not verbose:
+            continue
+        if status == 'missing':
+            print(f"Skipping {file_path} (not found)")
+        elif status == 'fixed':
+            print(f"Fixed: {file_path}")
+        elif status == 'unchanged':
+            print(f"No changes: {file_path}")
+        else:
+            print(f"ERROR processing {file_path}: {status[len('error: '):]}")
+
+    return total_fixed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replace emoji with ASCII markers in source files')
+    parser.add_argument('paths', nargs='*', default=DEFAULT_TARGETS,
+                        help='Files or glob patterns (default: the files the old emoji scripts fixed)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Only print the summary')
+    args = parser.parse_args()
+
+    paths = expand_paths(args.paths)
+    total_fixed = scrub(paths, verbose=not args.quiet)
+
+    print(f"\nTotal files fixed: {total_fixed}/{len(paths)}")
+    print(f"Emoji types replaced: {len(REPLACEMENTS)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -243,11 +243,12 @@ def check_processing_requirements(config):
         from .markdown_loader import scan_markdown_files
         scan_results = scan_markdown_files(config.DOCUMENTS_DIR, recursive=True)
         
-        # Filter out files from _metadata directory
-        metadata_dir_name = '_metadata'
+        # Filter out files from _metadata directory (substring match on the
+        # str(Path) paths, avoids building a Path per file)
+        metadata_dir_marker = os.sep + '_metadata' + os.sep
         actual_markdown_files = [
             f for f in scan_results.get('files', [])
-            if metadata_dir_name not in Path(f['path']).parts
+            if metadata_dir_marker not in f['path']
         ]
         actual_count = len(actual_markdown_files)
         
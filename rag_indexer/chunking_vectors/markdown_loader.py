@@ -100,6 +100,19 @@ class MarkdownLoader:
         self.loading_stats['markdown_files_found'] = len(markdown_files)
         return markdown_files
 
+    def _select_markdown_files(self, file_paths: List[str]) -> List[str]:
+        """Use an explicit list of markdown files instead of scanning, respecting blacklists."""
+        markdown_files = []
+        
+        for file_path in file_paths:
+            self.loading_stats['total_files_scanned'] += 1
+            path = Path(file_path)
+            if path.suffix == '.md' and path.is_file() and not self._is_blacklisted(path):
+                markdown_files.append(str(path))
+        
+        self.loading_stats['markdown_files_found'] = len(markdown_files)
+        return markdown_files
+
     def _read_markdown_file(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
         """Read a single markdown file with encoding fallbacks."""
         try:
@@ -405,13 +418,15 @@ class MarkdownLoader:
             except Exception as cleanup_err:
                 logger.warning(f"     Cleanup failed: {cleanup_err}")
 
-    def load_data(self, registry_manager=None) -> Tuple[List[Document], Dict[str, Any]]:
+    def load_data(self, registry_manager=None,
+                  file_paths: Optional[List[str]] = None) -> Tuple[List[Document], Dict[str, Any]]:
         """
         Load all markdown files, enrich with JSON metadata and registry_id.
           Supports both local filesystem and Supabase Storage modes.
 
         Args:
             registry_manager: RegistryManager instance (optional, but recommended)
+            file_paths: Only load these markdown files (local filesystem mode)
 
         Returns:
             Tuple of (documents, loading_stats)
@@ -437,7 +452,10 @@ class MarkdownLoader:
 
         # Legacy: Local filesystem mode
         logger.info("[*]   Using LOCAL FILESYSTEM MODE")
-        markdown_files = self._scan_markdown_files()
+        if file_paths is not None:
+            markdown_files = self._select_markdown_files(file_paths)
+        else:
+            markdown_files = self._scan_markdown_files()
         
         if not markdown_files:
             logger.warning("[!] No markdown files found to load.")
@@ -218,7 +218,8 @@ class DocumentRegistryManager:
         storage_bucket: str = 'vehicle-documents',
         document_type: Optional[str] = None,
         vehicle_id: Optional[str] = None,
-        extracted_data: Optional[Dict] = None
+        extracted_data: Optional[Dict] = None,
+        file_hash: Optional[str] = None
     ) -> Optional[str]:
         """
         Create a new registry entry for a document uploaded to Storage.
@@ -232,6 +233,7 @@ class DocumentRegistryManager:
             document_type: Type of document (insurance, nct, etc.)
             vehicle_id: UUID of vehicle (if known)
             extracted_data: Additional metadata
+            file_hash: SHA256 hash of the uploaded file (for deduplication)
 
         Returns:
             str: Registry UUID or None if failed
@@ -259,8 +261,9 @@ class DocumentRegistryManager:
                     document_type,
                     vehicle_id,
                     status,
-                    extracted_data
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    extracted_data,
+                    file_hash
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 RETURNING id
             """, (
                 registry_id,
@@ -274,7 +277,8 @@ class DocumentRegistryManager:
                 document_type,
                 vehicle_id,
                 'pending_processing',  # status (for overall processing)
-                psycopg2.extras.Json(metadata)
+                psycopg2.extras.Json(metadata),
+                file_hash
             ))
 
             conn.commit()
@@ -290,6 +294,83 @@ class DocumentRegistryManager:
             logger.error(f"Failed to create registry entry from storage: {e}")
             return None
 
+    def create_entries_from_storage_bulk(self, entries: List[Dict]) -> List[str]:
+        """
+        Create registry entries for many uploaded documents in one INSERT.
+
+        Args:
+            entries: Dicts with the create_entry_from_storage arguments:
+                storage_path, original_filename, file_size, content_type and
+                optionally storage_bucket, document_type, vehicle_id, extracted_data,
+                file_hash
+
+        Returns:
+            List[str]: Registry UUIDs in the same order as entries (empty if failed)
+        """
+        if not entries:
+            return []
+
+        try:
+            conn = psycopg2.connect(self.connection_string)
+            cur = conn.cursor()
+
+            uploaded_at = datetime.utcnow()
+            rows = []
+            for entry in entries:
+                metadata = dict(entry.get('extracted_data') or {})
+                metadata['uploaded_filename'] = entry['original_filename']
+                rows.append((
+                    str(uuid.uuid4()),
+                    entry.get('storage_bucket', 'vehicle-documents'),
+                    entry['storage_path'],
+                    entry['original_filename'],
+                    entry['file_size'],
+                    entry['content_type'],
+                    uploaded_at,
+                    'pending',  # storage_status
+                    entry.get('document_type'),
+                    entry.get('vehicle_id'),
+                    'pending_processing',  # status (for overall processing)
+                    psycopg2.extras.Json(metadata),
+                    entry.get('file_hash')
+                ))
+
+            psycopg2.extras.execute_values(
+                cur,
+                """
+                INSERT INTO vecs.document_registry (
+                    id,
+                    storage_bucket,
+                    storage_path,
+                    original_filename,
+                    file_size_bytes,
+                    content_type,
+                    uploaded_at,
+                    storage_status,
+                    document_type,
+                    vehicle_id,
+                    status,
+                    extracted_data,
+                    file_hash
+                ) VALUES %s
+                """,
+                rows,
+                page_size=len(rows)
+            )
+
+            conn.commit()
+
+            cur.close()
+            conn.close()
+
+            logger.info(f"[+] Created {len(rows)} registry entries from storage")
+
+            return [row[0] for row in rows]
+
+        except Exception as e:
+            logger.error(f"Failed to bulk create registry entries from storage: {e}")
+            return []
+
     def update_storage_status(
         self,
         registry_id: str,
@@ -344,6 +425,60 @@ class DocumentRegistryManager:
             logger.error(f"Failed to update storage status: {e}")
             return False
 
+    def bulk_update_storage_status(self, updates: List[Dict]) -> int:
+        """
+        Apply many storage status updates in a single UPDATE.
+
+        Args:
+            updates: Dicts with keys:
+                - id: Registry UUID
+                - storage_status: New status
+                - storage_path: New storage path (None = unchanged)
+                - markdown_file_path: Markdown path (None = unchanged)
+
+        Returns:
+            Optional[int]: Number of rows updated, None if the update failed
+                (nothing was written; callers should retry or update per row)
+        """
+        if not updates:
+            return 0
+
+        try:
+            conn = psycopg2.connect(self.connection_string)
+            cur = conn.cursor()
+
+            psycopg2.extras.execute_values(
+                cur,
+                """
+                UPDATE vecs.document_registry AS r
+                SET storage_status = data.storage_status,
+                    storage_path = COALESCE(data.storage_path, r.storage_path),
+                    markdown_file_path = COALESCE(data.markdown_file_path, r.markdown_file_path),
+                    updated_at = now()
+                FROM (VALUES %s) AS data(id, storage_status, storage_path, markdown_file_path)
+                WHERE r.id = data.id
+                """,
+                [
+                    (u['id'], u['storage_status'], u.get('storage_path'), u.get('markdown_file_path'))
+                    for u in updates
+                ],
+                template="(%s::uuid, %s, %s::text, %s::text)",
+                page_size=len(updates)
+            )
+
+            conn.commit()
+            rows_updated = cur.rowcount
+
+            cur.close()
+            conn.close()
+
+            logger.info(f"[+] Bulk updated storage_status for {rows_updated}/{len(updates)} entries")
+            return rows_updated
+
+        except Exception as e:
+            logger.error(f"Failed to bulk update storage status: {e}")
+            return None
+
     def update_markdown_path(self, registry_id: str, markdown_path: str) -> bool:
         """
         Update the markdown file path for a registry entry.
@@ -424,12 +559,15 @@ class DocumentRegistryManager:
             logger.error(f"Failed to update file hash: {e}")
             return False
 
-    def find_by_file_hash(self, file_hash: str) -> Optional[Dict]:
+    def find_by_file_hash(self, file_hash: str,
+                          storage_statuses: Optional[List[str]] = None) -> Optional[Dict]:
         """
         Find registry entry by file hash (for deduplication).
 
         Args:
             file_hash: SHA256 hash of the file
+            storage_statuses: Only match entries with one of these storage_status
+                values (None = any status)
 
         Returns:
             Dict with registry entry or None if not found
@@ -438,7 +576,10 @@ class DocumentRegistryManager:
             conn = psycopg2.connect(self.connection_string)
             cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
 
-            cur.execute("""
+            status_filter = "AND storage_status = ANY(%s)" if storage_statuses is not None else ""
+            params = (file_hash, list(storage_statuses)) if storage_statuses is not None else (file_hash,)
+
+            cur.execute(f"""
                 SELECT
                     id,
                     original_filename,
@@ -449,9 +590,10 @@ class DocumentRegistryManager:
                     uploaded_at
                 FROM vecs.document_registry
                 WHERE file_hash = %s
+                {status_filter}
                 ORDER BY uploaded_at DESC
                 LIMIT 1
-            """, (file_hash,))
+            """, params)
 
             result = cur.fetchone()
             cur.close()
@@ -617,6 +759,38 @@ class DocumentRegistryManager:
             logger.error(f"Failed to get document by storage path: {e}")
             return None
 
+    def get_status_by_id(self, registry_id: str) -> Optional[str]:
+        """
+        Get the storage status of a single registry entry.
+
+        Args:
+            registry_id: Registry UUID
+
+        Returns:
+            str or None: storage_status ('pending', 'processing', ...), None if not found
+        """
+        try:
+            conn = psycopg2.connect(self.connection_string)
+            cur = conn.cursor()
+
+            cur.execute("""
+                SELECT storage_status
+                FROM vecs.document_registry
+                WHERE id = %s
+                LIMIT 1
+            """, (registry_id,))
+
+            result = cur.fetchone()
+
+            cur.close()
+            conn.close()
+
+            return result[0] if result else None
+
+        except Exception as e:
+            logger.error(f"Failed to get status by id: {e}")
+            return None
+
     def delete_document_completely(self, registry_id: str) -> bool:
         """
         Delete document registry entry and all associated chunks.
@@ -6,6 +6,8 @@ Tested and working with basic DocumentConverter initialization
 Supports both local filesystem and Supabase Storage workflows
 """
 
+import asyncio
+import functools
 import os
 import sys
 import time
@@ -26,6 +28,104 @@ from .utils_docling import safe_write_file, format_time
 from .ocr_enhancer import create_ocr_enhancer
 
 
+# Storage-mode registry updates are written in bulk every this many documents
+# (kept small: the files are already moved, a killed run must not lose many rows)
+REGISTRY_FLUSH_SIZE = 5
+
+# Per-converter OCR counters, summed across processes for parallel batches
+OCR_STAT_KEYS = ('ocr_enhanced', 'ocr_placeholders_replaced', 'easyocr_used', 'gemini_used', 'fallback_triggered')
+
+ALLOWED_FORMATS = [
+    InputFormat.PDF,
+    InputFormat.DOCX,
+    InputFormat.PPTX,
+    InputFormat.HTML,
+    InputFormat.IMAGE,
+]
+
+
+@functools.lru_cache(maxsize=2)
+def _get_docling_converter(
+    use_gemini_vision,
+    gemini_api_key=None,
+    gemini_vision_model=None,
+    gemini_vision_prompt=None,
+    gemini_vision_timeout=None
+):
+    """
+    Create (once per settings combination) a Docling 2.x converter.
+
+    Docling loads its layout/OCR models on construction, so the converter is
+    cached per process and reused across pipeline runs.
+
+    Args:
+        use_gemini_vision: Use Gemini Vision API for picture description
+        gemini_api_key: Gemini API key (Gemini Vision only)
+        gemini_vision_model: Gemini model name (Gemini Vision only)
+        gemini_vision_prompt: Picture description prompt (Gemini Vision only)
+        gemini_vision_timeout: API timeout in seconds (Gemini Vision only)
+
+    Returns:
+        DoclingConverter: Initialized Docling converter
+    """
+    print("[*] Initializing Docling 2.x converter...")
+
+    try:
+        if use_gemini_vision:
+            # Configure Gemini Vision API for picture description
+            print("[*]  Gemini Vision API enabled for picture description")
+
+            # Create pipeline options for Gemini Vision
+            pipeline_options = PdfPipelineOptions()
+            pipeline_options.enable_remote_services = True  # Required for API calls
+            pipeline_options.do_picture_description = True
+
+            # Configure Gemini Vision API via OpenAI-compatible endpoint
+            pipeline_options.picture_description_options = PictureDescriptionApiOptions(
+                url=f"https://generativelanguage.googleapis.com/v1beta/openai/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {gemini_api_key}",
+                    "Content-Type": "application/json"
+                },
+                params=dict(
+                    model=gemini_vision_model,
+                    temperature=0.0,  # Deterministic output for OCR
+                    max_tokens=2048,  # Enough for detailed text extraction
+                ),
+                prompt=gemini_vision_prompt,
+                timeout=gemini_vision_timeout,
+                concurrency=2,  # Process 2 images in parallel
+            )
+
+            # Create converter with Gemini Vision options
+            converter = DoclingConverter(
+                allowed_formats=ALLOWED_FORMATS,
+                format_options={
+                    InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+                }
+            )
+
+            print(f"[+] Gemini Vision API configured:")
+            print(f"    Model: {gemini_vision_model}")
+            print(f"    Timeout: {gemini_vision_timeout}s")
+            print(f"    Concurrency: 2 images in parallel")
+
+        else:
+            # Default converter without Gemini Vision
+            converter = DoclingConverter(allowed_formats=ALLOWED_FORMATS)
+
+        print("[+] Docling 2.x converter initialized successfully")
+        print(f"   Using default OCR and table extraction settings")
+
+        return converter
+
+    except Exception as e:
+        print(f"[-] Failed to initialize Docling converter: {e}")
+        import traceback
+        traceback.print_exc()
+        raise
+
+
 class DocumentConverter:
     """Converter for documents using Docling 2.x"""
     
@@ -69,7 +169,8 @@ class DocumentConverter:
             'total_files': 0, 'successful': 0, 'failed': 0, 'total_time': 0,
             'failed_files': [], 'total_batch_time': 0,
             'ocr_enhanced': 0, 'ocr_placeholders_replaced': 0,
-            'easyocr_used': 0, 'gemini_used': 0, 'fallback_triggered': 0
+            'easyocr_used': 0, 'gemini_used': 0, 'fallback_triggered': 0,
+            'registry_rows_updated': 0
         }
 
         # Print Docling version info
@@ -89,7 +190,35 @@ class DocumentConverter:
             print(f"[*] Storage Mode: ENABLED (Supabase Storage)")
         else:
             print(f"[*] Storage Mode: DISABLED (Local filesystem)")
-    
+
+    @classmethod
+    def for_reporting(cls, config, enable_ocr_enhancement=True, ocr_strategy='fallback'):
+        """
+        Create a converter that only aggregates and prints batch results.
+
+        Used by the parent of a process pool: Docling is not loaded, so
+        convert_file() must not be called on the returned instance.
+        """
+        converter = cls.__new__(cls)
+        converter.config = config
+        converter.enable_ocr_enhancement = (
+            enable_ocr_enhancement and not getattr(config, 'USE_GEMINI_VISION', False)
+        )
+        converter.ocr_strategy = ocr_strategy
+        converter.storage_manager = None
+        converter.registry_manager = None
+        converter.stats = {
+            'total_files': 0, 'successful': 0, 'failed': 0, 'total_time': 0,
+            'failed_files': [], 'total_batch_time': 0,
+            **{key: 0 for key in OCR_STAT_KEYS},
+            'registry_rows_updated': 0
+        }
+        return converter
+
+    def ocr_stats_snapshot(self):
+        """Current OCR counters (to compute per-file deltas in worker processes)"""
+        return {key: self.stats.get(key, 0) for key in OCR_STAT_KEYS}
+
     def _print_docling_info(self):
         """Print Docling version and configuration info"""
         try:
@@ -111,86 +240,29 @@ class DocumentConverter:
         """
         Initialize Docling document converter for version 2.55.1
          Now supports Gemini Vision API for picture description
+        
+        The underlying Docling converter (and its loaded models) is shared
+        between DocumentConverter instances with the same settings.
         """
-        print("[*] Initializing Docling 2.x converter...")
-
-        try:
-            # Check if Gemini Vision API is enabled
-            use_gemini_vision = getattr(self.config, 'USE_GEMINI_VISION', False)
-
-            if use_gemini_vision:
-                # Configure Gemini Vision API for picture description
-                print("[*]  Gemini Vision API enabled for picture description")
-
-                gemini_api_key = getattr(self.config, 'GEMINI_API_KEY', '')
-                if not gemini_api_key:
-                    print("[!] WARNING: GEMINI_API_KEY not set! Falling back to default converter")
-                    use_gemini_vision = False
-
-            if use_gemini_vision:
-                # Create pipeline options for Gemini Vision
-                pipeline_options = PdfPipelineOptions()
-                pipeline_options.enable_remote_services = True  # Required for API calls
-                pipeline_options.do_picture_description = True
-
-                # Configure Gemini Vision API via OpenAI-compatible endpoint
-                pipeline_options.picture_description_options = PictureDescriptionApiOptions(
-                    url=f"https://generativelanguage.googleapis.com/v1beta/openai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.config.GEMINI_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    params=dict(
-                        model=self.config.GEMINI_VISION_MODEL,
-                        temperature=0.0,  # Deterministic output for OCR
-                        max_tokens=2048,  # Enough for detailed text extraction
-                    ),
-                    prompt=self.config.GEMINI_VISION_PROMPT,
-                    timeout=self.config.GEMINI_VISION_TIMEOUT,
-                    concurrency=2,  # Process 2 images in parallel
-                )
+        # Check if Gemini Vision API is enabled
+        use_gemini_vision = getattr(self.config, 'USE_GEMINI_VISION', False)
 
-                # Create converter with Gemini Vision options
-                converter = DoclingConverter(
-                    allowed_formats=[
-                        InputFormat.PDF,
-                        InputFormat.DOCX,
-                        InputFormat.PPTX,
-                        InputFormat.HTML,
-                        InputFormat.IMAGE,
-                    ],
-                    format_options={
-                        InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-                    }
-                )
-
-                print(f"[+] Gemini Vision API configured:")
-                print(f"    Model: {self.config.GEMINI_VISION_MODEL}")
-                print(f"    Timeout: {self.config.GEMINI_VISION_TIMEOUT}s")
-                print(f"    Concurrency: 2 images in parallel")
-
-            else:
-                # Default converter without Gemini Vision
-                converter = DoclingConverter(
-                    allowed_formats=[
-                        InputFormat.PDF,
-                        InputFormat.DOCX,
-                        InputFormat.PPTX,
-                        InputFormat.HTML,
-                        InputFormat.IMAGE,
-                    ]
-                )
-
-            print("[+] Docling 2.x converter initialized successfully")
-            print(f"   Using default OCR and table extraction settings")
-
-            return converter
-
-        except Exception as e:
-            print(f"[-] Failed to initialize Docling converter: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
+        if use_gemini_vision:
+            gemini_api_key = getattr(self.config, 'GEMINI_API_KEY', '')
+            if not gemini_api_key:
+                print("[!] WARNING: GEMINI_API_KEY not set! Falling back to default converter")
+                use_gemini_vision = False
+
+        if not use_gemini_vision:
+            return _get_docling_converter(False)
+
+        return _get_docling_converter(
+            True,
+            self.config.GEMINI_API_KEY,
+            self.config.GEMINI_VISION_MODEL,
+            self.config.GEMINI_VISION_PROMPT,
+            self.config.GEMINI_VISION_TIMEOUT
+        )
 
     def _get_ocr_enhancer(self):
         """Lazy initialization of OCR enhancer (only when needed)"""
@@ -438,12 +510,14 @@ class DocumentConverter:
             
             return False, None, error_msg
     
-    def convert_batch(self, files_to_process):
+    def convert_batch(self, files_to_process, on_complete=None):
         """
         Convert a batch of files, updating stats along the way.
         
         Args:
             files_to_process: List of file paths to convert
+            on_complete: Optional callback called with each markdown output path
+                as soon as that file has been converted successfully
             
         Returns:
             dict: Conversion statistics
@@ -452,6 +526,31 @@ class DocumentConverter:
             print("[!] No files to convert in this batch.")
             return self.get_conversion_stats()
         
+        total = len(files_to_process)
+        
+        def outcomes():
+            for i, file_path in enumerate(files_to_process, 1):
+                print(f"\n[{i}/{total}]", end=" ")
+                file_start_time = time.time()
+                success, output_path, error_msg = self.convert_file(file_path)
+                # OCR counters were already added by convert_file()
+                yield success, output_path, error_msg, time.time() - file_start_time, None
+        
+        return self.record_batch(files_to_process, outcomes(), on_complete=on_complete)
+    
+    def record_batch(self, files_to_process, outcomes, on_complete=None):
+        """
+        Aggregate per-file conversion outcomes, printing progress and the batch summary.
+        
+        Args:
+            files_to_process: List of file paths, in the order of outcomes
+            outcomes: Iterable of (success, output_path, error_msg, seconds, ocr_stats)
+                tuples; ocr_stats is a dict of OCR_STAT_KEYS deltas or None
+            on_complete: Optional callback called with each markdown output path
+            
+        Returns:
+            dict: Conversion statistics
+        """
         print(f"\n[*] Starting conversion of {len(files_to_process)} files...")
         batch_start_time = time.time()
         
@@ -459,17 +558,17 @@ class DocumentConverter:
         failed_in_batch = 0
         total_time_in_batch = 0
 
-        for i, file_path in enumerate(files_to_process, 1):
+        for i, (file_path, outcome) in enumerate(zip(files_to_process, outcomes), 1):
+            success, output_path, error_msg, file_conversion_time, ocr_stats = outcome
             self.stats['total_files'] += 1
-            print(f"\n[{i}/{len(files_to_process)}]", end=" ")
-
-            file_start_time = time.time()
-            success, _, error_msg = self.convert_file(file_path)
-            file_conversion_time = time.time() - file_start_time
+            for key, value in (ocr_stats or {}).items():
+                self.stats[key] += value
 
             if success:
                 successful_in_batch += 1
                 total_time_in_batch += file_conversion_time
+                if on_complete:
+                    on_complete(output_path)
             else:
                 failed_in_batch += 1
                 self.stats['failed_files'].append({
@@ -597,7 +696,9 @@ class DocumentConverter:
     # NEW METHODS FOR SUPABASE STORAGE INTEGRATION
     # ================================================
 
-    def convert_from_storage(self, document_record: Dict) -> tuple[bool, Optional[Path], Optional[str]]:
+    def convert_from_storage(self, document_record: Dict,
+                             registry_updates: Optional[list] = None
+                             ) -> tuple[bool, Optional[Path], Optional[str]]:
         """
         Convert a document from Supabase Storage.
 
@@ -609,42 +710,111 @@ class DocumentConverter:
                 - storage_path: path in Storage
                 - original_filename: original filename
                 - storage_bucket: bucket name
+            registry_updates: Optional list to collect the final registry update
+                in (see _flush_registry_updates) instead of writing it immediately
 
         Returns:
             tuple: (success: bool, output_path: Path, error_msg: str)
         """
-        if not self.storage_manager or not self.registry_manager:
-            raise ValueError("storage_manager and registry_manager required for Storage mode")
+        result, _ = self.convert_from_storage_timed(document_record, registry_updates)
+        return result
 
-        registry_id = document_record['id']
-        storage_path = document_record['storage_path']
-        original_filename = document_record['original_filename']
+    def convert_from_storage_timed(self, document_record: Dict,
+                                   registry_updates: Optional[list] = None
+                                   ) -> tuple[tuple[bool, Optional[Path], Optional[str]], float]:
+        """
+        Same as convert_from_storage(), also returning the Docling conversion time.
 
-        print(f"\n[*] Converting from Storage: {original_filename}")
-        print(f"   Storage path: {storage_path}")
+        The time covers convert_file() only (not the download or the move), the
+        same span the async batch path measures.
+
+        Returns:
+            tuple: ((success, output_path, error_msg), conversion seconds)
+        """
+        if not self.storage_manager or not self.registry_manager:
+            raise ValueError("storage_manager and registry_manager required for Storage mode")
 
         temp_file_path = None
+        conversion_time = 0
 
         try:
-            # Update status to 'processing'
-            self.registry_manager.update_storage_status(registry_id, 'processing')
-
-            # Download file from Storage to temp location
-            temp_file_path = self.storage_manager.download_to_temp(storage_path)
+            temp_file_path = self._download_from_storage(document_record)
 
             # Convert the downloaded file
+            file_start_time = time.time()
             success, output_path, error_msg = self.convert_file(temp_file_path)
+            conversion_time = time.time() - file_start_time
 
-            if success:
-                # Move file to processed folder in Storage
-                year = datetime.now().strftime('%Y')
-                month = datetime.now().strftime('%m')
-                filename = Path(storage_path).name
-                new_storage_path = f"raw/processed/{year}/{month}/{filename}"
+            return self._finish_storage_conversion(
+                document_record, success, output_path, error_msg, registry_updates
+            ), conversion_time
+
+        except Exception as e:
+            return self._fail_storage_conversion(document_record, e), conversion_time
+
+        finally:
+            self._cleanup_storage_temp(temp_file_path)
+
+    def _download_from_storage(self, document_record: Dict) -> str:
+        """
+        Mark a registry entry as processing and download its file to a temp location.
+
+        Args:
+            document_record: Document record from document_registry
+
+        Returns:
+            str: Local temporary file path
+        """
+        storage_path = document_record['storage_path']
+
+        print(f"\n[*] Converting from Storage: {document_record['original_filename']}")
+        print(f"   Storage path: {storage_path}")
+
+        # Update status to 'processing'
+        self.registry_manager.update_storage_status(document_record['id'], 'processing')
+
+        # Download file from Storage to temp location
+        return self.storage_manager.download_to_temp(storage_path)
+
+    def _finish_storage_conversion(self, document_record: Dict, success: bool,
+                                   output_path: Optional[Path], error_msg: Optional[str],
+                                   registry_updates: Optional[list] = None
+                                   ) -> tuple[bool, Optional[Path], Optional[str]]:
+        """
+        Move a converted document to the processed/failed folder and update the registry.
 
-                self.storage_manager.move_document(storage_path, new_storage_path)
+        Args:
+            document_record: Document record from document_registry
+            success: Whether the conversion succeeded
+            output_path: Markdown output path (if successful)
+            error_msg: Conversion error message (if failed)
+            registry_updates: Optional list to append the registry update to
+                (written later in bulk) instead of updating immediately
 
-                # Update registry with new storage path and markdown path
+        Returns:
+            tuple: (success: bool, output_path: Path, error_msg: str)
+        """
+        registry_id = document_record['id']
+        storage_path = document_record['storage_path']
+        filename = Path(storage_path).name
+
+        if success:
+            # Move file to processed folder in Storage
+            year = datetime.now().strftime('%Y')
+            month = datetime.now().strftime('%m')
+            new_storage_path = f"raw/processed/{year}/{month}/{filename}"
+
+            self.storage_manager.move_document(storage_path, new_storage_path)
+
+            # Update registry with new storage path and markdown path
+            if registry_updates is not None:
+                registry_updates.append({
+                    'id': registry_id,
+                    'storage_status': 'processed',
+                    'storage_path': new_storage_path,
+                    'markdown_file_path': str(output_path)
+                })
+            else:
                 self.registry_manager.update_storage_status(
                     registry_id,
                     'processed',
@@ -652,54 +822,134 @@ class DocumentConverter:
                 )
                 self.registry_manager.update_markdown_path(registry_id, str(output_path))
 
-                print(f"   [+] Moved to: {new_storage_path}")
+            print(f"   [+] Moved to: {new_storage_path}")
 
-                return True, output_path, None
+            return True, output_path, None
 
-            else:
-                # Move file to failed folder in Storage
-                filename = Path(storage_path).name
-                failed_storage_path = f"raw/failed/{filename}"
+        # Move file to failed folder in Storage
+        failed_storage_path = f"raw/failed/{filename}"
 
-                self.storage_manager.move_document(storage_path, failed_storage_path)
+        self.storage_manager.move_document(storage_path, failed_storage_path)
 
-                # Update registry
-                self.registry_manager.update_storage_status(
-                    registry_id,
-                    'failed',
-                    failed_storage_path
-                )
+        # Update registry
+        if registry_updates is not None:
+            registry_updates.append({
+                'id': registry_id,
+                'storage_status': 'failed',
+                'storage_path': failed_storage_path,
+                'markdown_file_path': None
+            })
+        else:
+            self.registry_manager.update_storage_status(
+                registry_id,
+                'failed',
+                failed_storage_path
+            )
 
-                print(f"   [-] Moved to failed folder: {failed_storage_path}")
+        print(f"   [-] Moved to failed folder: {failed_storage_path}")
 
-                return False, None, error_msg
+        return False, None, error_msg
 
-        except Exception as e:
-            error_msg = str(e)
-            print(f"   [-] Storage conversion error: {error_msg}")
+    def _fail_storage_conversion(self, document_record: Dict, error: Exception
+                                 ) -> tuple[bool, Optional[Path], Optional[str]]:
+        """
+        Handle an unexpected error in the Storage workflow.
 
-            # Try to move to failed folder
-            try:
-                filename = Path(storage_path).name
-                failed_storage_path = f"raw/failed/{filename}"
-                self.storage_manager.move_document(storage_path, failed_storage_path)
-                self.registry_manager.update_storage_status(registry_id, 'failed', failed_storage_path)
-            except Exception as move_error:
-                print(f"   [!] Could not move to failed folder: {move_error}")
+        Args:
+            document_record: Document record from document_registry
+            error: Exception raised while downloading/converting/moving
 
-            return False, None, error_msg
+        Returns:
+            tuple: (False, None, error_msg)
+        """
+        error_msg = str(error)
+        print(f"   [-] Storage conversion error: {error_msg}")
 
-        finally:
-            # Always cleanup temp file
-            if temp_file_path and os.path.exists(temp_file_path):
-                self.storage_manager.cleanup_temp_file(temp_file_path)
+        # Try to move to failed folder
+        try:
+            filename = Path(document_record['storage_path']).name
+            failed_storage_path = f"raw/failed/{filename}"
+            self.storage_manager.move_document(document_record['storage_path'], failed_storage_path)
+            self.registry_manager.update_storage_status(document_record['id'], 'failed', failed_storage_path)
+        except Exception as move_error:
+            print(f"   [!] Could not move to failed folder: {move_error}")
+
+        return False, None, error_msg
+
+    def _cleanup_storage_temp(self, temp_file_path: Optional[str]):
+        """Remove a downloaded temp file, if any."""
+        if temp_file_path and os.path.exists(temp_file_path):
+            self.storage_manager.cleanup_temp_file(temp_file_path)
+
+    def _flush_registry_updates(self, registry_updates: list):
+        """
+        Write buffered registry updates in one statement and clear the buffer.
+
+        If the bulk UPDATE fails, falls back to per-row updates; rows that
+        still cannot be written stay in the buffer for the next flush.
+        """
+        if not registry_updates:
+            return
+
+        rows_updated = self.registry_manager.bulk_update_storage_status(registry_updates)
+        if rows_updated is not None:
+            self.stats['registry_rows_updated'] += rows_updated
+            registry_updates.clear()
+            return
+
+        print(f"   [!] Bulk registry update failed, updating {len(registry_updates)} rows one by one")
+        pending = []
+        for update in registry_updates:
+            updated = self.registry_manager.update_storage_status(
+                update['id'], update['storage_status'], update.get('storage_path')
+            )
+            if updated and update.get('markdown_file_path'):
+                updated = self.registry_manager.update_markdown_path(
+                    update['id'], update['markdown_file_path']
+                )
+            if updated:
+                self.stats['registry_rows_updated'] += 1
+            else:
+                pending.append(update)
+        registry_updates[:] = pending
 
-    def convert_batch_from_storage(self, document_records: list[Dict]) -> dict:
+    @staticmethod
+    def _storage_result_event(doc_record: Dict, success: bool, seconds: float,
+                              error_msg: Optional[str]) -> dict:
+        """
+        Build the per-document status event passed to on_result callbacks.
+
+        Returns:
+            dict: {'doc_id', 'filename', 'status' ('ok'|'failed'), 'duration_ms', 'bytes', 'error'}
+                where duration_ms is the Docling conversion time on both batch paths
+        """
+        return {
+            'doc_id': doc_record['id'],
+            'filename': doc_record['original_filename'],
+            'status': 'ok' if success else 'failed',
+            'duration_ms': int(seconds * 1000),
+            'bytes': doc_record.get('file_size_bytes'),
+            'error': error_msg
+        }
+
+    def _record_storage_result(self, doc_record: Dict, success: bool, error_msg: Optional[str]):
+        """Record a failed Storage conversion in the failed_files list."""
+        if not success:
+            self.stats['failed_files'].append({
+                'file': doc_record['original_filename'],
+                'registry_id': doc_record['id'],
+                'error': error_msg,
+                'timestamp': datetime.now().isoformat()
+            })
+
+    def convert_batch_from_storage(self, document_records: list[Dict], on_result=None) -> dict:
         """
         Convert a batch of documents from Supabase Storage.
 
         Args:
             document_records: List of document records from document_registry
+            on_result: Optional callback called with a status event dict
+                (see _storage_result_event) as each document finishes
 
         Returns:
             dict: Conversion statistics
@@ -715,29 +965,36 @@ class DocumentConverter:
         failed_in_batch = 0
         total_time_in_batch = 0
 
-        for i, doc_record in enumerate(document_records, 1):
-            self.stats['total_files'] += 1
-            print(f"\n[{i}/{len(document_records)}]", end=" ")
+        registry_updates = []
 
-            file_start_time = time.time()
-            success, _, error_msg = self.convert_from_storage(doc_record)
-            file_conversion_time = time.time() - file_start_time
+        try:
+            for i, doc_record in enumerate(document_records, 1):
+                self.stats['total_files'] += 1
+                print(f"\n[{i}/{len(document_records)}]", end=" ")
 
-            if success:
-                successful_in_batch += 1
-                total_time_in_batch += file_conversion_time
-            else:
-                failed_in_batch += 1
-                self.stats['failed_files'].append({
-                    'file': doc_record['original_filename'],
-                    'registry_id': doc_record['id'],
-                    'error': error_msg,
-                    'timestamp': datetime.now().isoformat()
-                })
+                (success, _, error_msg), file_conversion_time = self.convert_from_storage_timed(
+                    doc_record, registry_updates
+                )
 
-            # Print progress every 5 files
-            if i % 5 == 0:
-                self._print_progress(i, len(document_records), batch_start_time)
+                if success:
+                    successful_in_batch += 1
+                    total_time_in_batch += file_conversion_time
+                else:
+                    failed_in_batch += 1
+                self._record_storage_result(doc_record, success, error_msg)
+
+                if on_result:
+                    on_result(self._storage_result_event(doc_record, success, file_conversion_time, error_msg))
+
+                if len(registry_updates) >= REGISTRY_FLUSH_SIZE:
+                    self._flush_registry_updates(registry_updates)
+
+                # Print progress every 5 files
+                if i % 5 == 0:
+                    self._print_progress(i, len(document_records), batch_start_time)
+        finally:
+            # Files were already moved in Storage, always record where they went
+            self._flush_registry_updates(registry_updates)
 
         # Update cumulative stats
         self.stats['successful'] += successful_in_batch
@@ -750,6 +1007,118 @@ class DocumentConverter:
 
         return self.get_conversion_stats()
 
+    async def convert_batch_from_storage_async(self, document_records: list[Dict],
+                                               max_downloads: int = 4,
+                                               max_conversions: int = 1,
+                                               on_result=None) -> dict:
+        """
+        Convert a batch of documents from Supabase Storage, overlapping I/O with conversion.
+
+        Downloads, moves and registry updates run in worker threads, so the next
+        documents are fetched while Docling is busy. Downloads are bounded by
+        max_downloads and Docling conversions by max_conversions. At most
+        max_conversions + max_downloads documents are in flight at once, which
+        bounds temp disk usage and the number of rows left in 'processing'.
+
+        Args:
+            document_records: List of document records from document_registry
+            max_downloads: Maximum concurrent Storage transfers
+            max_conversions: Maximum concurrent Docling conversions
+            on_result: Optional callback called with a status event dict
+                (see _storage_result_event) as each document finishes
+
+        Returns:
+            dict: Conversion statistics
+        """
+        if not document_records:
+            print("[!] No documents to convert in this batch.")
+            return self.get_conversion_stats()
+
+        if not self.storage_manager or not self.registry_manager:
+            raise ValueError("storage_manager and registry_manager required for Storage mode")
+
+        total = len(document_records)
+        print(f"\n[*] Starting conversion of {total} documents from Storage "
+              f"({max_downloads} concurrent downloads, {max_conversions} concurrent conversions)...")
+        batch_start_time = time.time()
+
+        # Lookahead: documents downloaded (and marked 'processing') but not finished
+        in_flight_semaphore = asyncio.Semaphore(max_conversions + max_downloads)
+        download_semaphore = asyncio.Semaphore(max_downloads)
+        convert_semaphore = asyncio.Semaphore(max_conversions)
+        completed = 0
+
+        # Only touched from the event loop; worker threads fill per-document lists
+        registry_updates = []
+
+        async def _convert_one(doc_record):
+            nonlocal completed
+            temp_file_path = None
+            conversion_time = 0
+
+            async with in_flight_semaphore:
+                try:
+                    async with download_semaphore:
+                        temp_file_path = await asyncio.to_thread(self._download_from_storage, doc_record)
+
+                    async with convert_semaphore:
+                        file_start_time = time.time()
+                        success, output_path, error_msg = await asyncio.to_thread(
+                            self.convert_file, temp_file_path
+                        )
+                        conversion_time = time.time() - file_start_time
+
+                    # Not bounded by download_semaphore: finishing frees an in-flight slot
+                    doc_updates = []
+                    result = await asyncio.to_thread(
+                        self._finish_storage_conversion,
+                        doc_record, success, output_path, error_msg, doc_updates
+                    )
+                    registry_updates.extend(doc_updates)
+
+                except Exception as e:
+                    result = await asyncio.to_thread(self._fail_storage_conversion, doc_record, e)
+
+                finally:
+                    self._cleanup_storage_temp(temp_file_path)
+
+            completed += 1
+            if on_result:
+                on_result(self._storage_result_event(doc_record, result[0], conversion_time, result[2]))
+            if completed % 5 == 0:
+                self._print_progress(completed, total, batch_start_time)
+
+            if len(registry_updates) >= REGISTRY_FLUSH_SIZE:
+                to_flush = registry_updates[:]
+                registry_updates.clear()
+                await asyncio.to_thread(self._flush_registry_updates, to_flush)
+                # Rows that could not be written are retried on the next flush
+                registry_updates.extend(to_flush)
+
+            return result, conversion_time
+
+        try:
+            outcomes = await asyncio.gather(*(_convert_one(doc) for doc in document_records))
+        finally:
+            # Files were already moved in Storage, always record where they went
+            self._flush_registry_updates(registry_updates)
+
+        # Update cumulative stats
+        for doc_record, ((success, _, error_msg), conversion_time) in zip(document_records, outcomes):
+            self.stats['total_files'] += 1
+            if success:
+                self.stats['successful'] += 1
+                self.stats['total_time'] += conversion_time
+            else:
+                self.stats['failed'] += 1
+            self._record_storage_result(doc_record, success, error_msg)
+        self.stats['total_batch_time'] = time.time() - batch_start_time
+
+        # Print final summary
+        self._print_final_summary()
+
+        return self.get_conversion_stats()
+
     def get_conversion_stats(self):
         """
         Get current conversion statistics.
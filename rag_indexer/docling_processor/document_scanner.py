@@ -115,12 +115,14 @@ class DocumentScanner:
         """Get scan statistics"""
         return self.scan_stats.copy()
     
-    def check_already_converted(self, input_path):
+    def check_already_converted(self, input_path, markdown_index=None):
         """
         Check if file was already converted
         
         Args:
             input_path: Input file path
+            markdown_index: Optional {normalized markdown path: mtime_ns} dict,
+                used instead of stat-ing each output file
         
         Returns:
             bool: True if already converted
@@ -129,23 +131,30 @@ class DocumentScanner:
         output_path = self.config.get_output_path(input_path)
         
         # Check if output exists
-        if not output_path.exists():
-            return False
+        if markdown_index is not None:
+            output_mtime = markdown_index.get(os.path.normpath(output_path))
+            if output_mtime is None:
+                return False
+        else:
+            if not output_path.exists():
+                return False
+            output_mtime = output_path.stat().st_mtime_ns
         
         # Compare modification times
-        input_mtime = input_path.stat().st_mtime
-        output_mtime = output_path.stat().st_mtime
+        input_mtime = input_path.stat().st_mtime_ns
         
         # If output is newer than input, already converted
         return output_mtime > input_mtime
     
-    def filter_already_converted(self, files_to_process, incremental=True):
+    def filter_already_converted(self, files_to_process, incremental=True, markdown_index=None):
         """
         Filter out already converted files
         
         Args:
             files_to_process: List of file paths
             incremental: If True, skip already converted files
+            markdown_index: Optional {normalized markdown path: mtime_ns} dict
+                of existing output files (avoids one stat per file)
         
         Returns:
             list: Filtered list of files
@@ -159,7 +168,7 @@ class DocumentScanner:
         skipped_count = 0
         
         for file_path in files_to_process:
-            if self.check_already_converted(file_path):
+            if self.check_already_converted(file_path, markdown_index):
                 skipped_count += 1
             else:
                 new_files.append(file_path)
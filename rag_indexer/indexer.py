@@ -112,8 +112,20 @@ def initialize_components(config):
     }
 
 
-def main():
-    """Simplified main function - markdown -> chunks -> embeddings -> vectors"""
+def main(incremental=None, file_paths=None, interactive=True):
+    """
+    Simplified main function - markdown -> chunks -> embeddings -> vectors
+    
+    Args:
+        incremental: Only index new/changed files. None falls back to the
+            INCREMENTAL_MODE environment variable (standalone runs)
+        file_paths: Only index these markdown files instead of the whole
+            DOCUMENTS_DIR (also skips the deleted-files cleanup)
+        interactive: Ask before continuing with documents/chunks that lack a
+            registry_id and before deleting existing records. When False,
+            such documents/chunks are skipped and, in full mode, existing
+            records of the files being indexed are replaced without asking
+    """
     
     # Setup
     logging.basicConfig(stream=sys.stdout, level=logging.INFO)
@@ -123,7 +135,10 @@ def main():
         sys.exit(1)
     
     # Get incremental mode setting early
-    incremental_mode = os.getenv("INCREMENTAL_MODE", "false").lower() == "true"
+    if incremental is None:
+        incremental_mode = os.getenv("INCREMENTAL_MODE", "false").lower() == "true"
+    else:
+        incremental_mode = incremental
     
     # Initialize tracking
     progress_tracker = create_progress_tracker()
@@ -257,7 +272,10 @@ def main():
                 
                 # Load documents WITH registry enrichment
                 print("[*] Loading documents with registry_id enrichment...")
-                documents, loading_stats = loader.load_data(registry_manager=registry_manager)
+                documents, loading_stats = loader.load_data(
+                    registry_manager=registry_manager,
+                    file_paths=file_paths
+                )
                 
                 # Create processing summary
                 processing_summary = {
@@ -315,11 +333,17 @@ def main():
                 print(f"   These documents will FAIL to index due to database constraints.")
                 print(f"   Check logs above for registry enrichment failures.")
                 
-                # Ask user if they want to continue
-                response = input("\nContinue anyway? (y/N): ").strip().lower()
-                if response != 'y':
-                    print("Indexing aborted by user.")
-                    return
+                if not interactive:
+                    documents = [doc for doc in documents if doc.metadata.get('registry_id')]
+                    print(f"   Skipping them (non-interactive run), {len(documents)} documents left")
+                    if not documents:
+                        return
+                else:
+                    # Ask user if they want to continue
+                    response = input("\nContinue anyway? (y/N): ").strip().lower()
+                    if response != 'y':
+                        print("Indexing aborted by user.")
+                        return
             
             performance_monitor.checkpoint("Markdown documents loaded", len(documents))
             stats['processing_stages'].append('documents_loaded')
@@ -340,8 +364,9 @@ def main():
                 # Print current state
                 incremental_indexer.print_statistics()
                 
-                # Remove deleted files from database
-                cleanup_stats = incremental_indexer.remove_deleted_files()
+                # Remove deleted files from database (whole-directory runs only)
+                if file_paths is None:
+                    cleanup_stats = incremental_indexer.remove_deleted_files()
                 
                 # Filter to only new/modified documents
                 new_docs, modified_docs, unchanged_docs = incremental_indexer.filter_new_and_modified(documents)
@@ -379,8 +404,13 @@ def main():
                 elif file_name:
                     files_to_process.add(file_name)
             
-            # Pass incremental_mode flag to deletion dialog
-            deletion_info = db_manager.safe_deletion_dialog(files_to_process, incremental_mode=incremental_mode)
+            if interactive or incremental_mode:
+                # Pass incremental_mode flag to deletion dialog
+                deletion_info = db_manager.safe_deletion_dialog(files_to_process, incremental_mode=incremental_mode)
+            else:
+                # Full reindex without a console: replace these files' records
+                deleted_count = db_manager.delete_existing_records(files_to_process)
+                deletion_info = {'files_processed': len(files_to_process), 'records_deleted': deleted_count}
             progress_tracker.add_checkpoint("Deletion dialog completed")
             stats['processing_stages'].append('deletion_dialog')
             
@@ -422,11 +452,15 @@ def main():
                 print(f"   [-] Chunks WITHOUT registry_id: {chunks_without_registry}")
                 print(f"   [!]  WARNING: These chunks will FAIL to save to database!")
                 
-                # Ask user if they want to continue
-                response = input("\nContinue anyway? (y/N): ").strip().lower()
-                if response != 'y':
-                    print("Indexing aborted by user.")
-                    return
+                if not interactive:
+                    valid_nodes = [node for node in valid_nodes if node.metadata.get('registry_id')]
+                    print(f"   Skipping them (non-interactive run), {len(valid_nodes)} chunks left")
+                else:
+                    # Ask user if they want to continue
+                    response = input("\nContinue anyway? (y/N): ").strip().lower()
+                    if response != 'y':
+                        print("Indexing aborted by user.")
+                        return
             
             # Create chunk processing report
             chunk_report = create_chunk_processing_report(valid_nodes, invalid_nodes, enhanced_node_stats, config)
@@ -6,15 +6,24 @@ Enhanced testing script for OCR with auto-rotation detection and text quality an
 Optimized for English language documents only
 """
 
+import contextlib
+import functools
+import io
+import itertools
+import multiprocessing
+import operator
 import os
+import re
 import sys
+import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 # OCR libraries
 try:
     import pytesseract
-    from PIL import Image, ImageEnhance, ImageFilter
+    from PIL import Image
     import cv2
     import numpy as np
     print("? All OCR libraries loaded successfully")
@@ -22,6 +31,19 @@ except ImportError as e:
     print(f"? Import error: {e}")
     sys.exit(1)
 
+# Optional: numba compiles the character counting kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional: tesserocr lets us keep one initialised Tesseract engine
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
 # Import our enhanced modules
 try:
     from ocr_processor import TextQualityAnalyzer, OCRProcessor
@@ -32,13 +54,282 @@ except ImportError as e:
     print("Running in basic mode...")
 
 
+# Byte-indexed character class lookup tables (built once at import)
+_ALPHA = np.zeros(256, dtype=bool)
+_ALPHA[65:91] = True   # A-Z
+_ALPHA[97:123] = True  # a-z
+_DIGIT = np.zeros(256, dtype=bool)
+_DIGIT[48:58] = True   # 0-9
+_SPACE = np.zeros(256, dtype=bool)
+_SPACE[[9, 10, 11, 12, 13, 32]] = True
+
+# Default samples for the text quality analysis test
+DEFAULT_QUALITY_TEST_TEXTS = (
+    "This is a normal English sentence with proper structure and punctuation.",
+    "The quick brown fox jumps over the lazy dog. This sentence contains all letters.",
+    "aaaaaaaaaaa bbbbbbbb ccccccc",  # Repetitive
+    "abc xyz 123 !@# $%^ &*()",  # Low quality symbols
+    "Th1s 1s b4d qu4l1ty t3xt w1th numb3rs",  # Numbers in words
+    "",  # Empty
+    "A",  # Too short
+    "Hello world! This is good text with proper English words and structure.",
+    "asdfgh qwerty zxcvbn poiuyt",  # Random characters
+    "We can analyze the performance metrics to determine the optimal configuration parameters."  # Technical but good
+)
+
+
+def _count_char_classes(codes, alpha, digit, space):
+    """Count letters, digits and whitespace in one pass over byte codes"""
+    letters = digits = spaces = 0
+    for code in codes:
+        if alpha[code]:
+            letters += 1
+        elif digit[code]:
+            digits += 1
+        elif space[code]:
+            spaces += 1
+    return letters, digits, spaces
+
+
+if NUMBA_AVAILABLE:
+    _count_char_classes = njit(cache=True, nogil=True)(_count_char_classes)
+
+
+def classify_chars(text):
+    """Count ASCII letters, digits and whitespace in text via lookup tables
+    
+    Returns (letters, digits, spaces). Non-ASCII characters are ignored,
+    which is fine for the English-only OCR output tested here. With numba
+    installed the counting runs as a single compiled pass.
+    """
+    codes = np.frombuffer(text.encode('ascii', 'ignore'), dtype=np.uint8)
+    if NUMBA_AVAILABLE:
+        return _count_char_classes(codes, _ALPHA, _DIGIT, _SPACE)
+    return int(_ALPHA[codes].sum()), int(_DIGIT[codes].sum()), int(_SPACE[codes].sum())
+
+
+class BufferedOutput(contextlib.ContextDecorator):
+    """Collect stdout of a test section and flush it in a single write.
+
+    Test functions print dozens of short lines; buffering them avoids a
+    syscall per line, which is noticeable when output goes to a log file.
+    Can be used as a context manager or as a function decorator.
+    """
+
+    def __enter__(self):
+        self._buffer = io.StringIO()
+        self._real_stdout = sys.stdout
+        sys.stdout = self._buffer
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.stdout = self._real_stdout
+        sys.stdout.write(self._buffer.getvalue())
+        sys.stdout.flush()
+        return False
+
+
+def describe_image_source(image_source):
+    """Human-readable label for a file path or an in-memory image array"""
+    if isinstance(image_source, np.ndarray):
+        return f"<in-memory image {image_source.shape}>"
+    return str(image_source)
+
+
+def load_image(image_path):
+    """Read and decode an image file once as a read-only BGR array
+    
+    Cached on (path, mtime) so that the stages of comprehensive_test_suite
+    share a single disk read and decode, while a rewritten file is decoded
+    again. Formats OpenCV cannot decode (e.g. GIF) go through PIL.
+    """
+    return _load_image(str(image_path), os.stat(image_path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_image(image_path, mtime_ns):
+    with open(image_path, 'rb') as f:
+        raw = f.read()
+    
+    # EXIF orientation is ignored so rotation detection sees the stored pixels
+    array = cv2.imdecode(np.frombuffer(raw, np.uint8), cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+    if array is None:
+        array = cv2.cvtColor(np.asarray(Image.open(io.BytesIO(raw)).convert('RGB')), cv2.COLOR_RGB2BGR)
+    
+    array.flags.writeable = False
+    return array
+
+
+def load_image_array(image_source):
+    """Return a decoded array for a file path or pass an array through"""
+    if isinstance(image_source, np.ndarray):
+        return image_source
+    return load_image(image_source)
+
+
+def open_pil_image(image_source):
+    """Open a file path or a decoded BGR/grayscale array as a PIL image"""
+    array = load_image_array(image_source)
+    if array.ndim == 3:
+        return Image.fromarray(cv2.cvtColor(array, cv2.COLOR_BGR2RGB))
+    return Image.fromarray(array)
+
+
+# OCR input size bounds: upscale small images, downscale huge ones (no gain past ~300 DPI)
+OCR_MIN_DIMENSION = 1000
+OCR_MAX_DIMENSION = 4000
+OCR_MIN_UPSCALE = 1.02
+
+
+def scale_for_ocr(image):
+    """Resize a PIL image into the useful OCR size range
+    
+    Returns (image, scaled) where scaled tells whether a resize happened.
+    Upscaling that would change the size by less than 2% is skipped.
+    """
+    width, height = image.size
+    scale_factor = max(1.0, OCR_MIN_DIMENSION / min(width, height))
+    
+    if scale_factor <= OCR_MIN_UPSCALE:
+        if max(width, height) <= OCR_MAX_DIMENSION:
+            return image, False
+        scale_factor = OCR_MAX_DIMENSION / max(width, height)
+    
+    new_size = (int(width * scale_factor), int(height * scale_factor))
+    return image.resize(new_size, Image.LANCZOS), True
+
+
+# Local contrast equalisation used by enhance_for_ocr
+CLAHE = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+
+
+def enhance_for_ocr(image):
+    """Denoise and contrast-enhance an RGB PIL image, returns grayscale PIL
+    
+    An edge-preserving bilateral filter followed by CLAHE keeps text strokes
+    sharp and needs fewer passes over the pixels than separate contrast,
+    sharpness and median filter steps.
+    """
+    gray = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+    gray = cv2.bilateralFilter(gray, d=5, sigmaColor=50, sigmaSpace=50)
+    return Image.fromarray(CLAHE.apply(gray))
+
+
+# cv2.rotate codes for clockwise rotation angles (0 needs no rotation)
+CV2_ROTATIONS = {
+    90: cv2.ROTATE_90_CLOCKWISE,
+    180: cv2.ROTATE_180,
+    270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+}
+
+# Fast PNG encoding for temporary OCR inputs (level 1, pinned because the
+# OpenCV default differs between versions)
+FAST_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
+
+# 0° results at or above this combined quality skip the remaining rotations
+ROTATION_EARLY_EXIT_QUALITY = 0.55
+
+
+def write_rotated_png(gray_array, angle, directory):
+    """Write one rotation of a grayscale array to a fast-compressed PNG
+    
+    Returns the file path. Passing file paths to pytesseract avoids it
+    re-encoding the PIL image with default PNG settings on every call.
+    """
+    rotated = gray_array if angle == 0 else cv2.rotate(gray_array, CV2_ROTATIONS[angle])
+    path = os.path.join(directory, f"rotation_{angle}.png")
+    cv2.imwrite(path, rotated, FAST_PNG_PARAMS)
+    return path
+
+
+def timed_rotation_ocr(gray_array, angle, directory, config=r'--oem 3 --psm 6'):
+    """OCR one rotation of a grayscale array, returns (text, seconds)"""
+    start_time = time.time()
+    rotation_path = write_rotated_png(gray_array, angle, directory)
+    text = ocr_image(rotation_path, config)
+    return text, time.time() - start_time
+
+
+# Upper bound on processes used for the OCR configuration sweep
+CONFIG_SWEEP_MAX_WORKERS = 8
+
+# Preprocessed image held by each configuration sweep worker
+_config_worker_image = None
+
+
+def _init_config_worker(gray_array):
+    """Load the preprocessed image once per configuration sweep worker"""
+    global _config_worker_image
+    _config_worker_image = Image.fromarray(gray_array)
+
+
+def _run_config_job(config):
+    """OCR the worker's image with one config, returns (text, seconds, error)"""
+    start_time = time.time()
+    try:
+        text = ocr_image(_config_worker_image, config)
+        return text, time.time() - start_time, None
+    except Exception as e:
+        return "", 0, str(e)
+
+
+# tesserocr engines keyed by (lang, oem); both are fixed when an engine is created
+_TESSERACT_APIS = {}
+_PSM_PATTERN = re.compile(r'--psm\s+(\d+)')
+_OEM_PATTERN = re.compile(r'--oem\s+(\d+)')
+_LANG_PATTERN = re.compile(r'(?:^|\s)-l\s+(\S+)')
+
+
+def get_tesseract_api(lang='eng', oem=None):
+    """Shared tesserocr engine for a language and engine mode, initialised once per process"""
+    if oem is None:
+        oem = tesserocr.OEM.DEFAULT
+    key = (lang, int(oem))
+    api = _TESSERACT_APIS.get(key)
+    if api is None:
+        api = tesserocr.PyTessBaseAPI(lang=lang, oem=oem)
+        _TESSERACT_APIS[key] = api
+    return api
+
+
+def ocr_image(image, config=''):
+    """Extract English text from a PIL image or an image file path
+    
+    With tesserocr installed one engine per (-l, --oem) pair from config is
+    kept and reused, with the page segmentation mode applied per call.
+    Otherwise falls back to pytesseract, which starts Tesseract per call.
+    """
+    if tesserocr is None:
+        return pytesseract.image_to_string(image, lang='eng', config=config)
+    
+    lang_match = _LANG_PATTERN.search(config)
+    oem_match = _OEM_PATTERN.search(config)
+    api = get_tesseract_api(
+        lang_match.group(1) if lang_match else 'eng',
+        int(oem_match.group(1)) if oem_match else None,
+    )
+    match = _PSM_PATTERN.search(config)
+    api.SetPageSegMode(int(match.group(1)) if match else tesserocr.PSM.AUTO)
+    if isinstance(image, (str, os.PathLike)):
+        api.SetImageFile(str(image))
+    else:
+        api.SetImage(image)
+    return api.GetUTF8Text()
+
+
+@functools.lru_cache(maxsize=1)
+def get_tesseract_info():
+    """Tesseract version and installed languages (each needs a subprocess, so cached)"""
+    return pytesseract.get_tesseract_version(), pytesseract.get_languages()
+
+
 def check_tesseract_installation():
     """Check Tesseract installation and capabilities"""
     try:
-        version = pytesseract.get_tesseract_version()
+        version, languages = get_tesseract_info()
         print(f"? Tesseract version: {version}")
         
-        languages = pytesseract.get_languages()
         print(f"? Available languages: {languages}")
         
         if 'eng' in languages:
@@ -52,23 +343,24 @@ def check_tesseract_installation():
         return False
 
 
+@BufferedOutput()
 def simple_ocr_test(image_path):
     """Simple OCR test without preprocessing"""
     try:
         print(f"\n=== SIMPLE OCR TEST ===")
-        print(f"File: {image_path}")
+        print(f"File: {describe_image_source(image_path)}")
         
         # Check file
-        if not os.path.exists(image_path):
+        if not isinstance(image_path, np.ndarray) and not os.path.exists(image_path):
             print(f"? File not found: {image_path}")
             return None
             
         # Open image
-        image = Image.open(image_path)
+        image = open_pil_image(image_path)
         print(f"? Image opened: {image.size}, mode: {image.mode}")
         
         # Simple text extraction
-        text = pytesseract.image_to_string(image, lang='eng')
+        text = ocr_image(image)
         print(f"?? Extracted text ({len(text)} characters):")
         print("-" * 40)
         print(text[:500] + "..." if len(text) > 500 else text)
@@ -81,14 +373,15 @@ def simple_ocr_test(image_path):
         return None
 
 
+@BufferedOutput()
 def advanced_ocr_test(image_path):
     """Advanced OCR test with preprocessing"""
     try:
         print(f"\n=== ADVANCED OCR TEST ===")
-        print(f"File: {image_path}")
+        print(f"File: {describe_image_source(image_path)}")
         
         # Open image
-        image = Image.open(image_path)
+        image = open_pil_image(image_path)
         print(f"? Original image: {image.size}")
         
         # Convert to RGB if needed
@@ -96,32 +389,14 @@ def advanced_ocr_test(image_path):
             image = image.convert('RGB')
             print(f"? Converted to RGB")
         
-        # Scale small images
-        width, height = image.size
-        if width < 1000 or height < 1000:
-            scale_factor = max(1000/width, 1000/height)
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
-            image = image.resize((new_width, new_height), Image.LANCZOS)
-            print(f"? Scaled to: {new_width}x{new_height}")
-        
-        # Enhance contrast
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(1.5)
-        print(f"? Contrast enhanced")
-        
-        # Enhance sharpness
-        enhancer = ImageEnhance.Sharpness(image)
-        image = enhancer.enhance(2.0)
-        print(f"? Sharpness enhanced")
-        
-        # Convert to grayscale
-        image = image.convert('L')
-        print(f"? Converted to grayscale")
+        # Scale small (and very large) images
+        image, scaled = scale_for_ocr(image)
+        if scaled:
+            print(f"? Scaled to: {image.size[0]}x{image.size[1]}")
         
-        # Apply filter
-        image = image.filter(ImageFilter.MedianFilter(size=3))
-        print(f"? Filter applied")
+        # Grayscale, edge-preserving denoise and local contrast (CLAHE)
+        image = enhance_for_ocr(image)
+        print(f"? Converted to grayscale, denoised and contrast enhanced")
         
         # SAFE OCR configuration (no problematic characters)
         safe_config = r'--oem 3 --psm 6'
@@ -129,7 +404,7 @@ def advanced_ocr_test(image_path):
         print(f"? Using configuration: {safe_config}")
         
         # Extract text
-        text = pytesseract.image_to_string(image, lang='eng', config=safe_config)
+        text = ocr_image(image, safe_config)
         
         print(f"?? Extracted text ({len(text)} characters):")
         print("-" * 40)
@@ -138,7 +413,7 @@ def advanced_ocr_test(image_path):
         
         # Quality analysis
         if text.strip():
-            letters = sum(c.isalpha() for c in text)
+            letters, _, _ = classify_chars(text)
             total_chars = len(text.replace(' ', '').replace('\n', ''))
             quality_score = letters / total_chars if total_chars > 0 else 0
             
@@ -161,35 +436,29 @@ def advanced_ocr_test(image_path):
         return None
 
 
-def test_rotation_detection(image_path):
-    """NEW: Test automatic rotation detection"""
+@BufferedOutput()
+def test_rotation_detection(image_path, early_exit_quality=ROTATION_EARLY_EXIT_QUALITY):
+    """NEW: Test automatic rotation detection
+    
+    image_path may also be an already decoded numpy array. If the original
+    orientation reaches early_exit_quality the other angles are skipped;
+    pass None to always test every rotation.
+    """
     try:
         print(f"\n=== ROTATION DETECTION TEST ===")
-        print(f"File: {image_path}")
+        print(f"File: {describe_image_source(image_path)}")
         
         # Load image
-        image = Image.open(image_path)
+        image = open_pil_image(image_path)
         
         # Preprocess image (same as advanced test)
         if image.mode != 'RGB':
             image = image.convert('RGB')
         
-        width, height = image.size
-        if width < 1000 or height < 1000:
-            scale_factor = max(1000/width, 1000/height)
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
-            image = image.resize((new_width, new_height), Image.LANCZOS)
+        image, _ = scale_for_ocr(image)
         
         # Enhance image
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(1.5)
-        
-        enhancer = ImageEnhance.Sharpness(image)
-        image = enhancer.enhance(2.0)
-        
-        image = image.convert('L')
-        image = image.filter(ImageFilter.MedianFilter(size=3))
+        image = enhance_for_ocr(image)
         
         # Test all rotations
         rotations = [0, 90, 180, 270]
@@ -197,68 +466,85 @@ def test_rotation_detection(image_path):
         
         print(f"?? Testing {len(rotations)} rotation angles...")
         
-        for angle in rotations:
-            print(f"\n   Testing {angle} rotation:")
-            
-            # Rotate image if needed
-            if angle == 0:
-                test_image = image
-            else:
-                test_image = image.rotate(-angle, expand=True)
-            
-            # Extract text
-            start_time = time.time()
-            text = pytesseract.image_to_string(test_image, lang='eng', config=r'--oem 3 --psm 6')
-            ocr_time = time.time() - start_time
-            
-            # Calculate quality score
-            letters = sum(c.isalpha() for c in text)
-            digits = sum(c.isdigit() for c in text)
-            spaces = sum(c.isspace() for c in text)
-            total_chars = len(text.replace(' ', '').replace('\n', ''))
-            
-            quality_score = letters / total_chars if total_chars > 0 else 0.0
-            
-            # Count English-like words (simple heuristic)
-            words = text.split()
-            english_like_words = sum(1 for word in words if len(word) > 1 and word.isalpha())
-            word_quality = english_like_words / len(words) if words else 0.0
-            
-            # Combined quality score
-            combined_quality = (quality_score * 0.7) + (word_quality * 0.3)
-            
-            result = {
-                'angle': angle,
-                'text_length': len(text),
-                'letters': letters,
-                'quality_score': quality_score,
-                'word_quality': word_quality,
-                'combined_quality': combined_quality,
-                'ocr_time': ocr_time,
-                'text_preview': text[:100].replace('\n', ' ').strip()
-            }
-            
-            results.append(result)
+        gray_array = np.asarray(image)
+        
+        # Encode each rotation once with fast PNG settings. The executor is
+        # exited first, so running OCR threads finish before the PNGs go away.
+        with tempfile.TemporaryDirectory() as temp_dir, contextlib.ExitStack() as stack:
+            # pytesseract waits on a subprocess without holding the GIL, so the
+            # non-zero rotations can run concurrently. The shared tesserocr
+            # engine is not thread-safe and stays sequential.
+            executor = (stack.enter_context(ThreadPoolExecutor(max_workers=len(rotations) - 1))
+                        if tesserocr is None else None)
+            pending = {}
             
-            print(f"     Length: {len(text)}, Quality: {combined_quality:.2f}, Time: {ocr_time:.2f}s")
-            print(f"     Preview: {result['text_preview']}...")
+            for angle in rotations:
+                print(f"\n   Testing {angle}° rotation:")
+                
+                # Extract text
+                if angle in pending:
+                    text, ocr_time = pending.pop(angle).result()
+                else:
+                    text, ocr_time = timed_rotation_ocr(gray_array, angle, temp_dir)
+                
+                # Calculate quality score
+                letters, digits, spaces = classify_chars(text)
+                total_chars = len(text.replace(' ', '').replace('\n', ''))
+                
+                quality_score = letters / total_chars if total_chars > 0 else 0.0
+                
+                # Count English-like words (simple heuristic)
+                words = text.split()
+                english_like_words = sum(1 for word in words if len(word) > 1 and word.isalpha())
+                word_quality = english_like_words / len(words) if words else 0.0
+                
+                # Combined quality score
+                combined_quality = (quality_score * 0.7) + (word_quality * 0.3)
+                
+                result = {
+                    'angle': angle,
+                    'text_length': len(text),
+                    'letters': letters,
+                    'quality_score': quality_score,
+                    'word_quality': word_quality,
+                    'combined_quality': combined_quality,
+                    'ocr_time': ocr_time,
+                    'text_preview': text[:100].replace('\n', ' ').strip()
+                }
+                
+                results.append(result)
+                
+                print(f"     Length: {len(text)}, Quality: {combined_quality:.2f}, Time: {ocr_time:.2f}s")
+                print(f"     Preview: {result['text_preview']}...")
+                
+                if angle == 0:
+                    # Correctly oriented documents do not need the full sweep
+                    if early_exit_quality is not None and combined_quality >= early_exit_quality:
+                        print(f"     Original orientation passes {early_exit_quality:.2f}, skipping other rotations")
+                        break
+                    
+                    if executor is not None:
+                        pending = {
+                            other_angle: executor.submit(timed_rotation_ocr, gray_array, other_angle, temp_dir)
+                            for other_angle in rotations[1:]
+                        }
         
-        # Find best rotation
+        # Find best rotation (only the angles actually tested)
         best_result = max(results, key=lambda x: x['combined_quality'])
         best_angle = best_result['angle']
         
         print(f"\n?? BEST ROTATION ANALYSIS:")
-        print(f"   Best angle: {best_angle}")
+        print(f"   Best angle: {best_angle}°")
         print(f"   Best quality: {best_result['combined_quality']:.2f}")
         print(f"   Text length: {best_result['text_length']}")
         print(f"   Letters: {best_result['letters']}")
         
         # Compare with original
-        original_result = results[0]  # 0 is always first
+        original_result = results[0]  # 0° is always first
         if best_angle != 0:
             improvement = best_result['combined_quality'] - original_result['combined_quality']
             print(f"   Quality improvement: +{improvement:.2f}")
-            print(f"   ? Rotation recommended: {best_angle}")
+            print(f"   ? Rotation recommended: {best_angle}°")
         else:
             print(f"   ? Original orientation is best")
         
@@ -266,7 +552,7 @@ def test_rotation_detection(image_path):
         print(f"\n?? All rotation results:")
         for result in results:
             status = "?? BEST" if result['angle'] == best_angle else ""
-            print(f"   {result['angle']:3d}: Quality {result['combined_quality']:.2f}, "
+            print(f"   {result['angle']:3d}°: Quality {result['combined_quality']:.2f}, "
                   f"Length {result['text_length']:4d} {status}")
         
         return results, best_result
@@ -276,6 +562,7 @@ def test_rotation_detection(image_path):
         return [], None
 
 
+@BufferedOutput()
 def test_text_quality_analysis(test_texts=None):
     """NEW: Test text quality analyzer"""
     try:
@@ -290,18 +577,7 @@ def test_text_quality_analysis(test_texts=None):
         
         # Default test texts if none provided
         if test_texts is None:
-            test_texts = [
-                "This is a normal English sentence with proper structure and punctuation.",
-                "The quick brown fox jumps over the lazy dog. This sentence contains all letters.",
-                "aaaaaaaaaaa bbbbbbbb ccccccc",  # Repetitive
-                "abc xyz 123 !@# $%^ &*()",  # Low quality symbols
-                "Th1s 1s b4d qu4l1ty t3xt w1th numb3rs",  # Numbers in words
-                "",  # Empty
-                "A",  # Too short
-                "Hello world! This is good text with proper English words and structure.",
-                "asdfgh qwerty zxcvbn poiuyt",  # Random characters
-                "We can analyze the performance metrics to determine the optimal configuration parameters."  # Technical but good
-            ]
+            test_texts = DEFAULT_QUALITY_TEST_TEXTS
         
         print(f"?? Testing {len(test_texts)} text samples:")
         
@@ -356,6 +632,7 @@ def test_text_quality_analysis(test_texts=None):
         return []
 
 
+@BufferedOutput()
 def test_enhanced_ocr_processor(image_path):
     """NEW: Test the enhanced OCR processor with all features"""
     try:
@@ -409,7 +686,7 @@ def test_enhanced_ocr_processor(image_path):
                 rotation_info = document.metadata['rotation_info']
                 best_angle = rotation_info.get('best_angle', 0)
                 if best_angle != 0:
-                    print(f"   ?? Applied rotation: {best_angle}")
+                    print(f"   ?? Applied rotation: {best_angle}°")
                     print(f"   Quality improvement: +{rotation_info.get('quality_improvement', 0):.2f}")
                 else:
                     print(f"   ?? No rotation needed")
@@ -446,19 +723,27 @@ def test_enhanced_ocr_processor(image_path):
         return None
 
 
+@BufferedOutput()
 def test_opencv_processing(image_path):
     """Test OpenCV image processing"""
     try:
         print(f"\n=== OPENCV PROCESSING TEST ===")
         
         # Read image with OpenCV
-        img = cv2.imread(image_path)
+        try:
+            img = load_image_array(image_path)
+        except Exception:
+            img = None
         if img is None:
             print(f"? OpenCV cannot read file")
             return None
             
         print(f"? OpenCV read image: {img.shape}")
         
+        # OpenCV picks its vectorized (SSE/AVX) code paths at runtime
+        if not cv2.checkHardwareSupport(cv2.CPU_AVX2):
+            print(f"?? OpenCV build/CPU without AVX2 - filtering will use slower code paths")
+        
         # Convert to grayscale
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         print(f"? Converted to grayscale")
@@ -475,7 +760,7 @@ def test_opencv_processing(image_path):
         pil_image = Image.fromarray(thresh)
         
         # OCR with processed image
-        text = pytesseract.image_to_string(pil_image, lang='eng', config=r'--oem 3 --psm 6')
+        text = ocr_image(pil_image, r'--oem 3 --psm 6')
         
         print(f"?? Text after OpenCV processing ({len(text)} characters):")
         print("-" * 40)
@@ -489,12 +774,13 @@ def test_opencv_processing(image_path):
         return None
 
 
+@BufferedOutput()
 def test_different_configs(image_path):
     """Test different OCR configurations"""
     try:
         print(f"\n=== DIFFERENT OCR CONFIGURATIONS TEST ===")
         
-        image = Image.open(image_path)
+        image = open_pil_image(image_path)
         if image.mode != 'L':
             image = image.convert('L')
         
@@ -509,29 +795,40 @@ def test_different_configs(image_path):
         
         results = []
         
-        for name, config in configs:
-            try:
-                print(f"\n?? Testing: {name} ({config})")
-                start_time = time.time()
-                text = pytesseract.image_to_string(image, lang='eng', config=config)
-                ocr_time = time.time() - start_time
-                
-                if text.strip():
-                    letters = sum(c.isalpha() for c in text)
-                    total = len(text.replace(' ', '').replace('\n', ''))
-                    quality = letters / total if total > 0 else 0
-                    
-                    print(f"   Length: {len(text)}, Quality: {quality:.2f}, Time: {ocr_time:.2f}s")
-                    print(f"   Preview: {text[:100].replace(chr(10), ' ').strip()}...")
-                    
-                    results.append((name, len(text), quality, ocr_time, text))
-                else:
-                    print(f"   ? No text extracted")
-                    results.append((name, 0, 0, ocr_time, ""))
-                    
-            except Exception as e:
-                print(f"   ? Error: {e}")
+        # Configurations are independent Tesseract runs: spread them over
+        # processes that each receive the preprocessed image once. Inside a
+        # batch_test_suite worker the cores are already taken, so run serially.
+        config_strings = [config for _, config in configs]
+        if multiprocessing.parent_process() is not None:
+            _init_config_worker(np.asarray(image))
+            outcomes = [_run_config_job(config) for config in config_strings]
+        else:
+            max_workers = min(CONFIG_SWEEP_MAX_WORKERS, os.cpu_count() or 1, len(configs))
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_config_worker,
+                initargs=(np.asarray(image),)
+            ) as executor:
+                outcomes = list(executor.map(_run_config_job, config_strings))
+        
+        for (name, config), (text, ocr_time, error) in zip(configs, outcomes):
+            print(f"\n?? Testing: {name} ({config})")
+            
+            if error is not None:
+                print(f"   ? Error: {error}")
                 results.append((name, 0, 0, 0, ""))
+            elif text.strip():
+                letters, _, _ = classify_chars(text)
+                total = len(text.replace(' ', '').replace('\n', ''))
+                quality = letters / total if total > 0 else 0
+                
+                print(f"   Length: {len(text)}, Quality: {quality:.2f}, Time: {ocr_time:.2f}s")
+                print(f"   Preview: {text[:100].replace(chr(10), ' ').strip()}...")
+                
+                results.append((name, len(text), quality, ocr_time, text))
+            else:
+                print(f"   ? No text extracted")
+                results.append((name, 0, 0, ocr_time, ""))
         
         # Best results analysis
         if results:
@@ -547,17 +844,15 @@ def test_different_configs(image_path):
             
             # Recommend best overall configuration
             # Weight quality more than speed
-            scored_results = []
-            for name, length, quality, time, text in results:
-                if length > 0:
-                    # Combined score: 70% quality, 20% length, 10% speed
-                    speed_score = 1 / (time + 0.1)  # Avoid division by zero
-                    combined_score = (quality * 0.7) + (min(length/1000, 1.0) * 0.2) + (min(speed_score, 1.0) * 0.1)
-                    scored_results.append((name, combined_score, quality, length, time))
+            def combined_score(result):
+                # Combined score: 70% quality, 20% length, 10% speed (+0.1 avoids division by zero)
+                _, length, quality, ocr_time, _ = result
+                return (quality * 0.7) + (min(length / 1000, 1.0) * 0.2) + (min(1 / (ocr_time + 0.1), 1.0) * 0.1)
             
-            if scored_results:
-                best_overall = max(scored_results, key=lambda x: x[1])
-                print(f"   ?? RECOMMENDED: {best_overall[0]} (combined score: {best_overall[1]:.2f})")
+            with_text = [r for r in results if r[1] > 0]
+            if with_text:
+                best_overall = max(with_text, key=combined_score)
+                print(f"   ?? RECOMMENDED: {best_overall[0]} (combined score: {combined_score(best_overall):.2f})")
         
         return results
         
@@ -566,22 +861,33 @@ def test_different_configs(image_path):
         return []
 
 
-def find_test_images(directory="./data/634/2025"):
-    """Find test images for OCR testing"""
-    image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif']
-    images = []
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif'})
+
+
+def iter_files_with_extensions(directory, extensions):
+    """Lazily yield file paths under directory whose extension is in extensions
     
+    Unreadable directories are reported and skipped, like os.walk does.
+    """
     try:
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if any(file.lower().endswith(ext) for ext in image_extensions):
-                    images.append(os.path.join(root, file))
-                    if len(images) >= 10:  # Limit for testing
-                        break
-            if len(images) >= 10:
-                break
-                
-        return images
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    yield from iter_files_with_extensions(entry.path, extensions)
+                elif os.path.splitext(entry.name)[1].lower() in extensions:
+                    yield entry.path
+    except OSError as e:
+        print(f"?? Skipping unreadable directory {directory}: {e}")
+
+
+def find_test_images(directory="./data/634/2025", limit=10):
+    """Find test images for OCR testing"""
+    try:
+        return list(itertools.islice(iter_files_with_extensions(directory, IMAGE_EXTENSIONS), limit))
     except Exception as e:
         print(f"? Error finding images: {e}")
         return []
@@ -699,14 +1005,9 @@ def test_document_image_extraction():
         # Find DOCX files to test
         docx_files = []
         try:
-            for root, dirs, files in os.walk("./data/634/2025"):
-                for file in files:
-                    if file.lower().endswith('.docx'):
-                        docx_files.append(os.path.join(root, file))
-                        if len(docx_files) >= 5:  # Limit for testing
-                            break
-                if len(docx_files) >= 5:
-                    break
+            docx_files = list(itertools.islice(
+                iter_files_with_extensions("./data/634/2025", frozenset({'.docx'})), 5  # Limit for testing
+            ))
         except:
             pass
         
@@ -745,8 +1046,13 @@ def test_document_image_extraction():
                 
                 print(f"?? Testing OCR on first image: {image_name}")
                 
-                # Save to temporary file and test OCR
-                import tempfile
+                # Decode once in memory instead of round-tripping through disk
+                image_array = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
+                if image_array is None:
+                    print(f"? Could not decode image: {image_name}")
+                    return
+                
+                # OCRProcessor only accepts file paths, so it still needs a temp file
                 with tempfile.NamedTemporaryFile(suffix=image_format, delete=False) as temp_file:
                     temp_file.write(image_data)
                     temp_file_path = temp_file.name
@@ -754,14 +1060,13 @@ def test_document_image_extraction():
                 try:
                     # Test with enhanced OCR processor
                     test_enhanced_ocr_processor(temp_file_path)
-                    
-                    # Also test rotation detection on this image
-                    print(f"\n?? Testing rotation detection on extracted image...")
-                    test_rotation_detection(temp_file_path)
-                    
                 finally:
                     # Clean up temporary file
                     os.unlink(temp_file_path)
+                
+                # Also test rotation detection on this image
+                print(f"\n?? Testing rotation detection on extracted image...")
+                test_rotation_detection(image_array)
         else:
             print("? No images found in document")
             
@@ -769,6 +1074,7 @@ def test_document_image_extraction():
         print(f"? Document image extraction test error: {e}")
 
 
+@BufferedOutput()
 def comprehensive_test_suite(image_path):
     """Run comprehensive test suite on a single image"""
     print(f"\n" + "="*60)
@@ -834,31 +1140,36 @@ def comprehensive_test_suite(image_path):
     if enhanced_result:
         text_lengths['Enhanced OCR'] = len(enhanced_result.text)
     if best_rotation:
-        text_lengths[f'Best Rotation ({best_rotation["angle"]})'] = best_rotation['text_length']
+        text_lengths[f'Best Rotation ({best_rotation["angle"]}°)'] = best_rotation['text_length']
     
+    # Collect the per-entry summary lines and write them in one call
+    buf = []
     if text_lengths:
-        print("?? Text Length Comparison:")
-        sorted_lengths = sorted(text_lengths.items(), key=lambda x: x[1], reverse=True)
-        for method, length in sorted_lengths:
-            print(f"   {method:<20}: {length:4d} characters")
+        buf.append("?? Text Length Comparison:")
+        sorted_lengths = sorted(text_lengths.items(), key=operator.itemgetter(1), reverse=True)
+        buf.extend(f"   {method:<20}: {length:4d} characters" for method, length in sorted_lengths)
     
     # Show rotation analysis
     if rotation_results:
-        print(f"\n?? Rotation Analysis:")
+        buf.append(f"\n?? Rotation Analysis:")
         for result in rotation_results:
             status = "??" if best_rotation and result['angle'] == best_rotation['angle'] else "  "
-            print(f"   {status} {result['angle']:3d}: Quality {result['combined_quality']:.2f}, "
-                  f"Length {result['text_length']:4d}")
+            buf.append(f"   {status} {result['angle']:3d}°: Quality {result['combined_quality']:.2f}, "
+                       f"Length {result['text_length']:4d}")
     
     # Show configuration analysis  
     if config_results:
-        good_configs = [r for r in config_results if r[2] > 0.3]  # Quality > 0.3
-        print(f"\n?? Configuration Analysis:")
-        print(f"   Tested configurations: {len(config_results)}")
-        print(f"   Good quality results: {len(good_configs)}")
-        if good_configs:
-            best_config = max(good_configs, key=lambda x: x[2])
-            print(f"   Best configuration: {best_config[0]} (quality: {best_config[2]:.2f})")
+        config_qualities = np.fromiter((r[2] for r in config_results), dtype=np.float32, count=len(config_results))
+        good_indices = np.flatnonzero(config_qualities > 0.3)  # Quality > 0.3
+        buf.append(f"\n?? Configuration Analysis:")
+        buf.append(f"   Tested configurations: {len(config_results)}")
+        buf.append(f"   Good quality results: {len(good_indices)}")
+        if len(good_indices):
+            best_config = config_results[good_indices[config_qualities[good_indices].argmax()]]
+            buf.append(f"   Best configuration: {best_config[0]} (quality: {best_config[2]:.2f})")
+    
+    if buf:
+        sys.stdout.write("\n".join(buf) + "\n")
     
     # Enhanced OCR summary
     if enhanced_result:
@@ -868,7 +1179,7 @@ def comprehensive_test_suite(image_path):
             rotation_info = enhanced_result.metadata['rotation_info']
             best_angle = rotation_info.get('best_angle', 0)
             if best_angle != 0:
-                print(f"   Applied rotation: {best_angle}")
+                print(f"   Applied rotation: {best_angle}°")
                 improvement = rotation_info.get('quality_improvement', 0)
                 print(f"   Quality improvement: +{improvement:.2f}")
             else:
@@ -887,20 +1198,14 @@ def comprehensive_test_suite(image_path):
     print(f"\n?? RECOMMENDATIONS:")
     
     # Best method overall
-    best_length = 0
-    best_method = "None"
-    
-    for method, length in text_lengths.items():
-        if length > best_length:
-            best_length = length
-            best_method = method
+    best_method, best_length = max(text_lengths.items(), key=operator.itemgetter(1), default=("None", 0))
     
-    if best_method != "None":
+    if best_length > 0:
         print(f"   ?? Most text extracted: {best_method} ({best_length} chars)")
     
     # Rotation recommendation
     if best_rotation and best_rotation['angle'] != 0:
-        print(f"   ?? Rotation recommended: {best_rotation['angle']} "
+        print(f"   ?? Rotation recommended: {best_rotation['angle']}° "
               f"(quality improvement: +{best_rotation.get('combined_quality', 0) - rotation_results[0]['combined_quality']:.2f})")
     else:
         print(f"   ?? No rotation needed")
@@ -917,6 +1222,34 @@ def comprehensive_test_suite(image_path):
     return test_results
 
 
+def batch_test_suite(images, max_workers=None):
+    """Run comprehensive test suite on several images in parallel
+
+    Images are independent and OCR is CPU-bound, so each image is handled by
+    its own worker process. Tesseract itself uses ~4 threads per process, so
+    the pool is sized to cpu_count() // 4 by default.
+    """
+    if not images:
+        return {}
+    
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // 4)
+    
+    # Give every Tesseract child its share of cores (inherited by workers)
+    os.environ.setdefault('OMP_THREAD_LIMIT', '4')
+    os.environ.setdefault('OMP_NUM_THREADS', '4')
+    
+    print(f"?? Running comprehensive test suite on {len(images)} images "
+          f"({max_workers} worker processes)")
+    
+    all_results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for image_path, results in zip(images, executor.map(comprehensive_test_suite, images)):
+            all_results[image_path] = results
+    
+    return all_results
+
+
 def main():
     """Main function for enhanced OCR testing"""
     print("?? ENHANCED OCR DEBUG TEST SCRIPT - ENGLISH ONLY")
@@ -975,9 +1308,23 @@ def quick_test():
     return results
 
 
+def batch_test():
+    """Run comprehensive test suite on all found test images"""
+    print("? Batch OCR Test")
+    
+    images = find_test_images()
+    if not images:
+        print("? No test images found")
+        return
+    
+    return batch_test_suite(images)
+
+
 if __name__ == "__main__":
     # Check if running in quick mode
     if len(sys.argv) > 1 and sys.argv[1] == '--quick':
         quick_test()
+    elif len(sys.argv) > 1 and sys.argv[1] == '--batch':
+        batch_test()
     else:
         main()
\ No newline at end of file
@@ -9,18 +9,18 @@ try:
     reader = PdfReader(file_path)
     print(f"Successfully opened PDF. Number of pages: {len(reader.pages)}")
     
-    full_text = ""
+    any_text = False
     for i, page in enumerate(reader.pages):
         text = page.extract_text()
         if text:
             print(f"--- Text from Page {i+1} ---")
             print(text)
             print("----------------------")
-            full_text += text
+            any_text = True
         else:
             print(f"--- No text found on Page {i+1} ---")
 
-    if not full_text:
+    if not any_text:
         print("\nRESULT: No text could be extracted from this PDF file. It is likely an image-based or scanned document.")
     else:
         print("\nRESULT: Text was successfully extracted.")
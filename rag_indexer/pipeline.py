@@ -9,9 +9,14 @@ Workflow:
     Part 2 (LlamaIndex): Markdown  Chunks  Embeddings  Vectors
 """
 
+import os
 import sys
 import time
+import queue
 import argparse
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import warnings
@@ -26,22 +31,82 @@ warnings.filterwarnings(
     message='.*validate_default.*'
 )
 
-# Import Part 1: Docling
-from docling_processor import (
-    get_docling_config,
-    create_document_scanner,
-    create_document_converter
-)
+log = logging.getLogger('pipeline')
+
+# Project loggers shown at INFO level when running the pipeline
+PIPELINE_LOGGERS = ('pipeline', 'indexer', 'chunking_vectors', 'storage')
 
-# Import Part 2: Chunking & Vectors
-from chunking_vectors.config import get_config as get_chunking_config
-from indexer import main as run_indexer
+
+def iter_markdown_entries(root):
+    """
+    Recursively yield os.DirEntry objects for markdown files under root
+    
+    Prunes _metadata directories instead of walking and filtering them.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name == '_metadata':
+                    continue
+                yield from iter_markdown_entries(entry.path)
+            elif entry.name.endswith('.md'):
+                yield entry
+
+
+def build_markdown_index(root):
+    """
+    Walk root once and map each normalized markdown path to its mtime (ns)
+    
+    Returns an empty dict if root does not exist.
+    """
+    if not os.path.isdir(root):
+        return {}
+    return {
+        os.path.normpath(entry.path): entry.stat().st_mtime_ns
+        for entry in iter_markdown_entries(root)
+    }
+
+
+# Number of converted markdown files indexed together in overlapped mode
+OVERLAP_BATCH_SIZE = 16
+
+
+# Per-process Docling converter used by parallel Part 1 workers
+_worker_converter = None
+
+
+def _init_conversion_worker(config):
+    """Create one Docling converter per worker process (models are not fork-safe once loaded)"""
+    from docling_processor import create_document_converter
+    
+    global _worker_converter
+    _worker_converter = create_document_converter(config)
+
+
+def _convert_in_worker(file_path):
+    """
+    Convert a single file in a worker process
+    
+    Returns:
+        tuple: (success, output_path, error_msg, seconds, ocr_stats) where
+            ocr_stats holds this file's OCR counter increments
+    """
+    ocr_before = _worker_converter.ocr_stats_snapshot()
+    start_time = time.perf_counter()
+    success, output_path, error_msg = _worker_converter.convert_file(file_path)
+    seconds = time.perf_counter() - start_time
+    ocr_stats = {
+        key: value - ocr_before[key]
+        for key, value in _worker_converter.ocr_stats_snapshot().items()
+    }
+    return success, output_path, error_msg, seconds, ocr_stats
 
 
 class PipelineOrchestrator:
     """Orchestrator for the complete RAG pipeline"""
     
-    def __init__(self, incremental=False, skip_conversion=False, skip_indexing=False):
+    def __init__(self, incremental=False, skip_conversion=False, skip_indexing=False, workers=1,
+                 overlap=False):
         """
         Initialize pipeline orchestrator
         
@@ -49,12 +114,20 @@ class PipelineOrchestrator:
             incremental: Only process new/modified files
             skip_conversion: Skip Part 1 (Docling conversion)
             skip_indexing: Skip Part 2 (Vector indexing)
+            workers: Number of Part 1 conversion processes (1 = sequential)
+            overlap: Index converted markdown in batches while Part 1 is still running
         """
         self.incremental = incremental
         self.skip_conversion = skip_conversion
         self.skip_indexing = skip_indexing
+        self.workers = max(1, workers)
+        self.overlap = overlap
+        
+        # Markdown directory walks shared by Part 1 and Part 2: {root: {path: mtime_ns}}
+        self._markdown_index = {}
         
         self.stats = {
+            'wall_start': None,
             'start_time': None,
             'end_time': None,
             'total_time': 0,
@@ -67,27 +140,48 @@ class PipelineOrchestrator:
     
     def print_banner(self):
         """Print pipeline banner"""
-        print("\n" + "=" * 70)
-        print(" RAG COMPLETE PIPELINE")
-        print("=" * 70)
-        print(" Part 1: Raw Documents  Markdown (Docling)")
-        print(" Part 2: Markdown  Chunks  Vectors (LlamaIndex + Gemini)")
-        print("=" * 70)
+        lines = [
+            "\n" + "=" * 70,
+            " RAG COMPLETE PIPELINE",
+            "=" * 70,
+            " Part 1: Raw Documents  Markdown (Docling)",
+            " Part 2: Markdown  Chunks  Vectors (LlamaIndex + Gemini)",
+            "=" * 70,
+        ]
         
         mode = "INCREMENTAL" if self.incremental else "FULL"
-        print(f"Mode: {mode}")
+        lines.append(f"Mode: {mode}")
         
         if self.skip_conversion:
-            print("  Skipping Part 1 (Conversion)")
+            lines.append("  Skipping Part 1 (Conversion)")
         if self.skip_indexing:
-            print("  Skipping Part 2 (Indexing)")
+            lines.append("  Skipping Part 2 (Indexing)")
         
-        print("=" * 70 + "\n")
+        lines.append("=" * 70 + "\n")
+        print("\n".join(lines))
     
-    def run_part1_conversion(self):
+    def _get_markdown_index(self, root):
+        """
+        Get the markdown index for a directory, walking it only once
+        
+        Args:
+            root: Markdown directory
+        
+        Returns:
+            dict: {normalized markdown path: mtime_ns}
+        """
+        root = os.path.normpath(str(root))
+        if root not in self._markdown_index:
+            self._markdown_index[root] = build_markdown_index(root)
+        return self._markdown_index[root]
+    
+    def run_part1_conversion(self, on_complete=None):
         """
         Run Part 1: Document conversion
         
+        Args:
+            on_complete: Optional callback called with each converted markdown path
+        
         Returns:
             dict: Conversion statistics
         """
@@ -95,6 +189,13 @@ class PipelineOrchestrator:
             print(" Skipping Part 1: Document conversion")
             return {'skipped': True}
         
+        # Import Part 1 only when it runs (Docling is slow to import)
+        from docling_processor import (
+            get_docling_config,
+            create_document_scanner,
+            create_document_converter
+        )
+        
         print("\n" + "=" * 70)
         print(" PART 1: DOCUMENT CONVERSION (Docling)")
         print("=" * 70)
@@ -117,25 +218,32 @@ class PipelineOrchestrator:
             if self.incremental:
                 files_to_process = scanner.filter_already_converted(
                     files_to_process,
-                    incremental=True
+                    incremental=True,
+                    markdown_index=self._get_markdown_index(config.MARKDOWN_OUTPUT_DIR)
                 )
                 
                 if not files_to_process:
                     print("\n All files already converted")
                     return {'files': 0, 'success': True, 'skipped': False, 'already_converted': True}
             
-            # Create converter
-            print("\n Initializing converter...")
-            converter = create_document_converter(config)
-            
             # Convert documents
-            start_time = time.time()
-            results = converter.convert_batch(files_to_process)
-            conversion_time = time.time() - start_time
+            start_time = time.perf_counter()
+            workers = min(self.workers, len(files_to_process))
+            if workers > 1:
+                results = self._convert_in_parallel(config, files_to_process, workers, on_complete)
+            else:
+                print("\n Initializing converter...")
+                converter = create_document_converter(config)
+                results = converter.convert_batch(files_to_process, on_complete=on_complete)
+            conversion_time = time.perf_counter() - start_time
             
             # Store stats
             self.stats['documents_converted'] = results['successful']
             
+            # New markdown files were written, the cached walk is stale now
+            if results['successful'] > 0:
+                self._markdown_index.clear()
+            
             print(f"\n Part 1 completed in {conversion_time/60:.1f} minutes")
             print(f"   Converted: {results['successful']}/{results['total_files']} files")
             
@@ -152,17 +260,57 @@ class PipelineOrchestrator:
             print(f"\n Part 1 failed: {e}")
             return {'success': False, 'error': str(e), 'skipped': False}
     
-    def run_part2_indexing(self):
+    def _convert_in_parallel(self, config, files_to_process, workers, on_complete=None):
+        """
+        Convert files across worker processes, each with its own converter
+        
+        Args:
+            config: DoclingConfig instance
+            files_to_process: List of file paths
+            workers: Number of worker processes
+            on_complete: Optional callback called with each converted markdown path
+        
+        Returns:
+            dict: Aggregated conversion statistics
+        """
+        from docling_processor import DocumentConverter
+        
+        print(f"\n Converting {len(files_to_process)} files with {workers} worker processes...")
+        
+        # Same progress, summary and OCR statistics as the sequential convert_batch()
+        reporter = DocumentConverter.for_reporting(config)
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_conversion_worker,
+            initargs=(config,)
+        ) as executor:
+            outcomes = executor.map(_convert_in_worker, files_to_process)
+            return reporter.record_batch(files_to_process, outcomes, on_complete=on_complete)
+    
+    def run_part2_indexing(self, incremental=None, file_paths=None, interactive=True):
         """
         Run Part 2: Vector indexing (with optional incremental mode)
         
+        Args:
+            incremental: Override self.incremental (None = use pipeline setting)
+            file_paths: Only index these markdown files (None = whole markdown directory)
+            interactive: Allow the indexer to prompt on the console
+        
         Returns:
             bool: Success status
         """
+        if incremental is None:
+            incremental = self.incremental
+        
         if self.skip_indexing:
             print(" Skipping Part 2: Vector indexing")
             return True
         
+        # Import Part 2 only when it runs (pulls in llama-index and embeddings)
+        from chunking_vectors.config import get_config as get_chunking_config
+        from indexer import main as run_indexer
+        
         print("\n" + "=" * 70)
         print(" PART 2: VECTOR INDEXING (LlamaIndex + Gemini)")
         print("=" * 70)
@@ -177,10 +325,11 @@ class PipelineOrchestrator:
                 print("   Run Part 1 first to convert documents")
                 return False
             
-            # Count markdown files
-            markdown_files = list(markdown_dir.glob("**/*.md"))
-            # Filter out _metadata directory
-            markdown_files = [f for f in markdown_files if '_metadata' not in f.parts]
+            # Count markdown files (skipping the _metadata directory)
+            if file_paths is None:
+                markdown_files = list(self._get_markdown_index(markdown_dir))
+            else:
+                markdown_files = list(file_paths)
             
             if not markdown_files:
                 print(f"\n No markdown files found in {markdown_dir}")
@@ -189,29 +338,99 @@ class PipelineOrchestrator:
             
             print(f"\n Found {len(markdown_files)} markdown files")
             
-            # Set incremental mode via environment variable
-            if self.incremental:
+            if incremental:
                 print(f" Incremental mode: ENABLED")
-                import os
-                os.environ['INCREMENTAL_MODE'] = 'true'
             else:
                 print(f" Incremental mode: DISABLED (full reindex)")
             
             # Run indexer
-            start_time = time.time()
-            success = run_indexer()
-            indexing_time = time.time() - start_time
+            start_time = time.perf_counter()
+            success = run_indexer(incremental=incremental, file_paths=file_paths, interactive=interactive)
+            indexing_time = time.perf_counter() - start_time
             
             print(f"\n Part 2 completed in {indexing_time/60:.1f} minutes")
             
             return success
             
+        except SystemExit as e:
+            # The indexer exits on configuration errors; keep the pipeline (and Part 1) alive
+            print(f"\n Part 2 failed: indexer exited with status {e.code}")
+            return False
         except Exception as e:
             print(f"\n Part 2 failed: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Part 2 failed")
             return False
     
+    def run_overlapped(self):
+        """
+        Run Part 1 in a background thread and index its output as it arrives
+        
+        Converted markdown paths are queued by Part 1; the main thread indexes
+        exactly those files in batches of OVERLAP_BATCH_SIZE, without console
+        prompts. Once Part 1 has finished, a final pass indexes the rest of the
+        markdown directory: an incremental run (batch files are already marked
+        as indexed) or, in full mode, every file no batch has covered.
+        
+        Returns:
+            tuple: (conversion results dict, indexing success bool)
+        """
+        completed = queue.Queue()
+        conversion_results = {}
+        
+        def part1_worker():
+            try:
+                conversion_results.update(self.run_part1_conversion(on_complete=completed.put))
+            finally:
+                completed.put(None)  # Sentinel: Part 1 finished
+        
+        producer = threading.Thread(target=part1_worker, name='part1-conversion', daemon=True)
+        producer.start()
+        
+        indexing_success = True
+        batch_number = 0
+        finished = False
+        indexed_paths = set()
+        
+        while not finished:
+            batch = []
+            while len(batch) < OVERLAP_BATCH_SIZE:
+                markdown_path = completed.get()
+                if markdown_path is None:
+                    finished = True
+                    break
+                batch.append(markdown_path)
+            
+            if batch:
+                batch_number += 1
+                print(f"\n Overlapped indexing batch {batch_number}: {len(batch)} new markdown files")
+                batch_paths = [os.path.abspath(str(path)) for path in batch]
+                indexed_paths.update(batch_paths)
+                batch_success = self.run_part2_indexing(file_paths=batch_paths, interactive=False)
+                indexing_success = batch_success and indexing_success
+        
+        producer.join()
+        
+        # Final pass over what the batches did not cover (pre-existing markdown,
+        # or everything if Part 1 converted nothing)
+        self._markdown_index.clear()
+        print("\n Overlapped indexing: final pass")
+        if self.incremental:
+            final_success = self.run_part2_indexing()
+        else:
+            from chunking_vectors.config import get_config as get_chunking_config
+            markdown_dir = get_chunking_config().DOCUMENTS_DIR
+            remaining = [
+                path for path in self._get_markdown_index(markdown_dir)
+                if os.path.abspath(path) not in indexed_paths
+            ]
+            if remaining or not indexed_paths:
+                final_success = self.run_part2_indexing(file_paths=remaining or None)
+            else:
+                print(" All markdown files were indexed by the overlapped batches")
+                final_success = True
+        
+        return conversion_results, indexing_success and final_success
+    
     def run_pipeline(self):
         """
         Run the complete pipeline
@@ -219,11 +438,16 @@ class PipelineOrchestrator:
         Returns:
             bool: True if successful
         """
-        self.stats['start_time'] = time.time()
+        # Wall-clock time is only shown to the user; durations use perf_counter
+        self.stats['wall_start'] = datetime.now()
+        self.stats['start_time'] = time.perf_counter()
         
         # Print banner
         self.print_banner()
         
+        if self.overlap and not self.skip_conversion and not self.skip_indexing:
+            return self._run_overlapped_pipeline()
+        
         # Part 1: Document Conversion
         conversion_results = self.run_part1_conversion()
         self.stats['conversion_stats'] = conversion_results
@@ -245,7 +469,7 @@ class PipelineOrchestrator:
             return False
         
         # Success!
-        self.stats['end_time'] = time.time()
+        self.stats['end_time'] = time.perf_counter()
         self.stats['total_time'] = self.stats['end_time'] - self.stats['start_time']
         self.stats['success'] = True
         
@@ -253,55 +477,83 @@ class PipelineOrchestrator:
         
         return True
     
+    def _run_overlapped_pipeline(self):
+        """
+        Run Part 1 and Part 2 concurrently and record pipeline stats
+        
+        Returns:
+            bool: True if successful
+        """
+        conversion_results, indexing_success = self.run_overlapped()
+        self.stats['conversion_stats'] = conversion_results
+        self.stats['indexing_stats'] = {'success': indexing_success}
+        
+        self.stats['end_time'] = time.perf_counter()
+        self.stats['total_time'] = self.stats['end_time'] - self.stats['start_time']
+        self.stats['success'] = conversion_results.get('success', False) and indexing_success
+        
+        if not self.stats['success']:
+            print("\n Pipeline finished with errors (overlapped mode)")
+        
+        self._print_final_summary()
+        
+        return self.stats['success']
+    
     def _print_final_summary(self):
         """Print final pipeline summary"""
-        print("\n" + "=" * 70)
-        print(" PIPELINE SUMMARY")
-        print("=" * 70)
+        lines = [
+            "\n" + "=" * 70,
+            " PIPELINE SUMMARY",
+            "=" * 70,
+        ]
+        
+        if self.stats['wall_start']:
+            lines.append(f"  Started: {self.stats['wall_start'].strftime('%Y-%m-%d %H:%M:%S')}")
         
-        if self.stats['start_time'] and self.stats['end_time']:
+        if self.stats['start_time'] is not None and self.stats['end_time'] is not None:
             total_time = self.stats['total_time']
-            print(f"  Total time: {total_time/60:.1f} minutes ({total_time:.1f} seconds)")
+            lines.append(f"  Total time: {total_time/60:.1f} minutes ({total_time:.1f} seconds)")
         
         # Part 1 stats
         if self.stats['conversion_stats']:
             conv = self.stats['conversion_stats']
-            print(f"\n Part 1 (Conversion):")
+            lines.append(f"\n Part 1 (Conversion):")
             
             if conv.get('skipped'):
-                print(f"    Skipped by user")
+                lines.append(f"    Skipped by user")
             elif conv.get('already_converted'):
-                print(f"    All files already converted (incremental mode)")
+                lines.append(f"    All files already converted (incremental mode)")
             else:
-                print(f"   Files processed: {conv.get('total', 0)}")
-                print(f"    Successful: {conv.get('successful', 0)}")
-                print(f"    Failed: {conv.get('failed', 0)}")
+                lines.append(f"   Files processed: {conv.get('total', 0)}")
+                lines.append(f"    Successful: {conv.get('successful', 0)}")
+                lines.append(f"    Failed: {conv.get('failed', 0)}")
                 if conv.get('time'):
-                    print(f"     Time: {conv['time']/60:.1f} minutes")
+                    lines.append(f"     Time: {conv['time']/60:.1f} minutes")
         
         # Part 2 stats
         if self.stats['indexing_stats']:
             idx = self.stats['indexing_stats']
-            print(f"\n Part 2 (Indexing):")
+            lines.append(f"\n Part 2 (Indexing):")
             
             if self.skip_indexing:
-                print(f"    Skipped by user")
+                lines.append(f"    Skipped by user")
             elif idx.get('success'):
-                print(f"    Completed successfully")
-                print(f"   Check database for indexed vectors")
+                lines.append(f"    Completed successfully")
+                lines.append(f"   Check database for indexed vectors")
             else:
-                print(f"    Failed (see logs above)")
+                lines.append(f"    Failed (see logs above)")
         
         # Final status
-        print(f"\n" + "=" * 70)
+        lines.append(f"\n" + "=" * 70)
         if self.stats['success']:
-            print(" PIPELINE COMPLETED SUCCESSFULLY!")
-            print(" Your RAG system is ready to use")
+            lines.append(" PIPELINE COMPLETED SUCCESSFULLY!")
+            lines.append(" Your RAG system is ready to use")
         else:
-            print(" PIPELINE COMPLETED WITH ERRORS")
-            print("  Check logs above for details")
+            lines.append(" PIPELINE COMPLETED WITH ERRORS")
+            lines.append("  Check logs above for details")
         
-        print("=" * 70 + "\n")
+        lines.append("=" * 70 + "\n")
+        print("\n".join(lines))
 
 
 def main():
@@ -327,6 +579,12 @@ Examples:
   
   # Full reindex (convert all + reindex all)
   python pipeline.py --full
+  
+  # Convert with 4 parallel Docling processes
+  python pipeline.py --workers 4
+  
+  # Index converted files while conversion is still running
+  python pipeline.py --overlap
         """
     )
     
@@ -354,6 +612,19 @@ Examples:
         help='Run only Part 2 (vector indexing)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of parallel Docling conversion processes (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--overlap',
+        action='store_true',
+        help='Index converted files in batches while Part 1 is still running'
+    )
+    
     args = parser.parse_args()
     
     # Validate arguments
@@ -365,6 +636,16 @@ Examples:
         print(" Error: Cannot use --incremental and --full together")
         sys.exit(1)
     
+    if args.workers < 1 or args.workers > (os.cpu_count() or 1):
+        print(f" Error: --workers must be between 1 and {os.cpu_count() or 1}")
+        sys.exit(1)
+    
+    # Root logger on stdout like indexer.main(), but third-party loggers (Docling,
+    # LlamaIndex, HTTP clients) stay at WARNING; only our own modules log INFO
+    logging.basicConfig(stream=sys.stdout, level=logging.WARNING)
+    for name in PIPELINE_LOGGERS:
+        logging.getLogger(name).setLevel(logging.INFO)
+    
     # Determine mode
     incremental = args.incremental
     skip_conversion = args.indexing_only
@@ -375,7 +656,9 @@ Examples:
         orchestrator = PipelineOrchestrator(
             incremental=incremental,
             skip_conversion=skip_conversion,
-            skip_indexing=skip_indexing
+            skip_indexing=skip_indexing,
+            workers=args.workers,
+            overlap=args.overlap
         )
         
         success = orchestrator.run_pipeline()
@@ -388,8 +671,7 @@ Examples:
         
     except Exception as e:
         print(f"\n\n Pipeline failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Pipeline failed")
         sys.exit(1)
 
 
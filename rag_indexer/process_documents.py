@@ -5,15 +5,14 @@ Main script for converting documents to markdown using Docling
 Entry point for Part 1: Document -> Markdown conversion
 """
 
+import argparse
+import logging
+import os
 import sys
 import time
 from datetime import datetime
 
-from docling_processor import (
-    get_docling_config,
-    create_document_scanner,
-    create_document_converter
-)
+log = logging.getLogger('process_documents')
 
 
 def main(incremental=False):
@@ -34,6 +33,13 @@ def main(incremental=False):
     
     start_time = time.time()
     
+    # Imported here so that importing this module does not load Docling
+    from docling_processor import (
+        get_docling_config,
+        create_document_scanner,
+        create_document_converter
+    )
+    
     try:
         # Load configuration
         print("\n[*] Loading configuration...")
@@ -104,15 +110,12 @@ def main(incremental=False):
         
     except Exception as e:
         print(f"\n\n[-] FATAL ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Conversion failed")
         sys.exit(1)
 
 
-if __name__ == "__main__":
-    # Parse command line arguments
-    import argparse
-    
+def _build_parser():
+    """Build the command line argument parser"""
     parser = argparse.ArgumentParser(
         description="Convert documents to markdown using Docling"
     )
@@ -131,16 +134,20 @@ if __name__ == "__main__":
         type=str,
         help='Output directory (overrides config)'
     )
+    return parser
+
+
+if __name__ == "__main__":
+    # Parse command line arguments
+    args = _build_parser().parse_args()
     
-    args = parser.parse_args()
+    logging.basicConfig(stream=sys.stdout, level=logging.WARNING)
     
     # Override config if needed
     if args.input:
-        import os
         os.environ['RAW_DOCUMENTS_DIR'] = args.input
     
     if args.output:
-        import os
         os.environ['MARKDOWN_OUTPUT_DIR'] = args.output
     
     # Run conversion
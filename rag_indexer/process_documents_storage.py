@@ -15,7 +15,13 @@ Usage:
 
 import os
 import sys
+import time
+import asyncio
 import argparse
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -32,6 +38,199 @@ from chunking_vectors.registry_manager import DocumentRegistryManager
 load_dotenv()
 
 
+# Per-process converter used by --workers N
+_worker_converter = None
+
+
+def _init_conversion_worker(config, enable_ocr: bool, ocr_strategy: str):
+    """Create one Storage-enabled converter per worker process (Docling models load here)."""
+    global _worker_converter
+    _worker_converter = DocumentConverter(
+        config,
+        enable_ocr_enhancement=enable_ocr,
+        ocr_strategy=ocr_strategy,
+        storage_manager=SupabaseStorageManager(),
+        registry_manager=DocumentRegistryManager(os.getenv('SUPABASE_CONNECTION_STRING'))
+    )
+
+
+def _convert_in_worker(doc_record: dict) -> tuple:
+    """Convert one Storage document in a worker, returns (success, error_msg, conversion seconds)."""
+    (success, _, error_msg), conversion_time = _worker_converter.convert_from_storage_timed(doc_record)
+    return success, error_msg, conversion_time
+
+
+def _start_in_background(fn, *args, **kwargs) -> Future:
+    """
+    Run fn in a daemon thread and return a Future for its result.
+
+    Unlike ThreadPoolExecutor workers, a daemon thread is not joined at
+    interpreter exit, so sys.exit() on an early path does not wait for it.
+    """
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name='converter-warmup', daemon=True).start()
+    return future
+
+
+def convert_in_processes(config, pending_docs: list, args, registry_manager) -> dict:
+    """
+    Convert Storage documents across worker processes, one document per task.
+
+    Docling conversion is CPU-bound and holds the GIL, so separate processes
+    are needed to use more than one core. If a worker dies (e.g. a PDF that
+    crashes Docling), the pool breaks: documents a worker had started (marked
+    'processing') are marked failed in the registry, and documents that never
+    started are resubmitted to a new pool.
+
+    Args:
+        config: DoclingConfig instance
+        pending_docs: Pending document records from the registry
+        args: Parsed command line arguments
+        registry_manager: DocumentRegistryManager used to check and mark crashed documents
+
+    Returns:
+        dict: Aggregated conversion statistics
+    """
+    print(f"\n[*] Converting {len(pending_docs)} documents with {args.workers} worker processes...")
+
+    stats = {
+        'total_files': len(pending_docs),
+        'successful': 0,
+        'failed': 0,
+        'total_time': 0,
+        'failed_files': []
+    }
+    batch_start_time = time.time()
+
+    def record_failure(doc, error_msg):
+        stats['failed'] += 1
+        stats['failed_files'].append({
+            'file': doc['original_filename'],
+            'registry_id': doc['id'],
+            'error': error_msg,
+            'timestamp': datetime.now().isoformat()
+        })
+
+    remaining = list(pending_docs)
+    while remaining:
+        not_started = []
+
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_conversion_worker,
+            initargs=(config, args.enable_ocr, args.ocr_strategy)
+        ) as executor:
+            # One task per document so one slow document does not hold back others
+            futures = [executor.submit(_convert_in_worker, doc) for doc in remaining]
+            for doc, future in zip(remaining, futures):
+                try:
+                    success, error_msg, file_time = future.result()
+                except Exception as e:
+                    # Still 'pending' means no worker downloaded it: its file is
+                    # untouched in raw/pending and it can be converted later
+                    if registry_manager.get_status_by_id(doc['id']) == 'pending':
+                        not_started.append(doc)
+                        continue
+                    if isinstance(e, BrokenProcessPool):
+                        success, error_msg, file_time = False, "Worker process crashed", 0
+                    else:
+                        success, error_msg, file_time = False, str(e), 0
+                    registry_manager.update_storage_status(doc['id'], 'failed')
+
+                if success:
+                    stats['successful'] += 1
+                    stats['total_time'] += file_time
+                else:
+                    record_failure(doc, error_msg)
+
+        if len(not_started) == len(remaining):
+            # No document got started (e.g. workers fail to initialize); stop
+            # retrying and leave them 'pending' for the next run
+            print(f"[!] {len(not_started)} documents could not be started, left pending")
+            for doc in not_started:
+                record_failure(doc, "Not started (left pending)")
+            break
+
+        if not_started:
+            print(f"[!] Worker pool crashed, resubmitting {len(not_started)} documents that had not started")
+        remaining = not_started
+
+    stats['total_batch_time'] = time.time() - batch_start_time
+
+    print(f"\n[+] Successful: {stats['successful']}")
+    print(f"[-] Failed: {stats['failed']}")
+    print(f"[*] Total time: {stats['total_batch_time']:.1f}s")
+
+    return stats
+
+
+def enqueue_documents(pending_docs: list, args) -> int:
+    """
+    Enqueue one conversion task per pending document.
+
+    Args:
+        pending_docs: Pending document records from the registry
+        args: Parsed command line arguments
+
+    Returns:
+        int: Process exit code
+    """
+    from celery import group
+    from tasks import convert_one
+
+    print(f"\n[*] Enqueuing {len(pending_docs)} documents for Celery workers...")
+
+    # Only JSON-safe fields the conversion needs
+    job = group(
+        convert_one.s(
+            {
+                'id': str(doc['id']),
+                'storage_path': doc['storage_path'],
+                'original_filename': doc['original_filename']
+            },
+            args.enable_ocr,
+            args.ocr_strategy
+        )
+        for doc in pending_docs
+    )
+    group_result = job.apply_async()
+
+    print(f"[+] Enqueued {len(pending_docs)} tasks (group id: {group_result.id})")
+
+    if not args.wait:
+        return 0
+
+    print("[*] Waiting for workers to finish...")
+    results = group_result.get(propagate=False)
+
+    failed = [r for r in results if not isinstance(r, dict) or not r.get('success')]
+    print(f"[+] Successful: {len(results) - len(failed)}")
+    print(f"[-] Failed: {len(failed)}")
+
+    return 1 if failed else 0
+
+
+def print_summary():
+    """Print the completion banner and next steps."""
+    print("\n" + "=" * 60)
+    print("PROCESSING COMPLETE")
+    print("=" * 60)
+
+    print(f"\n[*] Next steps:")
+    print(f"   1. Run indexing pipeline to create vector embeddings:")
+    print(f"      cd {Path(__file__).parent.parent}")
+    print(f"      python rag_indexer/indexer.py")
+    print(f"\n   2. Or use full pipeline (if markdown files need re-indexing):")
+    print(f"      python rag_indexer/pipeline.py")
+
+
 def main():
     """Main entry point for Storage-based document processing."""
     parser = argparse.ArgumentParser(
@@ -53,6 +252,9 @@ Examples:
 
   # Dry run (show what would be processed)
   python process_documents_storage.py --dry-run
+
+  # Hand documents to Celery workers (see tasks.py) and wait for results
+  python process_documents_storage.py --queue --wait
         """
     )
 
@@ -77,6 +279,32 @@ Examples:
         help='OCR strategy to use (default: fallback)'
     )
 
+    parser.add_argument(
+        '--concurrent-downloads',
+        type=int,
+        default=4,
+        help='Documents downloaded/moved in parallel while Docling converts (default: 4)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Convert documents in N worker processes (default: 1, in-process)'
+    )
+
+    parser.add_argument(
+        '--queue',
+        action='store_true',
+        help='Enqueue one Celery task per document instead of converting here (see tasks.py)'
+    )
+
+    parser.add_argument(
+        '--wait',
+        action='store_true',
+        help='With --queue, wait for all tasks and report results'
+    )
+
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -118,6 +346,20 @@ Examples:
     # 3. Scan for Pending Documents
     # ================================================
 
+    # The in-process path needs a converter; start loading Docling models now
+    # so they warm up while the registry is queried
+    converter_future = None
+    if not (args.dry_run or args.queue or args.workers > 1):
+        print("\n[*] Initializing document converter (in background)...")
+        converter_future = _start_in_background(
+            DocumentConverter,
+            config,
+            enable_ocr_enhancement=args.enable_ocr,
+            ocr_strategy=args.ocr_strategy,
+            storage_manager=storage_manager,
+            registry_manager=registry_manager
+        )
+
     print("\n[*] Scanning for pending documents...")
 
     scanner = create_document_scanner(config, registry_manager)
@@ -141,19 +383,21 @@ Examples:
         print("\n[*] Run without --dry-run to actually process documents")
         sys.exit(0)
 
+    if args.queue:
+        sys.exit(enqueue_documents(pending_docs, args))
+
+    if args.workers > 1:
+        stats = convert_in_processes(config, pending_docs, args, registry_manager)
+        print_summary()
+        sys.exit(1 if stats.get('failed', 0) > 0 else 0)
+
     # ================================================
     # 5. Initialize Converter with Storage Support
     # ================================================
 
-    print("\n[*] Initializing document converter...")
+    print("\n[*] Waiting for document converter...")
 
-    converter = DocumentConverter(
-        config,
-        enable_ocr_enhancement=args.enable_ocr,
-        ocr_strategy=args.ocr_strategy,
-        storage_manager=storage_manager,
-        registry_manager=registry_manager
-    )
+    converter = converter_future.result()
 
     # ================================================
     # 6. Process Documents from Storage
@@ -161,22 +405,16 @@ Examples:
 
     print(f"\n[*] Processing {len(pending_docs)} documents from Storage...")
 
-    stats = converter.convert_batch_from_storage(pending_docs)
+    stats = asyncio.run(converter.convert_batch_from_storage_async(
+        pending_docs,
+        max_downloads=max(1, args.concurrent_downloads)
+    ))
 
     # ================================================
     # 7. Print Summary
     # ================================================
 
-    print("\n" + "=" * 60)
-    print("PROCESSING COMPLETE")
-    print("=" * 60)
-
-    print(f"\n[*] Next steps:")
-    print(f"   1. Run indexing pipeline to create vector embeddings:")
-    print(f"      cd {Path(__file__).parent.parent}")
-    print(f"      python rag_indexer/indexer.py")
-    print(f"\n   2. Or use full pipeline (if markdown files need re-indexing):")
-    print(f"      python rag_indexer/pipeline.py")
+    print_summary()
 
     # Exit with error code if any files failed
     if stats.get('failed', 0) > 0:
@@ -14,14 +14,18 @@ Usage:
 
 import os
 import sys
+import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from supabase import create_client, Client
+from supabase import Client
+
+from storage.supabase_singleton import get_supabase_client
 
 # Load environment variables
 load_dotenv()
@@ -34,7 +38,8 @@ class StorageSetup:
         self,
         supabase_url: str,
         supabase_key: str,
-        bucket_name: str = 'vehicle-documents'
+        bucket_name: str = 'vehicle-documents',
+        verbose: bool = False
     ):
         """
         Initialize Storage setup.
@@ -43,12 +48,49 @@ class StorageSetup:
             supabase_url: Supabase project URL
             supabase_key: Supabase service role key
             bucket_name: Name of bucket to create
+            verbose: Print extra details (e.g. number of existing buckets)
         """
         self.supabase_url = supabase_url
         self.supabase_key = supabase_key
         self.bucket_name = bucket_name
+        self.verbose = verbose
         self.client: Client = None
 
+        # list_buckets() result reused by bucket_exists/verify_setup
+        self._buckets_cache = None
+        self._buckets_by_name = {}
+        self._buckets_cache_ts = 0
+
+    def _list_buckets_cached(self, ttl: float = 30) -> list:
+        """
+        List buckets, reusing the previous result for up to ttl seconds.
+
+        Args:
+            ttl: Cache lifetime in seconds
+
+        Returns:
+            list: Bucket objects
+        """
+        now = time.monotonic()
+        if self._buckets_cache is None or now - self._buckets_cache_ts > ttl:
+            self._buckets_cache = self.client.storage.list_buckets()
+            self._buckets_by_name = {b.name: b for b in self._buckets_cache}
+            self._buckets_cache_ts = now
+        return self._buckets_cache
+
+    def _list_buckets_by_name(self, ttl: float = 30) -> dict:
+        """
+        Cached buckets keyed by name.
+
+        Args:
+            ttl: Cache lifetime in seconds
+
+        Returns:
+            dict: {bucket name: Bucket}
+        """
+        self._list_buckets_cached(ttl)
+        return self._buckets_by_name
+
     def connect(self) -> bool:
         """
         Connect to Supabase.
@@ -60,13 +102,14 @@ class StorageSetup:
             print(f"[*] Connecting to Supabase...")
             print(f"    URL: {self.supabase_url}")
 
-            self.client = create_client(self.supabase_url, self.supabase_key)
+            self.client = get_supabase_client(self.supabase_url, self.supabase_key)
 
-            # Test connection by listing buckets
-            buckets = self.client.storage.list_buckets()
+            # No separate probe request: the first real call (bucket_exists or
+            # verify_setup) surfaces connection errors
+            print(f"[+] Client initialized")
 
-            print(f"[+] Connected successfully")
-            print(f"    Existing buckets: {len(buckets)}")
+            if self.verbose:
+                print(f"    Existing buckets: {len(self._list_buckets_cached())}")
 
             return True
 
@@ -82,8 +125,7 @@ class StorageSetup:
             bool: True if bucket exists
         """
         try:
-            buckets = self.client.storage.list_buckets()
-            exists = any(b.name == self.bucket_name for b in buckets)
+            exists = self.bucket_name in self._list_buckets_by_name()
 
             if exists:
                 print(f"[+] Bucket '{self.bucket_name}' already exists")
@@ -122,6 +164,9 @@ class StorageSetup:
                 }
             )
 
+            # Bucket list changed
+            self._buckets_cache = None
+
             print(f"[+] Bucket created successfully")
             print(f"    Name: {self.bucket_name}")
             print(f"    Public: No (private)")
@@ -134,6 +179,7 @@ class StorageSetup:
 
             # Check if bucket already exists (not an error)
             if 'already exists' in error_str.lower() or '42P07' in error_str:
+                self._buckets_cache = None
                 print(f"[+] Bucket '{self.bucket_name}' already exists (not an error)")
                 return True
 
@@ -162,7 +208,8 @@ class StorageSetup:
             # Create a small placeholder content
             placeholder = b'# This folder is managed by the RAG system\n'
 
-            for folder in folders:
+            def _upload_one(folder):
+                """Upload one placeholder, returns (folder, status message)"""
                 try:
                     path = f"{folder}/.gitkeep"
 
@@ -176,14 +223,18 @@ class StorageSetup:
                         }
                     )
 
-                    print(f"    [+] Created: {folder}/")
+                    return folder, f"    [+] Created: {folder}/"
 
                 except Exception as folder_error:
                     # If file already exists, that's OK
                     if 'already exists' in str(folder_error).lower():
-                        print(f"    [+] Exists: {folder}/")
-                    else:
-                        print(f"    [!] Warning: Could not create {folder}/: {folder_error}")
+                        return folder, f"    [+] Exists: {folder}/"
+                    return folder, f"    [!] Warning: Could not create {folder}/: {folder_error}"
+
+            # Independent uploads: one round-trip of latency instead of one per folder
+            with ThreadPoolExecutor(max_workers=len(folders)) as executor:
+                for folder, message in executor.map(_upload_one, folders):
+                    print(message)
 
             print(f"[+] Folder structure created")
             return True
@@ -192,10 +243,13 @@ class StorageSetup:
             print(f"[-] Failed to create folder structure: {e}")
             return False
 
-    def verify_setup(self) -> bool:
+    def verify_setup(self, deep: bool = False) -> bool:
         """
         Verify Storage setup is correct.
 
+        Args:
+            deep: Also run the upload/download/delete round-trip check
+
         Returns:
             bool: True if verification passed
         """
@@ -207,8 +261,7 @@ class StorageSetup:
         # Check 1: Bucket exists
         checks_total += 1
         try:
-            buckets = self.client.storage.list_buckets()
-            bucket = next((b for b in buckets if b.name == self.bucket_name), None)
+            bucket = self._list_buckets_by_name().get(self.bucket_name)
 
             if bucket:
                 print(f"    [✓] Bucket '{self.bucket_name}' exists")
@@ -224,9 +277,9 @@ class StorageSetup:
         # Check 2: Can list files
         checks_total += 1
         try:
-            files = self.client.storage.from_(self.bucket_name).list()
+            # One entry is enough to prove list permission
+            self.client.storage.from_(self.bucket_name).list(options={'limit': 1})
             print(f"    [✓] Can list files in bucket")
-            print(f"        Files/folders: {len(files)}")
             checks_passed += 1
         except Exception as e:
             print(f"    [✗] Cannot list files: {e}")
@@ -237,9 +290,11 @@ class StorageSetup:
             folders_found = 0
             expected_folders = ['raw']
 
-            files = self.client.storage.from_(self.bucket_name).list()
+            # A folder exists if it has at least one entry; ask for just one
+            # instead of listing the whole bucket root
             for folder in expected_folders:
-                if any(f.get('name') == folder for f in files):
+                entries = self.client.storage.from_(self.bucket_name).list(folder, {'limit': 1})
+                if entries:
                     folders_found += 1
 
             if folders_found > 0:
@@ -251,30 +306,34 @@ class StorageSetup:
         except Exception as e:
             print(f"    [✗] Error checking folders: {e}")
 
-        # Check 4: Test upload/download
-        checks_total += 1
-        try:
-            test_path = 'raw/pending/.test'
-            test_content = b'test'
-
-            # Upload
-            self.client.storage.from_(self.bucket_name).upload(
-                path=test_path,
-                file=test_content,
-                file_options={'upsert': 'true'}
-            )
+        # Check 4: Test upload/download (three write/read round-trips, only on request)
+        if not deep:
+            # Not run, so not counted as passed or failed
+            print(f"    [!] Upload/download/delete skipped (use --deep-verify)")
+        else:
+            checks_total += 1
+            try:
+                test_path = 'raw/pending/.test'
+                test_content = b'test'
 
-            # Download
-            downloaded = self.client.storage.from_(self.bucket_name).download(test_path)
+                # Upload
+                self.client.storage.from_(self.bucket_name).upload(
+                    path=test_path,
+                    file=test_content,
+                    file_options={'upsert': 'true'}
+                )
 
-            # Delete
-            self.client.storage.from_(self.bucket_name).remove([test_path])
+                # Download
+                downloaded = self.client.storage.from_(self.bucket_name).download(test_path)
 
-            print(f"    [✓] Upload/download/delete works")
-            checks_passed += 1
+                # Delete
+                self.client.storage.from_(self.bucket_name).remove([test_path])
 
-        except Exception as e:
-            print(f"    [✗] Upload/download/delete failed: {e}")
+                print(f"    [✓] Upload/download/delete works")
+                checks_passed += 1
+
+            except Exception as e:
+                print(f"    [✗] Upload/download/delete failed: {e}")
 
         # Summary
         print(f"\n[*] Verification Summary:")
@@ -287,12 +346,13 @@ class StorageSetup:
             print(f"    [-] Some checks failed")
             return False
 
-    def run_setup(self, verify_only: bool = False) -> bool:
+    def run_setup(self, verify_only: bool = False, deep_verify: bool = False) -> bool:
         """
         Run complete setup process.
 
         Args:
             verify_only: If True, only verify without creating
+            deep_verify: If True, verification also tests upload/download/delete
 
         Returns:
             bool: True if setup successful
@@ -307,7 +367,7 @@ class StorageSetup:
 
         if verify_only:
             # Only verify
-            return self.verify_setup()
+            return self.verify_setup(deep=deep_verify)
 
         # Step 2: Check if bucket exists
         exists = self.bucket_exists()
@@ -325,7 +385,7 @@ class StorageSetup:
             print(f"    Folders will be created automatically when files are uploaded")
 
         # Step 5: Verify setup
-        if not self.verify_setup():
+        if not self.verify_setup(deep=deep_verify):
             print(f"\n[-] Setup verification failed")
             return False
 
@@ -355,9 +415,15 @@ Examples:
   # Only verify existing setup
   python setup_storage.py --verify-only
 
+  # Verify including an upload/download/delete round-trip
+  python setup_storage.py --verify-only --deep-verify
+
   # Use custom bucket name
   python setup_storage.py --bucket-name my-custom-bucket
 
+  # Signed URL a producer can PUT a file to directly
+  python setup_storage.py --mint-upload-url raw/pending/report.pdf
+
   # Show what would be done (dry run)
   python setup_storage.py --dry-run
         """
@@ -376,6 +442,26 @@ Examples:
         help='Only verify setup, do not create anything'
     )
 
+    parser.add_argument(
+        '--deep-verify',
+        action='store_true',
+        help='Also test upload/download/delete during verification (writes to the bucket)'
+    )
+
+    parser.add_argument(
+        '--mint-upload-url',
+        action='append',
+        metavar='PATH',
+        default=[],
+        help='Print a signed upload URL for PATH (e.g. raw/pending/doc.pdf); repeatable'
+    )
+
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Print extra details'
+    )
+
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -418,11 +504,24 @@ Examples:
         print(f"\nRun without --dry-run to actually create")
         sys.exit(0)
 
+    if args.mint_upload_url:
+        from storage.storage_manager import SupabaseStorageManager
+
+        try:
+            storage_manager = SupabaseStorageManager(supabase_url, supabase_key, bucket_name)
+            urls = storage_manager.create_upload_urls(args.mint_upload_url)
+        except Exception as e:
+            print(f"[-] Could not create upload URLs: {e}")
+            sys.exit(1)
+        for path, url in urls.items():
+            print(f"{path}\t{url}")
+        sys.exit(0)
+
     # Run setup
-    setup = StorageSetup(supabase_url, supabase_key, bucket_name)
+    setup = StorageSetup(supabase_url, supabase_key, bucket_name, verbose=args.verbose)
 
     try:
-        success = setup.run_setup(verify_only=args.verify_only)
+        success = setup.run_setup(verify_only=args.verify_only, deep_verify=args.deep_verify)
         sys.exit(0 if success else 1)
 
     except KeyboardInterrupt:
@@ -5,24 +5,130 @@ Test and Compare Hybrid Chunking vs SentenceSplitter
 Comprehensive testing script for migration validation
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import json
 import time
+import argparse
+import functools
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from chunking_vectors.config import Config
-from chunking_vectors.markdown_loader import MarkdownLoader
-from llama_index.core.node_parser import SentenceSplitter
-from llama_index.core import Document
+# llama_index, numpy and the chunkers are imported where they are
+# used, so --help and test discovery don't pay their startup cost
+if TYPE_CHECKING:
+    from chunking_vectors.config import Config
+    from llama_index.core import Document
+    from llama_index.core.node_parser import SentenceSplitter
+
+
+@functools.lru_cache(maxsize=1)
+def _load_hybrid_chunker_factory():
+    """
+    Probe hybrid chunking support once (imports docling-core / transformers).
+
+    Returns:
+        create_hybrid_chunker, or None if hybrid chunking is not available
+    """
+    try:
+        from chunking_vectors.hybrid_chunker import create_hybrid_chunker, is_hybrid_chunking_available
+    except ImportError:
+        return None
+    return create_hybrid_chunker if is_hybrid_chunking_available() else None
+
+
+# Documents handed to a chunking worker per task (amortizes pickling/IPC)
+CHUNK_TASK_SIZE = 4
+
+# Per-process chunker, built once by _init_chunk_worker so it is never pickled
+_worker_chunker = None
+
+
+def _create_sentence_splitter(config: Config) -> SentenceSplitter:
+    """Create the SentenceSplitter used for the comparison"""
+    from llama_index.core.node_parser import SentenceSplitter
+
+    chunk_settings = config.get_chunk_settings()
+    return SentenceSplitter(
+        chunk_size=chunk_settings['chunk_size'],
+        chunk_overlap=chunk_settings['chunk_overlap'],
+        paragraph_separator="\n\n",
+        include_metadata=True
+    )
+
+
+def _split_documents(splitter: SentenceSplitter, docs: List[Document]) -> list:
+    """Chunk documents with one splitter call, isolating failures per document"""
+    try:
+        # One call for all documents shares the splitter setup
+        return splitter.get_nodes_from_documents(docs)
+    except Exception as e:
+        # Fall back to per-document chunking to isolate the failing file(s)
+        print(f"   ⚠️  Batch chunking failed ({e}), retrying per document...")
+        chunks = []
+        for doc in docs:
+            try:
+                nodes = splitter.get_nodes_from_documents([doc])
+                chunks.extend(nodes)
+            except Exception as e:
+                print(f"   ⚠️  Error chunking {doc.metadata.get('file_name', 'unknown')}: {e}")
+                continue
+        return chunks
+
+
+def _init_chunk_worker(method: str, config: Config):
+    """Build the chunker once per worker process"""
+    global _worker_chunker
+    if method == 'hybrid':
+        config.USE_HYBRID_CHUNKING = True
+        _worker_chunker = _load_hybrid_chunker_factory()(config)
+    else:
+        _worker_chunker = _create_sentence_splitter(config)
+
+
+def _chunk_one(args) -> list:
+    """Chunk a single document with the worker's chunker"""
+    method, doc = args
+    if method == 'hybrid':
+        return _worker_chunker.chunk_documents([doc])
+    return _split_documents(_worker_chunker, [doc])
+
+
+def chunk_in_processes(method: str, docs: List[Document], config: Config, workers: int) -> list:
+    """
+    Chunk documents across worker processes (chunking is CPU-bound, so threads don't help).
+
+    Args:
+        method: 'sentence' or 'hybrid'
+        docs: Documents to chunk
+        config: Chunking configuration (each worker builds its own chunker from it)
+        workers: Number of worker processes
+
+    Returns:
+        list: Chunks in document order
+    """
+    chunks = []
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_chunk_worker,
+                             initargs=(method, config)) as executor:
+        tasks = [(method, doc) for doc in docs]
+        for nodes in executor.map(_chunk_one, tasks, chunksize=CHUNK_TASK_SIZE):
+            chunks.extend(nodes)
+    return chunks
 
 
 def load_test_documents(config: Config, limit: int = None) -> List[Document]:
     """Load test documents from markdown directory"""
+    from chunking_vectors.markdown_loader import MarkdownLoader
+
     print("📁 Loading test documents...")
 
     loader = MarkdownLoader(
@@ -40,46 +146,59 @@ def load_test_documents(config: Config, limit: int = None) -> List[Document]:
     return docs
 
 
-def test_sentence_splitter(docs: List[Document], config: Config) -> Dict[str, Any]:
+def summarize_chunks(chunks: List) -> Dict[str, Any]:
+    """Compute size stats, metadata keys and chunk type counts"""
+    import numpy as np
+
+    # Chunk lengths are extracted once into an array; all size stats reduce it in C
+    sizes = np.fromiter((len(c.text) for c in chunks), dtype=np.int64, count=len(chunks))
+
+    if not len(sizes):
+        size_min = size_max = size_total = 0
+    else:
+        size_min, size_max, size_total = sizes.min(), sizes.max(), sizes.sum()
+
+    # Metadata keys and chunk types are collected in the same pass
+    metadata_keys = set()
+    chunk_types = Counter()
+    for c in chunks:
+        metadata_keys.update(c.metadata)
+        chunk_types[c.metadata.get('chunk_type', 'unknown')] += 1
+
+    return {
+        'chunk_size_min': int(size_min),
+        'chunk_size_max': int(size_max),
+        'chunk_size_avg': int(size_total) / len(chunks) if chunks else 0,
+        'metadata_keys': sorted(metadata_keys),
+        'chunk_types': dict(chunk_types)
+    }
+
+
+def test_sentence_splitter(docs: List[Document], config: Config, workers: int = 1) -> Dict[str, Any]:
     """Test SentenceSplitter chunking"""
     print("\n🧪 Testing SentenceSplitter...")
 
-    chunk_settings = config.get_chunk_settings()
-    splitter = SentenceSplitter(
-        chunk_size=chunk_settings['chunk_size'],
-        chunk_overlap=chunk_settings['chunk_overlap'],
-        paragraph_separator="\n\n",
-        include_metadata=True
-    )
-
-    start_time = time.time()
-    chunks = []
+    start_time = time.perf_counter()
 
-    for doc in docs:
-        try:
-            nodes = splitter.get_nodes_from_documents([doc])
-            chunks.extend(nodes)
-        except Exception as e:
-            print(f"   ⚠️  Error chunking {doc.metadata.get('file_name', 'unknown')}: {e}")
-            continue
+    if workers > 1:
+        chunks = chunk_in_processes('sentence', docs, config, workers)
+    else:
+        chunks = _split_documents(_create_sentence_splitter(config), docs)
 
-    processing_time = time.time() - start_time
+    processing_time = time.perf_counter() - start_time
 
     # Analyze chunks
-    chunk_sizes = [len(c.text) for c in chunks]
-    metadata_keys = set()
-    for c in chunks:
-        metadata_keys.update(c.metadata.keys())
+    summary = summarize_chunks(chunks)
 
     results = {
         'method': 'SentenceSplitter',
         'total_chunks': len(chunks),
         'processing_time': processing_time,
         'chunks_per_doc': len(chunks) / len(docs) if docs else 0,
-        'chunk_size_min': min(chunk_sizes) if chunk_sizes else 0,
-        'chunk_size_max': max(chunk_sizes) if chunk_sizes else 0,
-        'chunk_size_avg': sum(chunk_sizes) / len(chunk_sizes) if chunk_sizes else 0,
-        'metadata_keys': sorted(metadata_keys),
+        'chunk_size_min': summary['chunk_size_min'],
+        'chunk_size_max': summary['chunk_size_max'],
+        'chunk_size_avg': summary['chunk_size_avg'],
+        'metadata_keys': summary['metadata_keys'],
         'sample_chunks': [
             {
                 'text': c.text[:200] + '...' if len(c.text) > 200 else c.text,
@@ -96,14 +215,14 @@ def test_sentence_splitter(docs: List[Document], config: Config) -> Dict[str, An
     return results
 
 
-def test_hybrid_chunker(docs: List[Document], config: Config) -> Dict[str, Any]:
+def test_hybrid_chunker(docs: List[Document], config: Config, workers: int = 1,
+                        verbose: bool = False) -> Dict[str, Any]:
     """Test HybridChunker"""
     print("\n🧪 Testing HybridChunker...")
 
     try:
-        from chunking_vectors.hybrid_chunker import create_hybrid_chunker, is_hybrid_chunking_available
-
-        if not is_hybrid_chunking_available():
+        create_hybrid_chunker = _load_hybrid_chunker_factory()
+        if create_hybrid_chunker is None:
             print("   ❌ Hybrid chunking not available!")
             print("   Install with: pip install 'docling-core[chunking]' transformers")
             return None
@@ -111,33 +230,29 @@ def test_hybrid_chunker(docs: List[Document], config: Config) -> Dict[str, Any]:
         # Enable hybrid chunking
         config.USE_HYBRID_CHUNKING = True
 
-        chunker = create_hybrid_chunker(config)
-
-        start_time = time.time()
-        chunks = chunker.chunk_documents(docs)
-        processing_time = time.time() - start_time
+        if workers > 1:
+            start_time = time.perf_counter()
+            chunks = chunk_in_processes('hybrid', docs, config, workers)
+        else:
+            chunker = create_hybrid_chunker(config)
 
-        # Analyze chunks
-        chunk_sizes = [len(c.text) for c in chunks]
-        metadata_keys = set()
-        for c in chunks:
-            metadata_keys.update(c.metadata.keys())
+            start_time = time.perf_counter()
+            chunks = chunker.chunk_documents(docs)
+        processing_time = time.perf_counter() - start_time
 
-        # Count chunk types
-        chunk_types = {}
-        for c in chunks:
-            chunk_type = c.metadata.get('chunk_type', 'unknown')
-            chunk_types[chunk_type] = chunk_types.get(chunk_type, 0) + 1
+        # Analyze chunks (sizes, metadata keys and chunk types)
+        summary = summarize_chunks(chunks)
+        chunk_types = summary['chunk_types']
 
         results = {
             'method': 'HybridChunker',
             'total_chunks': len(chunks),
             'processing_time': processing_time,
             'chunks_per_doc': len(chunks) / len(docs) if docs else 0,
-            'chunk_size_min': min(chunk_sizes) if chunk_sizes else 0,
-            'chunk_size_max': max(chunk_sizes) if chunk_sizes else 0,
-            'chunk_size_avg': sum(chunk_sizes) / len(chunk_sizes) if chunk_sizes else 0,
-            'metadata_keys': sorted(metadata_keys),
+            'chunk_size_min': summary['chunk_size_min'],
+            'chunk_size_max': summary['chunk_size_max'],
+            'chunk_size_avg': summary['chunk_size_avg'],
+            'metadata_keys': summary['metadata_keys'],
             'chunk_types': chunk_types,
             'sample_chunks': [
                 {
@@ -160,8 +275,8 @@ def test_hybrid_chunker(docs: List[Document], config: Config) -> Dict[str, Any]:
 
     except Exception as e:
         print(f"   ❌ Hybrid chunking failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if verbose:
+            traceback.print_exc()
         return None
 
 
@@ -243,8 +358,17 @@ def compare_results(sentence_results: Dict, hybrid_results: Dict):
     print()
 
 
-def save_comparison_report(sentence_results: Dict, hybrid_results: Dict, output_dir: str = "./reports"):
-    """Save comparison report to JSON"""
+def save_comparison_report(sentence_results: Dict, hybrid_results: Dict, output_dir: str = "./reports",
+                           compact: bool = False):
+    """
+    Save comparison report to JSON
+
+    Args:
+        sentence_results: SentenceSplitter results
+        hybrid_results: HybridChunker results (or None)
+        output_dir: Directory for the report
+        compact: Write without indentation (roughly half the file size)
+    """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -266,7 +390,12 @@ def save_comparison_report(sentence_results: Dict, hybrid_results: Dict, output_
 
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+            if compact:
+                dump_kwargs = {'separators': (',', ':'), 'ensure_ascii': False}
+            else:
+                dump_kwargs = {'indent': 2, 'ensure_ascii': False}
+
+            json.dump(report, f, **dump_kwargs)
 
         print(f"📄 Comparison report saved: {output_path}")
         return str(output_path)
@@ -278,10 +407,21 @@ def save_comparison_report(sentence_results: Dict, hybrid_results: Dict, output_
 
 def main():
     """Main test function"""
+    parser = argparse.ArgumentParser(description="Compare HybridChunker with SentenceSplitter")
+    parser.add_argument('--workers', type=int, default=1,
+                        help=f"Chunk in N worker processes (e.g. {os.cpu_count()}); default 1 = in-process")
+    parser.add_argument('--compact', action='store_true',
+                        help="Write the JSON report without indentation")
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help="Print full tracebacks for failures")
+    args = parser.parse_args()
+
     print("=" * 80)
     print("🧪 HYBRID CHUNKING TEST & COMPARISON")
     print("=" * 80)
 
+    from chunking_vectors.config import Config
+
     # Load config
     try:
         config = Config()
@@ -299,26 +439,26 @@ def main():
             return 1
     except Exception as e:
         print(f"❌ Failed to load documents: {e}")
-        import traceback
-        traceback.print_exc()
+        if args.verbose:
+            traceback.print_exc()
         return 1
 
     # Test SentenceSplitter
     try:
-        sentence_results = test_sentence_splitter(docs, config)
+        sentence_results = test_sentence_splitter(docs, config, workers=args.workers)
     except Exception as e:
         print(f"❌ SentenceSplitter test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if args.verbose:
+            traceback.print_exc()
         return 1
 
     # Test HybridChunker
     try:
-        hybrid_results = test_hybrid_chunker(docs, config)
+        hybrid_results = test_hybrid_chunker(docs, config, workers=args.workers, verbose=args.verbose)
     except Exception as e:
         print(f"❌ HybridChunker test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if args.verbose:
+            traceback.print_exc()
         hybrid_results = None
 
     # Compare results
@@ -326,7 +466,7 @@ def main():
         compare_results(sentence_results, hybrid_results)
 
         # Save report
-        save_comparison_report(sentence_results, hybrid_results)
+        save_comparison_report(sentence_results, hybrid_results, compact=args.compact)
 
         print("\n✅ Test completed successfully!")
         return 0
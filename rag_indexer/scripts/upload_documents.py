@@ -13,7 +13,11 @@ Usage:
 import os
 import sys
 import logging
+import hashlib
 import argparse
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 
@@ -34,20 +38,58 @@ logger = logging.getLogger(__name__)
 # Load environment
 load_dotenv()
 
+# Read size for streaming file hashes
+HASH_BLOCK_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=4096)
+def _sha256_file(path: str, mtime_ns: int, size: int) -> str:
+    """
+    SHA256 of a file, streamed in 1 MiB blocks.
+
+    mtime_ns and size are part of the cache key, so an edited file is re-hashed.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def file_sha256(path) -> str:
+    """SHA256 of a file, memoized per (path, mtime, size)."""
+    path = os.fspath(path)
+    st = os.stat(path)
+    return _sha256_file(path, st.st_mtime_ns, st.st_size)
+
 
 class DocumentUploader:
     """Upload documents to Supabase Storage and create registry entries."""
 
-    SUPPORTED_EXTENSIONS = ['.pdf', '.docx', '.pptx', '.doc', '.ppt']
+    SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.docx', '.pptx', '.doc', '.ppt'})
+
+    # Registry entries whose content counts as already uploaded ('failed' can be retried)
+    LIVE_STORAGE_STATUSES = ('pending', 'processing', 'processed')
 
-    def __init__(self):
-        """Initialize uploader with Storage Manager and Registry Manager."""
+    def __init__(self, force: bool = False):
+        """
+        Initialize uploader with Storage Manager and Registry Manager.
+
+        Args:
+            force: Upload files even if the same content is already registered
+        """
         connection_string = os.getenv('SUPABASE_CONNECTION_STRING')
         if not connection_string:
             raise ValueError("SUPABASE_CONNECTION_STRING not set in environment")
 
         self.storage_manager = SupabaseStorageManager()
         self.registry_manager = DocumentRegistryManager(connection_string)
+        self.force = force
+
+        # Content hashes claimed in this run: {file_hash: (file path, Future[bool])};
+        # the future resolves to whether that first copy was uploaded
+        self._run_hashes = {}
+        self._run_hashes_lock = threading.Lock()
 
         logger.info("DocumentUploader initialized")
 
@@ -55,7 +97,8 @@ class DocumentUploader:
         self,
         file_path: str,
         document_type: Optional[str] = None,
-        vehicle_id: Optional[str] = None
+        vehicle_id: Optional[str] = None,
+        file_size: Optional[int] = None
     ) -> bool:
         """
         Upload a single file to Storage and create registry entry.
@@ -64,31 +107,21 @@ class DocumentUploader:
             file_path: Path to the file
             document_type: Type of document (insurance, nct, etc.)
             vehicle_id: UUID of vehicle (if known)
+            file_size: Size in bytes from an earlier scan (file is known to exist)
 
         Returns:
             bool: Success status
         """
-        try:
-            file_path = Path(file_path)
+        upload_result = self._upload_to_storage(file_path, document_type, file_size)
+        if not upload_result:
+            return False
 
-            if not file_path.exists():
-                logger.error(f"File not found: {file_path}")
-                return False
+        if upload_result.get('duplicate_of'):
+            return True
 
-            if file_path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
-                logger.warning(f"Skipping unsupported file type: {file_path}")
-                return False
-
-            logger.info(f"Uploading {file_path.name}...")
-
-            # Upload to Storage
-            upload_result = self.storage_manager.upload_document(
-                file=str(file_path),
-                original_filename=file_path.name,
-                document_type=document_type,
-                target_folder='raw/pending'
-            )
+        file_name = Path(file_path).name
 
+        try:
             # Create registry entry
             registry_id = self.registry_manager.create_entry_from_storage(
                 storage_path=upload_result['storage_path'],
@@ -96,26 +129,118 @@ class DocumentUploader:
                 file_size=upload_result['file_size'],
                 content_type=upload_result['content_type'],
                 document_type=document_type,
-                vehicle_id=vehicle_id
+                vehicle_id=vehicle_id,
+                file_hash=upload_result['file_hash']
             )
 
             if registry_id:
-                logger.info(f"✓ Successfully uploaded {file_path.name} (registry_id: {registry_id})")
+                logger.info(f"✓ Successfully uploaded {file_name} (registry_id: {registry_id})")
                 return True
             else:
-                logger.error(f"✗ Failed to create registry entry for {file_path.name}")
+                logger.error(f"✗ Failed to create registry entry for {file_name}")
                 return False
 
         except Exception as e:
             logger.error(f"✗ Failed to upload {file_path}: {e}")
             return False
 
+    def _upload_to_storage(
+        self,
+        file_path: str,
+        document_type: Optional[str] = None,
+        file_size: Optional[int] = None
+    ) -> Optional[dict]:
+        """
+        Upload a single file to Storage without touching the registry.
+
+        Args:
+            file_path: Path to the file
+            document_type: Type of document (insurance, nct, etc.)
+            file_size: Size in bytes from an earlier scan (file is known to exist)
+
+        Returns:
+            dict: upload_document() result plus 'file_hash';
+                {'duplicate_of': registry_id or file path, ...} if the same
+                content is already registered or was uploaded earlier in this
+                run (unless force is set); None if skipped/failed
+
+        A duplicate within the run waits for the first copy's upload and only
+        counts as done if it succeeded; otherwise it is uploaded itself.
+        """
+        # Cheap string check first: unsupported files never build a Path
+        if not self.is_supported(os.fspath(file_path)):
+            logger.warning(f"Skipping unsupported file type: {file_path}")
+            return None
+
+        file_hash = None
+        run_claim = None
+        upload_ok = False
+        try:
+            file_path = Path(file_path)
+
+            if file_size is None and not file_path.exists():
+                logger.error(f"File not found: {file_path}")
+                return None
+
+            file_hash = file_sha256(file_path)
+
+            if not self.force:
+                # Same content twice in this run: upload it once
+                while run_claim is None:
+                    with self._run_hashes_lock:
+                        first_claim = self._run_hashes.get(file_hash)
+                        if first_claim is None:
+                            run_claim = self._run_hashes[file_hash] = (str(file_path), Future())
+                    if first_claim is not None:
+                        first_path, first_upload = first_claim
+                        if first_upload.result():
+                            logger.info(f"Skipping duplicate {file_path.name} (same content as {first_path})")
+                            return {'duplicate_of': first_path, 'file_hash': file_hash}
+                        # The first copy failed and released its claim: try this one
+
+                # Skip content that is already in Storage from a previous run
+                existing = self.registry_manager.find_by_file_hash(
+                    file_hash, storage_statuses=self.LIVE_STORAGE_STATUSES
+                )
+                if existing:
+                    logger.info(f"Skipping duplicate {file_path.name} (registry_id: {existing['id']})")
+                    upload_ok = True
+                    return {'duplicate_of': str(existing['id']), 'file_hash': file_hash}
+
+            logger.info(f"Uploading {file_path.name}...")
+
+            # Upload to Storage
+            upload_result = self.storage_manager.upload_document(
+                file=str(file_path),
+                original_filename=file_path.name,
+                document_type=document_type,
+                target_folder='raw/pending',
+                file_size=file_size
+            )
+            upload_result['file_hash'] = file_hash
+            upload_ok = True
+            return upload_result
+
+        except Exception as e:
+            logger.error(f"✗ Failed to upload {file_path}: {e}")
+            return None
+
+        finally:
+            if run_claim is not None:
+                if not upload_ok:
+                    # Let a later copy of this content be uploaded instead
+                    with self._run_hashes_lock:
+                        if self._run_hashes.get(file_hash) is run_claim:
+                            del self._run_hashes[file_hash]
+                run_claim[1].set_result(upload_ok)
+
     def upload_directory(
         self,
         directory: str,
         document_type: Optional[str] = None,
         vehicle_id: Optional[str] = None,
-        recursive: bool = False
+        recursive: bool = False,
+        workers: int = 8
     ) -> tuple[int, int]:
         """
         Upload all supported files from a directory.
@@ -125,6 +250,8 @@ class DocumentUploader:
             document_type: Type of document for all files
             vehicle_id: UUID of vehicle (if known)
             recursive: Recursively scan subdirectories
+            workers: Number of concurrent uploads (uploads and registry
+                inserts are network-bound; each insert uses its own connection)
 
         Returns:
             tuple: (success_count, fail_count)
@@ -135,42 +262,138 @@ class DocumentUploader:
             logger.error(f"Directory not found: {directory}")
             return (0, 0)
 
-        # Get files
-        if recursive:
-            files = [
-                f for f in directory.rglob('*')
-                if f.is_file() and f.suffix.lower() in self.SUPPORTED_EXTENSIONS
-            ]
-        else:
-            files = [
-                f for f in directory.iterdir()
-                if f.is_file() and f.suffix.lower() in self.SUPPORTED_EXTENSIONS
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            # Uploads start while the directory is still being scanned
+            futures = [
+                executor.submit(self._upload_to_storage, file_path, document_type, file_size)
+                for file_path, file_size in self._iter_supported(directory, recursive)
             ]
 
-        if not files:
-            logger.warning(f"No supported files found in {directory}")
-            return (0, 0)
+            if not futures:
+                logger.warning(f"No supported files found in {directory}")
+                return (0, 0)
+
+            logger.info(f"Found {len(futures)} files to upload")
 
-        logger.info(f"Found {len(files)} files to upload")
+            results = [future.result() for future in as_completed(futures)]
 
+        return self._register_uploads(results, document_type, vehicle_id)
+
+    def _register_uploads(
+        self,
+        results: List[Optional[dict]],
+        document_type: Optional[str] = None,
+        vehicle_id: Optional[str] = None
+    ) -> tuple[int, int]:
+        """
+        Create registry entries for a directory's uploads and log the summary.
+
+        Args:
+            results: _upload_to_storage() results, one per file
+            document_type: Type of document for all files
+            vehicle_id: UUID of vehicle (if known)
+
+        Returns:
+            tuple: (success_count, fail_count)
+        """
         success_count = 0
         fail_count = 0
-
-        for file_path in files:
-            if self.upload_file(str(file_path), document_type, vehicle_id):
-                success_count += 1
+        duplicate_count = 0
+
+        uploaded = []
+        for upload_result in results:
+            if upload_result and upload_result.get('duplicate_of'):
+                duplicate_count += 1
+            elif upload_result:
+                uploaded.append(upload_result)
             else:
                 fail_count += 1
 
+        # One INSERT for all registry entries instead of one per file
+        registry_ids = self.registry_manager.create_entries_from_storage_bulk([
+            {
+                'storage_path': upload_result['storage_path'],
+                'original_filename': upload_result['original_filename'],
+                'file_size': upload_result['file_size'],
+                'content_type': upload_result['content_type'],
+                'document_type': document_type,
+                'vehicle_id': vehicle_id,
+                'file_hash': upload_result['file_hash']
+            }
+            for upload_result in uploaded
+        ])
+
+        # Already-registered content counts as done
+        success_count += duplicate_count
+
+        if registry_ids:
+            success_count += len(registry_ids)
+        elif uploaded:
+            # Keep Storage consistent with the registry: remove orphaned uploads
+            logger.error(f"✗ Failed to create registry entries, removing {len(uploaded)} uploaded files")
+            try:
+                self.storage_manager.delete_documents([r['storage_path'] for r in uploaded])
+            except Exception as e:
+                logger.error(f"✗ Could not remove uploaded files: {e}")
+            fail_count += len(uploaded)
+
         logger.info(f"\n{'='*60}")
         logger.info(f"Upload Summary:")
-        logger.info(f"  Total files:     {len(files)}")
+        logger.info(f"  Total files:     {len(results)}")
         logger.info(f"  ✓ Successful:    {success_count}")
+        logger.info(f"  = Duplicates:    {duplicate_count}")
         logger.info(f"  ✗ Failed:        {fail_count}")
         logger.info(f"{'='*60}\n")
 
         return (success_count, fail_count)
 
+    @classmethod
+    def is_supported(cls, name: str) -> bool:
+        """
+        Check a file name or path against SUPPORTED_EXTENSIONS.
+
+        Args:
+            name: File name or path (only the text after the last '.' is examined,
+                so a dot in a directory name never matches)
+
+        Returns:
+            bool: True if the extension is supported
+        """
+        dot = name.rfind('.')
+        return dot >= 0 and name[dot:].lower() in cls.SUPPORTED_EXTENSIONS
+
+    @classmethod
+    def _iter_supported(cls, root, recursive: bool = False):
+        """
+        Yield supported files under root using os.scandir.
+
+        Unreadable directories are logged and skipped (as rglob did), so a
+        scan never fails after uploads have already been submitted.
+
+        Args:
+            root: Directory to scan
+            recursive: Also scan subdirectories
+
+        Yields:
+            tuple: (file path, size in bytes) - the size comes from the scan's stat
+        """
+        stack = [os.fspath(root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file(follow_symlinks=False):
+                                if cls.is_supported(entry.name):
+                                    yield entry.path, entry.stat(follow_symlinks=False).st_size
+                            elif recursive and entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                        except OSError as e:
+                            logger.warning(f"Skipping {entry.path}: {e}")
+            except OSError as e:
+                logger.warning(f"Skipping unreadable directory {directory}: {e}")
+
     def list_pending_uploads(self) -> List[dict]:
         """
         List all documents pending processing in the database.
@@ -236,6 +459,19 @@ Examples:
         help='Recursively scan subdirectories (only with --dir)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Number of concurrent uploads (only with --dir, default: 8)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Upload files even if the same content is already registered'
+    )
+
     parser.add_argument(
         '--list-pending',
         action='store_true',
@@ -256,7 +492,7 @@ Examples:
 
     # Initialize uploader
     try:
-        uploader = DocumentUploader()
+        uploader = DocumentUploader(force=args.force)
     except Exception as e:
         logger.error(f"Failed to initialize uploader: {e}")
         sys.exit(1)
@@ -284,7 +520,8 @@ Examples:
             args.dir,
             document_type=args.document_type,
             vehicle_id=args.vehicle_id,
-            recursive=args.recursive
+            recursive=args.recursive,
+            workers=args.workers
         )
         sys.exit(0 if fail_count == 0 else 1)
 
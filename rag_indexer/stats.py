@@ -6,31 +6,177 @@ Analyzes Docling metadata and provides quality reports
 """
 
 import json
+import math
 import os
+import heapq
+import functools
 import sys
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 
+import numpy as np
+
+# Optional: orjson parses and encodes JSON as UTF-8 bytes in C
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_indented(data):
+        """Encode data as indented UTF-8 JSON"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    _loads = json.loads  # also accepts UTF-8 bytes
+
+    def _dumps_indented(data):
+        """Encode data as indented UTF-8 JSON"""
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Quality buckets as (minimum score, name), lowest first; np.digitize maps a
+# score to the index of its bucket
+_Q_BUCKETS = [(float('-inf'), 'poor'), (50, 'acceptable'), (75, 'good'), (90, 'excellent')]
+_Q_BINS = np.array([threshold for threshold, _ in _Q_BUCKETS[1:]], dtype=np.float64)
+
+
+# Upper bound on metadata files read together in one batch
+READ_BATCH_SIZE = 256
+
+# Files opened and prefetched together within a batch (bounds open fds per worker)
+PREFETCH_WINDOW = 16
+
+
+def _read_files_batch(paths):
+    """
+    Read a batch of small files.
+
+    Where available (Linux), files are opened PREFETCH_WINDOW at a time and
+    hinted with POSIX_FADV_WILLNEED before that window is read, so the kernel
+    fetches them concurrently instead of one blocking read at a time while
+    each worker keeps only a few descriptors open.
+
+    Args:
+        paths: Files to read
+
+    Returns:
+        list: File contents (bytes), or the OSError raised for that file
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        results = []
+        for path in paths:
+            try:
+                results.append(Path(path).read_bytes())
+            except OSError as e:
+                results.append(e)
+        return results
+
+    results = []
+    for start in range(0, len(paths), PREFETCH_WINDOW):
+        fds = []
+        for path in paths[start:start + PREFETCH_WINDOW]:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError as e:
+                fds.append(e)
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass  # Only a hint: still read the file
+            fds.append(fd)
+
+        for fd in fds:
+            if isinstance(fd, OSError):
+                results.append(fd)
+                continue
+            try:
+                with os.fdopen(fd, 'rb') as f:
+                    results.append(f.read())
+            except OSError as e:
+                results.append(e)
+    return results
+
+
+def _extract_record(meta_file, data):
+    """Parse one metadata file's bytes into a statistics record (None on error)"""
+    try:
+        if isinstance(data, Exception):
+            raise data
+        metadata = _loads(data)
+        # Numeric fields go into typed arrays: coerce them here so one bad
+        # value (e.g. null) skips this file instead of failing the report
+        record = {
+            'format': metadata.get('original_format', 'unknown'),
+            'quality_score': float(metadata.get('conversion_quality_score', 0)),
+            'filename': metadata.get('original_filename', 'unknown'),
+            'original_size': int(metadata.get('original_size_bytes', 0)),
+            'markdown_size': int(metadata.get('markdown_size_bytes', 0)),
+            'conversion_time': float(metadata.get('conversion_time_seconds', 0)),
+            'date': metadata.get('conversion_date', 'unknown'),
+        }
+        if not (math.isfinite(record['quality_score']) and math.isfinite(record['conversion_time'])):
+            raise ValueError("non-finite quality score or conversion time")
+    except Exception as e:
+        print(f"Error reading {os.path.basename(meta_file)}: {e}")
+        return None
+
+    return record
+
+
+def parse_metadata_file(meta_file):
+    """
+    Read one metadata JSON file and extract the fields used for statistics.
+
+    Args:
+        meta_file: Path to the metadata file
+
+    Returns:
+        dict: format, quality_score, filename, original_size, markdown_size,
+            conversion_time and date; None if the file could not be read
+    """
+    return parse_metadata_batch([meta_file])[0]
+
+
+def parse_metadata_batch(meta_files):
+    """
+    Read a batch of metadata files together and extract their records.
+
+    Args:
+        meta_files: Paths to metadata files
+
+    Returns:
+        list: One record (see parse_metadata_file) or None per file, in order
+    """
+    return [
+        _extract_record(meta_file, data)
+        for meta_file, data in zip(meta_files, _read_files_batch(meta_files))
+    ]
+
 
 class ConversionStats:
-    """Analyzer for Docling conversion metadata"""
+    """
+    Analyzer for Docling conversion metadata
+
+    analyze() only parses the metadata files; each statistic is a cached
+    property computed on first use, so a report only pays for the sections
+    it prints.
+    """
     
-    def __init__(self, metadata_dir="./data/markdown/_metadata"):
+    def __init__(self, metadata_dir="./data/markdown/_metadata", workers=None):
         self.metadata_dir = Path(metadata_dir)
+        self.workers = workers or os.cpu_count() or 1
         self.metadata_files = []
-        self.stats = {
-            'total_conversions': 0,
-            'by_format': defaultdict(int),
-            'by_quality': defaultdict(int),
-            'quality_scores': [],
-            'total_original_size': 0,
-            'total_markdown_size': 0,
-            'problematic_files': [],
-            'conversion_timeline': [],
-            'average_conversion_time': 0,
-        }
+        
+        # Parsed metadata as parallel columns (one position per readable file)
+        # instead of one dict per file
+        self._formats = []
+        self._filenames = []
+        self._dates = []
+        self._qualities = np.empty(0, dtype=np.float64)
+        self._original_sizes = np.empty(0, dtype=np.int64)
+        self._markdown_sizes = np.empty(0, dtype=np.int64)
+        self._conversion_times = np.empty(0, dtype=np.float64)
     
     def load_metadata(self):
         """Load all metadata JSON files"""
@@ -38,7 +184,12 @@ class ConversionStats:
             print(f"Metadata directory not found: {self.metadata_dir}")
             return False
         
-        self.metadata_files = list(self.metadata_dir.glob("*.json"))
+        # scandir reuses the directory entry's file type instead of a stat per file
+        with os.scandir(self.metadata_dir) as entries:
+            self.metadata_files = [
+                entry.path for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            ]
         
         if not self.metadata_files:
             print(f"No metadata files found in {self.metadata_dir}")
@@ -48,77 +199,109 @@ class ConversionStats:
         return True
     
     def analyze(self):
-        """Analyze all metadata files"""
+        """Read and parse all metadata files"""
         print("\nAnalyzing metadata...")
         
-        for meta_file in self.metadata_files:
-            try:
-                with open(meta_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-                
-                self._process_metadata(metadata)
-                
-            except Exception as e:
-                print(f"Error reading {meta_file.name}: {e}")
-                continue
+        # Files are independent: read them in batches, several batches at a time
+        files = self.metadata_files
+        batch_size = max(1, min(READ_BATCH_SIZE, -(-len(files) // self.workers)))
+        batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
         
-        # Calculate averages
-        if self.stats['quality_scores']:
-            self.stats['average_quality'] = sum(self.stats['quality_scores']) / len(self.stats['quality_scores'])
-        
-        # Sort problematic files by quality score
-        self.stats['problematic_files'].sort(key=lambda x: x['quality_score'])
-    
-    def _process_metadata(self, metadata):
-        """Process single metadata file"""
-        self.stats['total_conversions'] += 1
+        qualities = []
+        original_sizes = []
+        markdown_sizes = []
+        conversion_times = []
         
-        # Format statistics
-        fmt = metadata.get('original_format', 'unknown')
-        self.stats['by_format'][fmt] += 1
-        
-        # Quality score
-        quality_score = metadata.get('conversion_quality_score', 0)
-        self.stats['quality_scores'].append(quality_score)
-        
-        # Categorize quality
-        if quality_score >= 90:
-            self.stats['by_quality']['excellent'] += 1
-        elif quality_score >= 75:
-            self.stats['by_quality']['good'] += 1
-        elif quality_score >= 50:
-            self.stats['by_quality']['acceptable'] += 1
-        else:
-            self.stats['by_quality']['poor'] += 1
-        
-        # Track problematic files (quality < 75)
-        if quality_score < 75:
-            self.stats['problematic_files'].append({
-                'filename': metadata.get('original_filename', 'unknown'),
-                'quality_score': quality_score,
-                'format': fmt,
-                'original_size': metadata.get('original_size_bytes', 0),
-                'markdown_size': metadata.get('markdown_size_bytes', 0),
-                'conversion_time': metadata.get('conversion_time_seconds', 0)
-            })
-        
-        # Size statistics
-        self.stats['total_original_size'] += metadata.get('original_size_bytes', 0)
-        self.stats['total_markdown_size'] += metadata.get('markdown_size_bytes', 0)
-        
-        # Timeline
-        self.stats['conversion_timeline'].append({
-            'date': metadata.get('conversion_date', 'unknown'),
-            'filename': metadata.get('original_filename', 'unknown'),
-            'quality': quality_score
-        })
+        executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            batch_records = executor.map(parse_metadata_batch, batches) if executor else map(parse_metadata_batch, batches)
+            
+            # Fold each batch into the columns as it arrives
+            for records in batch_records:
+                for record in records:
+                    if record is None:
+                        continue
+                    self._formats.append(record['format'])
+                    self._filenames.append(record['filename'])
+                    self._dates.append(record['date'])
+                    qualities.append(record['quality_score'])
+                    original_sizes.append(record['original_size'])
+                    markdown_sizes.append(record['markdown_size'])
+                    conversion_times.append(record['conversion_time'])
+        finally:
+            if executor:
+                executor.shutdown()
         
-        # Conversion time
-        conv_time = metadata.get('conversion_time_seconds', 0)
-        if conv_time > 0:
-            current_avg = self.stats['average_conversion_time']
-            count = self.stats['total_conversions']
-            self.stats['average_conversion_time'] = (current_avg * (count - 1) + conv_time) / count
+        self._qualities = np.array(qualities, dtype=np.float64)
+        self._original_sizes = np.array(original_sizes, dtype=np.int64)
+        self._markdown_sizes = np.array(markdown_sizes, dtype=np.int64)
+        self._conversion_times = np.array(conversion_times, dtype=np.float64)
+    
+    @property
+    def total_conversions(self):
+        """Number of readable metadata files"""
+        return len(self._filenames)
+    
+    @functools.cached_property
+    def format_counts(self):
+        """Conversions per original format"""
+        return dict(Counter(self._formats))
+    
+    @property
+    def quality_scores(self):
+        """Quality scores as a float64 array"""
+        return self._qualities
+    
+    @functools.cached_property
+    def average_quality(self):
+        """Mean quality score, or None without conversions"""
+        scores = self._qualities
+        return float(scores.mean()) if len(scores) else None
+    
+    @functools.cached_property
+    def quality_counts(self):
+        """Conversions per quality bucket (empty buckets omitted)"""
+        # Quality buckets in one vectorized pass
+        counts = np.bincount(np.digitize(self._qualities, _Q_BINS), minlength=len(_Q_BUCKETS))
+        return {name: int(count) for (_, name), count in zip(_Q_BUCKETS, counts) if count}
+    
+    @functools.cached_property
+    def _problematic_indices(self):
+        """Positions of files with quality < 75"""
+        return np.flatnonzero(self._qualities < 75)
+    
+    @property
+    def problematic_count(self):
+        """Number of files with quality < 75"""
+        return len(self._problematic_indices)
+    
+    @functools.cached_property
+    def size_totals(self):
+        """(total original size, total markdown size) in bytes"""
+        return int(self._original_sizes.sum()), int(self._markdown_sizes.sum())
+    
+    @functools.cached_property
+    def average_conversion_time(self):
+        """Mean conversion time over files with a recorded time"""
+        times = self._conversion_times[self._conversion_times > 0]
+        return float(times.mean()) if len(times) else 0
+    
+    def _problematic_file(self, i):
+        """Problematic-file report entry for column position i"""
+        return {
+            'filename': self._filenames[i],
+            'quality_score': float(self._qualities[i]),
+            'format': self._formats[i],
+            'original_size': int(self._original_sizes[i]),
+            'markdown_size': int(self._markdown_sizes[i]),
+            'conversion_time': float(self._conversion_times[i])
+        }
+    
+    def _worst_problematic_files(self, limit):
+        """Lowest-quality problematic files; only the returned rows become dicts"""
+        indices = self._problematic_indices
+        order = indices[np.argsort(self._qualities[indices], kind='stable')[:limit]]
+        return [self._problematic_file(i) for i in order]
     
     def print_summary(self):
         """Print summary statistics"""
@@ -126,27 +309,29 @@ class ConversionStats:
         print("DOCLING CONVERSION STATISTICS")
         print("="*70)
         
-        print(f"\nTotal conversions: {self.stats['total_conversions']}")
+        total_conversions = self.total_conversions
+        print(f"\nTotal conversions: {total_conversions}")
         
         # Format breakdown
         print("\nBy format:")
-        for fmt, count in sorted(self.stats['by_format'].items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / self.stats['total_conversions']) * 100
+        for fmt, count in sorted(self.format_counts.items(), key=lambda x: x[1], reverse=True):
+            percentage = (count / total_conversions) * 100
             print(f"  {fmt.upper()}: {count} ({percentage:.1f}%)")
         
         # Quality breakdown
         print("\nBy quality:")
-        for quality, count in sorted(self.stats['by_quality'].items()):
-            percentage = (count / self.stats['total_conversions']) * 100
+        for quality, count in sorted(self.quality_counts.items()):
+            percentage = (count / total_conversions) * 100
             print(f"  {quality.capitalize()}: {count} ({percentage:.1f}%)")
         
         # Average quality
-        if 'average_quality' in self.stats:
-            print(f"\nAverage quality score: {self.stats['average_quality']:.1f}/100")
+        if self.average_quality is not None:
+            print(f"\nAverage quality score: {self.average_quality:.1f}/100")
         
         # Size comparison
-        orig_size_mb = self.stats['total_original_size'] / (1024 * 1024)
-        md_size_mb = self.stats['total_markdown_size'] / (1024 * 1024)
+        total_original_size, total_markdown_size = self.size_totals
+        orig_size_mb = total_original_size / (1024 * 1024)
+        md_size_mb = total_markdown_size / (1024 * 1024)
         
         print(f"\nSize comparison:")
         print(f"  Original files: {orig_size_mb:.2f} MB")
@@ -158,11 +343,11 @@ class ConversionStats:
         
         # Performance
         print(f"\nPerformance:")
-        print(f"  Average conversion time: {self.stats['average_conversion_time']:.2f}s")
+        print(f"  Average conversion time: {self.average_conversion_time:.2f}s")
     
     def print_problematic_files(self, limit=10):
         """Print problematic files report"""
-        if not self.stats['problematic_files']:
+        if not self.problematic_count:
             print("\n✅ No problematic files found (all quality scores >= 75)")
             return
         
@@ -170,7 +355,7 @@ class ConversionStats:
         print(f"PROBLEMATIC FILES (quality < 75) - Top {limit}")
         print("="*70)
         
-        for i, file_info in enumerate(self.stats['problematic_files'][:limit], 1):
+        for i, file_info in enumerate(self._worst_problematic_files(limit), 1):
             print(f"\n{i}. {file_info['filename']}")
             print(f"   Quality score: {file_info['quality_score']:.1f}/100")
             print(f"   Format: {file_info['format'].upper()}")
@@ -178,29 +363,29 @@ class ConversionStats:
             print(f"   Markdown size: {file_info['markdown_size']/1024:.1f} KB")
             print(f"   Conversion time: {file_info['conversion_time']:.2f}s")
         
-        if len(self.stats['problematic_files']) > limit:
-            print(f"\n... and {len(self.stats['problematic_files']) - limit} more problematic files")
+        if self.problematic_count > limit:
+            print(f"\n... and {self.problematic_count - limit} more problematic files")
     
     def print_timeline(self, limit=10):
         """Print recent conversion timeline"""
-        if not self.stats['conversion_timeline']:
+        if not self._dates:
             return
         
         print("\n" + "="*70)
         print(f"RECENT CONVERSIONS - Last {limit}")
         print("="*70)
         
-        # Sort by date (most recent first)
-        sorted_timeline = sorted(
-            self.stats['conversion_timeline'],
-            key=lambda x: x['date'],
-            reverse=True
-        )
+        # Most recent first (ISO dates compare correctly as strings);
+        # nlargest only keeps the entries that are printed
+        dates = self._dates
+        recent = heapq.nlargest(limit, range(len(dates)), key=dates.__getitem__)
         
-        for i, entry in enumerate(sorted_timeline[:limit], 1):
-            date_str = entry['date'][:19] if len(entry['date']) > 19 else entry['date']
-            quality_emoji = "✅" if entry['quality'] >= 75 else "⚠️"
-            print(f"{i}. {date_str} - {entry['filename']} {quality_emoji} ({entry['quality']:.0f})")
+        for i, pos in enumerate(recent, 1):
+            date = dates[pos]
+            quality = self._qualities[pos]
+            date_str = date[:19] if len(date) > 19 else date
+            quality_emoji = "✅" if quality >= 75 else "⚠️"
+            print(f"{i}. {date_str} - {self._filenames[pos]} {quality_emoji} ({quality:.0f})")
     
     def export_json(self, output_file="./logs/conversion_stats.json"):
         """Export statistics to JSON"""
@@ -208,22 +393,22 @@ class ConversionStats:
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Convert defaultdict to regular dict for JSON
+            total_original_size, total_markdown_size = self.size_totals
             export_data = {
                 'generated_at': datetime.now().isoformat(),
-                'total_conversions': self.stats['total_conversions'],
-                'by_format': dict(self.stats['by_format']),
-                'by_quality': dict(self.stats['by_quality']),
-                'average_quality': self.stats.get('average_quality', 0),
-                'total_original_size_mb': self.stats['total_original_size'] / (1024 * 1024),
-                'total_markdown_size_mb': self.stats['total_markdown_size'] / (1024 * 1024),
-                'average_conversion_time': self.stats['average_conversion_time'],
-                'problematic_files_count': len(self.stats['problematic_files']),
-                'problematic_files': self.stats['problematic_files'][:20],  # Top 20
+                'total_conversions': self.total_conversions,
+                'by_format': self.format_counts,
+                'by_quality': self.quality_counts,
+                'average_quality': self.average_quality or 0,
+                'total_original_size_mb': total_original_size / (1024 * 1024),
+                'total_markdown_size_mb': total_markdown_size / (1024 * 1024),
+                'average_conversion_time': self.average_conversion_time,
+                'problematic_files_count': self.problematic_count,
+                'problematic_files': self._worst_problematic_files(20),  # Top 20
             }
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with open(output_path, 'wb') as f:
+                f.write(_dumps_indented(export_data))
             
             print(f"\n📊 Statistics exported to: {output_path}")
             return True
@@ -273,6 +458,13 @@ Examples:
         help='Export statistics to JSON file'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Threads used to read metadata files (default: CPU count)'
+    )
+    
     parser.add_argument(
         '--limit',
         type=int,
@@ -283,7 +475,7 @@ Examples:
     args = parser.parse_args()
     
     # Create analyzer
-    analyzer = ConversionStats(metadata_dir=args.metadata)
+    analyzer = ConversionStats(metadata_dir=args.metadata, workers=args.workers)
     
     # Load metadata
     if not analyzer.load_metadata():
@@ -3,5 +3,6 @@ Storage management modules for Supabase Storage integration.
 """
 
 from .storage_manager import SupabaseStorageManager
+from .supabase_singleton import get_supabase_client
 
-__all__ = ['SupabaseStorageManager']
+__all__ = ['SupabaseStorageManager', 'get_supabase_client']
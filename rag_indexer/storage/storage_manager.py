@@ -5,21 +5,44 @@ This module provides an abstraction layer for interacting with Supabase Storage,
 handling file uploads, downloads, moves, and deletions.
 """
 
+import io
 import os
+import time
 import uuid
+import types
 import logging
+import itertools
+import collections
 from pathlib import Path
-from typing import BinaryIO, Optional, Union
+from typing import BinaryIO, Iterator, Optional, Union
 from datetime import datetime, timedelta
 
-from supabase import create_client, Client
+import requests
+from supabase import Client
 from dotenv import load_dotenv
 
+from .supabase_singleton import get_supabase_client
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Entries requested per Storage listing call
+LIST_PAGE_SIZE = 1000
+
+# MIME types by (lowercase) file extension; read-only so it is built only once
+_CONTENT_TYPES = types.MappingProxyType({
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.doc': 'application/msword',
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    '.ppt': 'application/vnd.ms-powerpoint',
+    '.txt': 'text/plain',
+    '.md': 'text/markdown',
+    '.json': 'application/json'
+})
+
 
 class SupabaseStorageManager:
     """
@@ -61,11 +84,14 @@ class SupabaseStorageManager:
             )
 
         # Initialize Supabase client
-        self.client: Client = create_client(self.supabase_url, self.supabase_key)
+        self.client: Client = get_supabase_client(self.supabase_url, self.supabase_key)
 
         # Create temp directory if it doesn't exist
         Path(self.temp_dir).mkdir(parents=True, exist_ok=True)
 
+        # Folder listings for file_exists: {folder: (listed_at, frozenset of names)}
+        self._folder_cache = {}
+
         logger.info(f"Initialized SupabaseStorageManager with bucket '{self.bucket_name}'")
 
     def upload_document(
@@ -73,7 +99,8 @@ class SupabaseStorageManager:
         file: Union[BinaryIO, bytes, str],
         original_filename: str,
         document_type: Optional[str] = None,
-        target_folder: str = 'raw/pending'
+        target_folder: str = 'raw/pending',
+        file_size: Optional[int] = None
     ) -> dict:
         """
         Upload a document to Supabase Storage.
@@ -83,6 +110,7 @@ class SupabaseStorageManager:
             original_filename: Original name of the file
             document_type: Type of document (insurance, nct, etc.) - unused for now
             target_folder: Target folder in bucket (default: raw/pending)
+            file_size: Size in bytes if already known (skips a stat for file paths)
 
         Returns:
             dict: {
@@ -97,20 +125,6 @@ class SupabaseStorageManager:
             Exception: If upload fails
         """
         try:
-            # Read file content
-            if isinstance(file, str):
-                # File path provided
-                with open(file, 'rb') as f:
-                    file_content = f.read()
-                file_size = os.path.getsize(file)
-            elif isinstance(file, bytes):
-                file_content = file
-                file_size = len(file)
-            else:
-                # BinaryIO
-                file_content = file.read()
-                file_size = len(file_content)
-
             # Use original filename (no timestamp prefix needed - deduplication is done by hash)
             safe_filename = original_filename.replace(' ', '_')  # Replace spaces only
 
@@ -120,18 +134,51 @@ class SupabaseStorageManager:
             # Detect content type
             content_type = self._get_content_type(original_filename)
 
+            file_options = {
+                "content-type": content_type,
+                "x-upsert": "false"  # Don't overwrite existing files
+            }
+
             # Upload to Supabase Storage
             logger.info(f"Uploading {original_filename} to {storage_path}")
 
-            response = self.client.storage.from_(self.bucket_name).upload(
-                path=storage_path,
-                file=file_content,
-                file_options={
-                    "content-type": content_type,
-                    "x-upsert": "false"  # Don't overwrite existing files
-                }
-            )
+            if isinstance(file, str):
+                # File path provided: hand the open file to the client so the
+                # request body is streamed from disk instead of read into memory
+                if file_size is None:
+                    file_size = os.path.getsize(file)
+                with open(file, 'rb') as f:
+                    response = self.client.storage.from_(self.bucket_name).upload(
+                        path=storage_path,
+                        file=f,
+                        file_options=file_options
+                    )
+            elif isinstance(file, io.BufferedReader):
+                # Open file: passed through so the body is streamed as well
+                if file_size is None:
+                    file_size = self._remaining_size(file)
+
+                response = self.client.storage.from_(self.bucket_name).upload(
+                    path=storage_path,
+                    file=file,
+                    file_options=file_options
+                )
+            else:
+                # bytes, or a stream the client treats as a path (BytesIO,
+                # SpooledTemporaryFile, ...): upload its content
+                if isinstance(file, bytes):
+                    file_content = file
+                else:
+                    file_content = file.read()
+                file_size = len(file_content)
 
+                response = self.client.storage.from_(self.bucket_name).upload(
+                    path=storage_path,
+                    file=file_content,
+                    file_options=file_options
+                )
+
+            self._folder_cache.clear()
             logger.info(f"Successfully uploaded {original_filename} ({file_size} bytes)")
 
             return {
@@ -146,12 +193,17 @@ class SupabaseStorageManager:
             logger.error(f"Failed to upload {original_filename}: {e}")
             raise
 
-    def download_to_temp(self, storage_path: str) -> str:
+    def download_to_temp(self, storage_path: str, chunk_size: int = 65536) -> str:
         """
         Download a document from Storage to temporary directory.
 
+        The file is streamed from a short-lived signed URL straight to disk in
+        chunk_size pieces, so memory use stays flat regardless of file size
+        (the client's download() returns the whole file as one bytes object).
+
         Args:
             storage_path: Path in Storage bucket (e.g., 'raw/pending/uuid_file.pdf')
+            chunk_size: Bytes read from the response per write
 
         Returns:
             str: Local temporary file path
@@ -159,26 +211,34 @@ class SupabaseStorageManager:
         Raises:
             Exception: If download fails
         """
+        temp_path = None
         try:
             logger.info(f"Downloading {storage_path} from Storage")
 
-            # Download file content
-            response = self.client.storage.from_(self.bucket_name).download(storage_path)
+            signed_url = self.get_signed_url(storage_path, expires_in=300)
 
             # Generate local temp path
-            filename = Path(storage_path).name
+            filename = storage_path.rpartition('/')[2]
             temp_path = os.path.join(self.temp_dir, filename)
 
-            # Write to temp file
-            with open(temp_path, 'wb') as f:
-                f.write(response)
+            # Stream file content to the temp file
+            bytes_written = 0
+            with requests.get(signed_url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                with open(temp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        bytes_written += len(chunk)
 
-            logger.info(f"Downloaded to {temp_path} ({len(response)} bytes)")
+            logger.info(f"Downloaded to {temp_path} ({bytes_written} bytes)")
 
             return temp_path
 
         except Exception as e:
             logger.error(f"Failed to download {storage_path}: {e}")
+            # The caller never gets the path, so remove a partially written file here
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
             raise
 
     def move_document(self, old_path: str, new_folder: str) -> str:
@@ -199,8 +259,7 @@ class SupabaseStorageManager:
         """
         try:
             # Extract filename from old path
-            from pathlib import Path
-            filename = Path(old_path).name
+            filename = old_path.rpartition('/')[2]
 
             # Build complete destination path with filename
             new_path = f"{new_folder}/{filename}"
@@ -213,6 +272,7 @@ class SupabaseStorageManager:
                 to_path=new_path
             )
 
+            self._folder_cache.clear()
             logger.info(f"Successfully moved document to {new_path}")
             return new_path
 
@@ -233,17 +293,37 @@ class SupabaseStorageManager:
         Raises:
             Exception: If deletion fails
         """
-        try:
-            logger.info(f"Deleting {storage_path}")
+        return self.delete_documents([storage_path])
 
-            response = self.client.storage.from_(self.bucket_name).remove([storage_path])
+    def delete_documents(self, storage_paths: list[str], batch_size: int = 1000) -> bool:
+        """
+        Delete several documents from Storage, one request per batch of paths.
 
-            logger.info(f"Successfully deleted document")
-            return True
+        Args:
+            storage_paths: Paths in bucket to delete
+            batch_size: Maximum paths per remove request
 
-        except Exception as e:
-            logger.error(f"Failed to delete {storage_path}: {e}")
-            raise
+        Returns:
+            bool: True if successful
+
+        Raises:
+            Exception: If deletion fails
+        """
+        bucket = self.client.storage.from_(self.bucket_name)
+        for start in range(0, len(storage_paths), batch_size):
+            batch = storage_paths[start:start + batch_size]
+            try:
+                logger.info(f"Deleting {batch[0]}" if len(batch) == 1 else f"Deleting {len(batch)} documents")
+
+                bucket.remove(batch)
+                self._folder_cache.clear()
+
+            except Exception as e:
+                logger.error(f"Failed to delete {batch[0] if len(batch) == 1 else f'{len(batch)} documents'}: {e}")
+                raise
+
+        logger.info(f"Successfully deleted {len(storage_paths)} document(s)")
+        return True
 
     def delete_document_all_files(
         self,
@@ -299,6 +379,9 @@ class SupabaseStorageManager:
                 logger.warning(f"   ⚠️ Failed to delete {path}: {e}")
                 failed.append(path)
 
+        if deleted:
+            self._folder_cache.clear()
+
         logger.info(f"Deleted {len(deleted)}/{len(paths_to_delete)} files from Storage")
 
         return {
@@ -321,10 +404,9 @@ class SupabaseStorageManager:
         try:
             logger.info(f"Listing documents with prefix '{prefix}'")
 
-            response = self.client.storage.from_(self.bucket_name).list(
-                path=prefix,
-                options={'limit': limit}
-            )
+            response = list(itertools.islice(
+                self.iter_documents(prefix, page_size=min(limit, LIST_PAGE_SIZE)), limit
+            ))
 
             logger.info(f"Found {len(response)} documents")
 
@@ -334,6 +416,37 @@ class SupabaseStorageManager:
             logger.error(f"Failed to list documents with prefix '{prefix}': {e}")
             raise
 
+    def iter_documents(self, prefix: str = '', page_size: int = None,
+                       search: Optional[str] = None) -> Iterator[dict]:
+        """
+        Iterate over documents in a folder, fetching one page at a time.
+
+        Pages are requested lazily, so callers that stop early never fetch the
+        rest, and folders larger than a single listing are covered completely.
+
+        Args:
+            prefix: Folder prefix (e.g., 'raw/pending/')
+            page_size: Entries requested per listing call (default: LIST_PAGE_SIZE)
+            search: Only list entries whose name contains this string (server-side)
+
+        Yields:
+            dict: File metadata
+        """
+        bucket = self.client.storage.from_(self.bucket_name)
+        page_size = page_size or LIST_PAGE_SIZE
+        options = {'limit': page_size}
+        if search:
+            options['search'] = search
+        offset = 0
+        while True:
+            page = bucket.list(path=prefix, options={**options, 'offset': offset})
+            if not page:
+                return
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += len(page)
+
     def get_signed_url(self, storage_path: str, expires_in: int = 3600) -> str:
         """
         Generate a temporary signed URL for downloading a file.
@@ -366,6 +479,72 @@ class SupabaseStorageManager:
             logger.error(f"Failed to generate signed URL for {storage_path}: {e}")
             raise
 
+    def create_upload_urls(self, storage_paths: list[str]) -> dict:
+        """
+        Mint signed upload URLs so producers can upload directly to Storage.
+
+        The file bytes then never pass through this process; the producer PUTs
+        the file body to the URL (see upload_to_signed_url).
+
+        Args:
+            storage_paths: Paths in bucket to allow uploads to
+
+        Returns:
+            dict: {storage_path: signed upload URL}
+
+        Raises:
+            Exception: If URL generation fails
+        """
+        try:
+            logger.info(f"Generating {len(storage_paths)} signed upload URLs")
+
+            bucket = self.client.storage.from_(self.bucket_name)
+            urls = {}
+            for storage_path in storage_paths:
+                response = bucket.create_signed_upload_url(storage_path)
+                urls[storage_path] = response.get('signed_url') or response.get('signedUrl')
+
+            return urls
+
+        except Exception as e:
+            logger.error(f"Failed to generate signed upload URLs: {e}")
+            raise
+
+    @classmethod
+    def upload_to_signed_url(cls, signed_url: str, file_path: str, timeout: int = 300) -> bool:
+        """
+        Upload a local file to a signed upload URL, streaming it from disk.
+
+        Needs no Supabase credentials, only the URL from create_upload_urls().
+
+        Args:
+            signed_url: Signed upload URL
+            file_path: Local file to upload
+            timeout: Request timeout in seconds
+
+        Returns:
+            bool: True if uploaded successfully
+
+        Raises:
+            Exception: If upload fails
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                response = requests.put(
+                    signed_url,
+                    data=f,
+                    headers={'content-type': cls._get_content_type(file_path)},
+                    timeout=timeout
+                )
+            response.raise_for_status()
+
+            logger.info(f"Uploaded {file_path} via signed URL")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to upload {file_path} via signed URL: {e}")
+            raise
+
     def file_exists(self, storage_path: str) -> bool:
         """
         Check if a file exists in Storage.
@@ -376,19 +555,73 @@ class SupabaseStorageManager:
         Returns:
             bool: True if file exists
         """
+        folder, _, filename = storage_path.rpartition('/')
         try:
-            # Try to get file info
-            folder = str(Path(storage_path).parent)
-            filename = Path(storage_path).name
-
-            files = self.list_documents(prefix=folder)
-
-            return any(f.get('name') == filename for f in files)
-
+            return self._file_in_folder(folder, filename)
         except Exception as e:
             logger.error(f"Error checking existence of {storage_path}: {e}")
             return False
 
+    def files_exist(self, storage_paths: list[str], ttl: float = 30) -> dict:
+        """
+        Check several files at once, listing each folder only once.
+
+        Folders with a single requested file are looked up by name instead
+        (see file_exists). Folder listings are cached for up to ttl seconds;
+        uploads, moves and deletes through this manager clear the cache.
+
+        Args:
+            storage_paths: Paths in bucket
+            ttl: Folder listing cache lifetime in seconds
+
+        Returns:
+            dict: {storage_path: True if the file exists}
+        """
+        per_folder = collections.Counter(path.rpartition('/')[0] for path in storage_paths)
+        result = {}
+        for storage_path in storage_paths:
+            folder, _, filename = storage_path.rpartition('/')
+            try:
+                if per_folder[folder] == 1:
+                    result[storage_path] = self._file_in_folder(folder, filename, ttl)
+                else:
+                    result[storage_path] = filename in self._list_folder_names(folder, ttl)
+            except Exception as e:
+                logger.error(f"Error checking existence of {storage_path}: {e}")
+                result[storage_path] = False
+        return result
+
+    def _file_in_folder(self, folder: str, filename: str, ttl: float = 30) -> bool:
+        """
+        Look up one file by name, stopping at the first match.
+
+        Uses a cached folder listing if one is fresh, otherwise a server-side
+        name search (normally a single listing call, even in large folders).
+        """
+        cached = self._folder_cache.get(folder)
+        if cached is not None and time.monotonic() - cached[0] <= ttl:
+            return filename in cached[1]
+        return any(f.get('name') == filename for f in self.iter_documents(prefix=folder, search=filename))
+
+    def _list_folder_names(self, folder: str, ttl: float = 30) -> frozenset:
+        """
+        Names of the files in a folder, reusing a listing for up to ttl seconds.
+
+        Args:
+            folder: Folder path in bucket
+            ttl: Cache lifetime in seconds
+
+        Returns:
+            frozenset: File names
+        """
+        now = time.monotonic()
+        cached = self._folder_cache.get(folder)
+        if cached is None or now - cached[0] > ttl:
+            names = frozenset(f.get('name') for f in self.iter_documents(prefix=folder))
+            cached = (now, names)
+            self._folder_cache[folder] = cached
+        return cached[1]
+
     def cleanup_temp_file(self, temp_path: str) -> bool:
         """
         Delete a temporary file.
@@ -409,6 +642,25 @@ class SupabaseStorageManager:
             logger.error(f"Failed to cleanup temp file {temp_path}: {e}")
             return False
 
+    @staticmethod
+    def _remaining_size(file: BinaryIO) -> Optional[int]:
+        """
+        Number of bytes left in a file object, without reading it.
+
+        Args:
+            file: Binary file object
+
+        Returns:
+            int or None: Remaining bytes, None if the stream is not seekable
+        """
+        try:
+            position = file.tell()
+            end = file.seek(0, os.SEEK_END)
+            file.seek(position)
+            return end - position
+        except (AttributeError, OSError, ValueError):
+            return None
+
     @staticmethod
     def _get_content_type(filename: str) -> str:
         """
@@ -420,20 +672,11 @@ class SupabaseStorageManager:
         Returns:
             str: MIME type
         """
-        extension = Path(filename).suffix.lower()
-
-        content_types = {
-            '.pdf': 'application/pdf',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.doc': 'application/msword',
-            '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            '.ppt': 'application/vnd.ms-powerpoint',
-            '.txt': 'text/plain',
-            '.md': 'text/markdown',
-            '.json': 'application/json'
-        }
+        _, dot, extension = os.fspath(filename).rpartition('.')
+        if not dot:
+            return 'application/octet-stream'
 
-        return content_types.get(extension, 'application/octet-stream')
+        return _CONTENT_TYPES.get('.' + extension.lower(), 'application/octet-stream')
 
 
 # Convenience function for getting a shared instance
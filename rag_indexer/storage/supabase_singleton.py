@@ -0,0 +1,47 @@
+"""
+Shared Supabase client.
+
+Every component that talks to the same Supabase project reuses one Client, so
+the process keeps a single HTTP connection pool and auth context instead of
+one per manager.
+"""
+
+import os
+import functools
+from typing import Optional
+
+from supabase import create_client, Client
+
+
+@functools.lru_cache(maxsize=4)
+def _create_cached_client(supabase_url: str, supabase_key: str) -> Client:
+    """Create (once per URL/key pair) a Supabase client."""
+    return create_client(supabase_url, supabase_key)
+
+
+def get_supabase_client(
+    supabase_url: Optional[str] = None,
+    supabase_key: Optional[str] = None
+) -> Client:
+    """
+    Get the shared Supabase client for a project.
+
+    Args:
+        supabase_url: Supabase project URL (from env if not provided)
+        supabase_key: Supabase service role key (from env if not provided)
+
+    Returns:
+        Client: Shared Supabase client
+
+    Raises:
+        ValueError: If URL or key is missing
+    """
+    supabase_url = supabase_url or os.getenv('SUPABASE_URL')
+    supabase_key = supabase_key or os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+
+    if not supabase_url or not supabase_key:
+        raise ValueError(
+            "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in environment or passed explicitly"
+        )
+
+    return _create_cached_client(supabase_url, supabase_key)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Celery tasks for Storage-mode document conversion
+
+Each pending document is converted by its own task, so a slow or broken file
+only ties up one worker slot (and is killed after TASK_TIME_LIMIT seconds)
+instead of stalling the whole batch.
+
+Requires celery and a broker (Redis by default):
+    pip install "celery[redis]"
+
+Start workers (from the rag_indexer directory):
+    celery -A tasks worker --concurrency=4 --prefetch-multiplier=1
+
+Enqueue pending documents:
+    python process_documents_storage.py --queue [--wait]
+"""
+
+import os
+import sys
+import functools
+from pathlib import Path
+from dotenv import load_dotenv
+
+from celery import Celery
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Load environment variables
+load_dotenv()
+
+# Hard/soft per-document limits (seconds)
+TASK_TIME_LIMIT = int(os.getenv('CONVERSION_TASK_TIME_LIMIT', '300'))
+TASK_SOFT_TIME_LIMIT = max(1, TASK_TIME_LIMIT - 30)
+
+celery_app = Celery(
+    'rag_indexer',
+    broker=os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0'),
+    backend=os.getenv('CELERY_RESULT_BACKEND', 'redis://localhost:6379/1'),
+)
+celery_app.conf.update(
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_converter(enable_ocr: bool, ocr_strategy: str):
+    """Create the worker's DocumentConverter once (Docling models are loaded here)."""
+    from docling_processor.config_docling import get_docling_config
+    from docling_processor.document_converter import DocumentConverter
+    from storage.storage_manager import SupabaseStorageManager
+    from chunking_vectors.registry_manager import DocumentRegistryManager
+
+    return DocumentConverter(
+        get_docling_config(),
+        enable_ocr_enhancement=enable_ocr,
+        ocr_strategy=ocr_strategy,
+        storage_manager=SupabaseStorageManager(),
+        registry_manager=DocumentRegistryManager(os.getenv('SUPABASE_CONNECTION_STRING'))
+    )
+
+
+# No autoretry: convert_from_storage() handles every error itself and has
+# already moved the file to raw/failed by the time it returns
+@celery_app.task(
+    time_limit=TASK_TIME_LIMIT,
+    soft_time_limit=TASK_SOFT_TIME_LIMIT
+)
+def convert_one(doc_record: dict, enable_ocr: bool = False, ocr_strategy: str = 'fallback') -> dict:
+    """
+    Convert a single document from Supabase Storage.
+
+    Args:
+        doc_record: Registry record with at least id, storage_path and original_filename
+        enable_ocr: Enable OCR enhancement for images
+        ocr_strategy: OCR strategy to use
+
+    Returns:
+        dict: {'id', 'success', 'markdown_path', 'error'}
+    """
+    converter = _get_converter(enable_ocr, ocr_strategy)
+    success, output_path, error_msg = converter.convert_from_storage(doc_record)
+
+    return {
+        'id': doc_record['id'],
+        'success': success,
+        'markdown_path': str(output_path) if output_path else None,
+        'error': error_msg
+    }
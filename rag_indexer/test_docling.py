@@ -5,8 +5,17 @@ Diagnostic script to test Docling 2.55.1 directly
 
 from docling.document_converter import DocumentConverter
 from docling.datamodel.base_models import InputFormat
+import functools
 import traceback
 
+
+@functools.lru_cache(maxsize=None)
+def _get_converter(formats=None):
+    """Create a DocumentConverter once per allowed-formats tuple and reuse it"""
+    if formats is None:
+        return DocumentConverter()
+    return DocumentConverter(allowed_formats=list(formats))
+
 print("Testing Docling 2.55.1 configuration...\n")
 
 # Test 1: Basic converter
@@ -14,7 +23,7 @@ print("=" * 60)
 print("Test 1: Creating basic converter")
 print("=" * 60)
 try:
-    converter = DocumentConverter()
+    converter = _get_converter()
     print("✅ Basic converter created successfully\n")
 except Exception as e:
     print(f"❌ Failed: {e}")
@@ -26,9 +35,7 @@ print("=" * 60)
 print("Test 2: Creating converter with allowed formats")
 print("=" * 60)
 try:
-    converter = DocumentConverter(
-        allowed_formats=[InputFormat.PDF]
-    )
+    converter = _get_converter((InputFormat.PDF,))
     print("✅ Converter with formats created successfully\n")
 except Exception as e:
     print(f"❌ Failed: {e}")
@@ -75,7 +82,8 @@ try:
         print(f"📄 Test file: {test_file}")
         print(f"   Size: {test_file.stat().st_size} bytes")
         
-        converter = DocumentConverter()
+        # Reuses the basic converter from Test 1
+        converter = _get_converter()
         print("   Converting...")
         result = converter.convert(str(test_file))
         
@@ -0,0 +1,81 @@
+# tests/test_storage_manager.py
+# Unit tests for SupabaseStorageManager uploads (no network: the client is faked)
+
+import sys
+import os
+import io
+# Add rag_indexer to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'rag_indexer')))
+
+import pytest
+from storage import storage_manager as storage_module
+from storage.storage_manager import SupabaseStorageManager
+
+
+class FakeBucket:
+    """Records upload() calls the way the storage client receives them"""
+
+    def __init__(self):
+        self.uploads = []
+
+    def upload(self, path, file, file_options=None):
+        self.uploads.append({'path': path, 'file': file, 'file_options': file_options})
+        return {'Key': path}
+
+
+class FakeStorage:
+    def __init__(self):
+        self.bucket = FakeBucket()
+
+    def from_(self, bucket_name):
+        return self.bucket
+
+
+class FakeClient:
+    def __init__(self):
+        self.storage = FakeStorage()
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    """Storage manager wired to a fake Supabase client"""
+    client = FakeClient()
+    monkeypatch.setattr(storage_module, 'get_supabase_client', lambda url, key: client)
+    return SupabaseStorageManager(
+        supabase_url='http://localhost',
+        supabase_key='test-key',
+        bucket_name='test-bucket',
+        temp_dir=str(tmp_path / 'temp')
+    )
+
+
+class TestUploadDocument:
+    """Test upload_document with the supported file argument types"""
+
+    def test_upload_bytesio(self, manager):
+        """Test that a BytesIO is uploaded by content, not handed over as a path"""
+        result = manager.upload_document(io.BytesIO(b'%PDF-1.4 test'), 'report.pdf')
+
+        upload = manager.client.storage.bucket.uploads[0]
+        assert upload['file'] == b'%PDF-1.4 test'
+        assert upload['path'] == 'raw/pending/report.pdf'
+        assert result['file_size'] == len(b'%PDF-1.4 test')
+        assert result['content_type'] == 'application/pdf'
+
+    def test_upload_bytes(self, manager):
+        """Test that bytes are uploaded as given"""
+        result = manager.upload_document(b'hello', 'notes.txt')
+
+        assert manager.client.storage.bucket.uploads[0]['file'] == b'hello'
+        assert result['file_size'] == 5
+
+    def test_upload_open_file_is_streamed(self, manager, tmp_path):
+        """Test that an open file is passed through without reading it"""
+        path = tmp_path / 'scan.pdf'
+        path.write_bytes(b'0123456789')
+
+        with open(path, 'rb') as f:
+            result = manager.upload_document(f, 'scan.pdf')
+            assert manager.client.storage.bucket.uploads[0]['file'] is f
+
+        assert result['file_size'] == 10